@@ -1,171 +1,17 @@
 import os
+import click
 from flask import Flask
-from flasgger import Swagger
 from sqlalchemy import BigInteger
 from sqlalchemy.ext.compiler import compiles
 from app.config import config
 from app.extensions import db, jwt, cors
+from app.compression import register_compression
 from app.errors import register_error_handlers
-
-
-SWAGGER_TEMPLATE = {
-    "info": {
-        "title": "Compliance Tracker Lite API",
-        "description": "API for the Compliance Tracker — NIST SP 800-171 control assessment, "
-                       "POA&M management, evidence tracking, system boundary mapping, and SPRS scoring.",
-        "version": "1.0.0",
-    },
-    "securityDefinitions": {
-        "Bearer": {
-            "type": "apiKey",
-            "name": "Authorization",
-            "in": "header",
-            "description": "JWT token. Enter: **Bearer {your-jwt-token}**"
-        }
-    },
-    "security": [{"Bearer": []}],
-    "basePath": "/",
-    "schemes": ["http", "https"],
-    "definitions": {
-        "Error": {
-            "type": "object",
-            "properties": {
-                "message": {"type": "string"}
-            }
-        },
-        "Framework": {
-            "type": "object",
-            "properties": {
-                "id": {"type": "string"},
-                "name": {"type": "string"},
-                "version": {"type": "string"},
-                "description": {"type": "string"},
-                "total_controls": {"type": "integer"},
-                "total_objectives": {"type": "integer"},
-                "session_id": {"type": "string"}
-            }
-        },
-        "ControlFamily": {
-            "type": "object",
-            "properties": {
-                "id": {"type": "string"},
-                "framework_id": {"type": "string"},
-                "family_code": {"type": "string"},
-                "name": {"type": "string"},
-                "description": {"type": "string"},
-                "control_count": {"type": "integer"},
-                "sort_order": {"type": "integer"},
-                "session_id": {"type": "string"}
-            }
-        },
-        "Control": {
-            "type": "object",
-            "properties": {
-                "id": {"type": "string"},
-                "family_id": {"type": "string"},
-                "control_number": {"type": "string"},
-                "title": {"type": "string"},
-                "requirement_text": {"type": "string"},
-                "plain_english": {"type": "string"},
-                "guidance_text": {"type": "string"},
-                "control_type": {"type": "string"},
-                "implementation_status": {"type": "string", "enum": [
-                    "implemented", "partially_implemented", "planned",
-                    "not_implemented", "not_applicable", "not_assessed"
-                ]},
-                "weight": {"type": "integer"},
-                "sprs_points_if_not_met": {"type": "integer"},
-                "implementation_notes": {"type": "string"},
-                "assessor_notes": {"type": "string"},
-                "last_assessed_date": {"type": "string"},
-                "assessed_by": {"type": "string"},
-                "sort_order": {"type": "integer"},
-                "session_id": {"type": "string"}
-            }
-        },
-        "AssessmentObjective": {
-            "type": "object",
-            "properties": {
-                "id": {"type": "string"},
-                "control_id": {"type": "string"},
-                "objective_number": {"type": "string"},
-                "objective_text": {"type": "string"},
-                "status": {"type": "string", "enum": [
-                    "implemented", "partially_implemented", "planned",
-                    "not_implemented", "not_applicable", "not_assessed"
-                ]},
-                "notes": {"type": "string"},
-                "session_id": {"type": "string"}
-            }
-        },
-        "Evidence": {
-            "type": "object",
-            "properties": {
-                "id": {"type": "string"},
-                "control_id": {"type": "string"},
-                "evidence_type": {"type": "string"},
-                "title": {"type": "string"},
-                "description": {"type": "string"},
-                "file_path": {"type": "string"},
-                "external_url": {"type": "string"},
-                "uploaded_at": {"type": "string"},
-                "uploaded_by": {"type": "string"},
-                "session_id": {"type": "string"}
-            }
-        },
-        "POAMItem": {
-            "type": "object",
-            "properties": {
-                "id": {"type": "string"},
-                "control_id": {"type": "string"},
-                "weakness_description": {"type": "string"},
-                "remediation_plan": {"type": "string"},
-                "risk_level": {"type": "string", "enum": ["critical", "high", "moderate", "low"]},
-                "responsible_person": {"type": "string"},
-                "responsible_team": {"type": "string"},
-                "planned_start_date": {"type": "string"},
-                "planned_completion_date": {"type": "string"},
-                "actual_completion_date": {"type": "string"},
-                "estimated_cost": {"type": "number"},
-                "cost_notes": {"type": "string"},
-                "status": {"type": "string", "enum": ["open", "in_progress", "completed", "cancelled"]},
-                "milestones": {"type": "string"},
-                "created_at": {"type": "string"},
-                "updated_at": {"type": "string"},
-                "session_id": {"type": "string"}
-            }
-        },
-        "BoundaryAsset": {
-            "type": "object",
-            "properties": {
-                "id": {"type": "string"},
-                "boundary_name": {"type": "string"},
-                "asset_tracker_id": {"type": "string"},
-                "asset_name": {"type": "string"},
-                "asset_type": {"type": "string"},
-                "data_classification": {"type": "string"},
-                "in_scope": {"type": "integer"},
-                "notes": {"type": "string"},
-                "session_id": {"type": "string"}
-            }
-        }
-    }
-}
-
-SWAGGER_CONFIG = {
-    "headers": [],
-    "specs": [
-        {
-            "endpoint": "apispec",
-            "route": "/apispec.json",
-            "rule_filter": lambda rule: rule.rule.startswith('/api/'),
-            "model_filter": lambda tag: True,
-        }
-    ],
-    "static_url_path": "/flasgger_static",
-    "swagger_ui": True,
-    "specs_route": "/apidocs/"
-}
+from app.json_provider import init_json_provider
+from app.metrics import register_metrics
+from app.slow_queries import register_slow_query_log
+from app.openapi import register_openapi
+from app.profiling import register_profiling
 
 
 @compiles(BigInteger, 'sqlite')
@@ -173,24 +19,36 @@ def _render_bigint_as_int(type_, compiler, **kw):
     return 'INTEGER'
 
 
-def create_app(config_name=None):
+def create_app(config_name=None, **config_overrides):
     if config_name is None:
         config_name = os.getenv('FLASK_ENV', 'development')
 
     app = Flask(__name__)
     app.url_map.strict_slashes = False
     app.config.from_object(config[config_name])
+    app.config.update(config_overrides)
+    init_json_provider(app)
 
     db.init_app(app)
     cors.init_app(app, resources={r"/api/*": {"origins": "*"}})
     jwt.init_app(app)
 
-    Swagger(app, config=SWAGGER_CONFIG, template=SWAGGER_TEMPLATE)
+    from app.services.versioning import SessionVersions
+    SessionVersions.init_app(app)
+
+    from app.services.user_store import init_user_store
+    init_user_store(app)
+
+    register_compression(app)
+    register_metrics(app)
+    register_slow_query_log(app)
+    register_profiling(app)
 
     from app.api import register_blueprints
     register_blueprints(app)
 
     register_error_handlers(app)
+    register_openapi(app)
 
     @app.route('/api/health')
     def health_check():
@@ -246,9 +104,14 @@ def create_app(config_name=None):
 
 def register_cli(app):
     @app.cli.command('seed')
-    def seed_command():
-        from app.seed import seed
-        seed()
+    @click.option('--session-id', 'session_ids', multiple=True,
+                  help='Session to seed (repeatable; defaults to __default__).')
+    @click.option('--overwrite', is_flag=True, help='Reset existing seed rows to the seed values.')
+    def seed_command(session_ids, overwrite):
+        from app.seed import load_seed_data, seed
+        data = load_seed_data()
+        for session_id in session_ids or ('__default__',):
+            seed(session_id=session_id, data=data, overwrite=overwrite)
         print('Database seeded.')
 
     @app.cli.command('init-db')
@@ -256,6 +119,136 @@ def register_cli(app):
         db.create_all()
         print('Database initialized.')
 
+    @app.cli.command('sync-milestones')
+    def sync_milestones_command():
+        from app.models.poam import POAMItem
+        from app.services.milestone_tracker import MilestoneTracker
+        count = 0
+        for item in POAMItem.query.all():
+            MilestoneTracker.sync(item)
+            count += 1
+        db.session.commit()
+        print(f'Milestones synced for {count} POA&M items.')
+
+    @app.cli.command('build-openapi')
+    def build_openapi_command():
+        from app.openapi import build_spec_file
+        path = build_spec_file(app)
+        print(f'OpenAPI spec written to {path}.')
+
+    @app.cli.command('hash-password')
+    @click.argument('password')
+    def hash_password_command(password):
+        from werkzeug.security import generate_password_hash
+        print(generate_password_hash(password))
+
+    @app.cli.command('create-user')
+    @click.argument('username')
+    @click.option('--role', default='Analyst')
+    @click.option('--name', default=None)
+    @click.option('--email', default=None)
+    @click.password_option()
+    def create_user_command(username, role, name, email, password):
+        import uuid
+        from sqlalchemy.exc import IntegrityError
+        from werkzeug.security import generate_password_hash
+        from app.models.user import User
+        db.session.add(User(
+            id=str(uuid.uuid4()),
+            username=username,
+            password_hash=generate_password_hash(password),
+            role=role,
+            name=name or username,
+            email=email,
+        ))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            raise click.ClickException(f'User {username} already exists.')
+        print(f'User {username} created.')
+
+    @app.cli.command('build-snapshot')
+    @click.option('--output', default=None, help='Snapshot path (defaults to SEED_SNAPSHOT_PATH).')
+    def build_snapshot_command(output):
+        from app.snapshot import build_snapshot, snapshot_path
+        path = build_snapshot(output or snapshot_path(app))
+        print(f'Seed snapshot written to {path}.')
+
+    @app.cli.command('restore-snapshot')
+    @click.option('--snapshot', default=None, help='Snapshot path (defaults to SEED_SNAPSHOT_PATH).')
+    @click.option('--force', is_flag=True, help='Overwrite an existing database.')
+    def restore_snapshot_command(snapshot, force):
+        from app.snapshot import restore_snapshot, sqlite_database_path
+        try:
+            target = restore_snapshot(app, snapshot=snapshot, force=force)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        if target is None and sqlite_database_path(app) is None:
+            print('Database is not a SQLite file; snapshot not restored.')
+        elif target is None:
+            print('Database already exists; snapshot not restored.')
+        else:
+            print(f'Database restored from snapshot to {target}.')
+
+    @app.cli.command('migrate-catalog')
+    def migrate_catalog_command():
+        from app.catalog_migration import migrate_catalog
+        try:
+            counts = migrate_catalog()
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        if counts is None:
+            print('Database already uses the shared control catalog.')
+        else:
+            print(f'Moved {counts[0]} family and {counts[1]} control definitions into the catalog.')
+
+    @app.cli.command('import-framework')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--session-id', 'session_ids', multiple=True,
+                  help='Session to add the framework to (repeatable; by default it is only added to the catalog).')
+    @click.option('--name', default=None, help='Framework name (defaults to the catalog title).')
+    @click.option('--version', default=None, help='Framework version (defaults to the catalog version).')
+    def import_framework_command(path, session_ids, name, version):
+        from app.oscal_import import import_catalog
+        try:
+            result = import_catalog(path, session_ids, name=name, version=version)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        print(f"Imported {result['name']} {result['version'] or ''}: {result['families']} families, "
+              f"{result['controls']} controls, {result['objectives']} objectives.")
+        if not session_ids:
+            print('Added to the catalog only; pass --session-id to assess it in a session.')
+
+    @app.cli.command('export-oscal')
+    @click.argument('model', type=click.Choice(('ssp', 'assessment-results')))
+    @click.argument('output', type=click.File('wb'))
+    @click.option('--session-id', default='__default__', help='Session to export.')
+    @click.option('--framework-id', default=None,
+                  help='Framework to export (required when the session has more than one).')
+    def export_oscal_command(model, output, session_id, framework_id):
+        from app.oscal_export import export_oscal
+        try:
+            size = export_oscal(output, model, session_id=session_id, framework_id=framework_id)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        # stderr, so that OUTPUT may be '-'.
+        click.echo(f'Wrote {size} bytes of OSCAL {model}.', err=True)
+
+    @app.cli.command('import-crosswalk')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    def import_crosswalk_command(path):
+        import json
+        from app.services.crosswalk import Crosswalk
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        try:
+            count = Crosswalk.load(data)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        db.session.commit()
+        print(f"Imported {count} mappings from {data['source']['name']} to {data['target']['name']}.")
+
     @app.cli.command('reset-db')
     def reset_db_command():
         db.drop_all()
@@ -0,0 +1,131 @@
+from flask import Blueprint, jsonify, send_from_directory
+from app.api.auth import admin_required
+from app.profiling import list_profiles, profile_dir
+from app.slow_queries import slow_query_log
+
+admin_bp = Blueprint('admin', __name__)
+
+
+@admin_bp.route('/slow-queries', methods=['GET'])
+@admin_required
+def list_slow_queries():
+    """Recent slow SQL statements captured by this worker, newest first.
+    ---
+    tags:
+      - System
+    responses:
+      200:
+        description: Slow-query log entries
+        schema:
+          type: object
+          properties:
+            threshold_ms:
+              type: number
+            entries:
+              type: array
+              items:
+                type: object
+                properties:
+                  timestamp:
+                    type: string
+                  duration_ms:
+                    type: number
+                  statement:
+                    type: string
+                  parameters:
+                    description: Parameter types only; values are never recorded
+                  executemany:
+                    type: boolean
+                  endpoint:
+                    type: string
+                  method:
+                    type: string
+                  path:
+                    type: string
+                  plan:
+                    description: EXPLAIN output (SQLite query plan rows or PostgreSQL JSON plan)
+      403:
+        description: Admin role required
+        schema:
+          $ref: '#/definitions/Error'
+    """
+    return jsonify({
+        'threshold_ms': slow_query_log.threshold_ms,
+        'entries': slow_query_log.entries(),
+    })
+
+
+@admin_bp.route('/slow-queries', methods=['DELETE'])
+@admin_required
+def clear_slow_queries():
+    """Clear this worker's slow-query ring buffer.
+    ---
+    tags:
+      - System
+    responses:
+      204:
+        description: Buffer cleared
+      403:
+        description: Admin role required
+        schema:
+          $ref: '#/definitions/Error'
+    """
+    slow_query_log.clear()
+    return '', 204
+
+
+@admin_bp.route('/profiles', methods=['GET'])
+@admin_required
+def get_profiles():
+    """Stored request profiles (captured with ``?__profile=1`` or ``?__profile=sample``).
+    ---
+    tags:
+      - System
+    responses:
+      200:
+        description: Stored profiles, newest first
+        schema:
+          type: array
+          items:
+            type: object
+            properties:
+              id:
+                type: string
+                example: 20260220T120000-api-dashboard-1a2b3c4d.pstats
+              size:
+                type: integer
+              created_at:
+                type: string
+      403:
+        description: Admin role required
+        schema:
+          $ref: '#/definitions/Error'
+    """
+    return jsonify(list_profiles())
+
+
+@admin_bp.route('/profiles/<profile_id>', methods=['GET'])
+@admin_required
+def download_profile(profile_id):
+    """Download one stored profile (pstats binary or speedscope JSON).
+    ---
+    tags:
+      - System
+    parameters:
+      - name: profile_id
+        in: path
+        type: string
+        required: true
+    responses:
+      200:
+        description: Profile file
+      403:
+        description: Admin role required
+        schema:
+          $ref: '#/definitions/Error'
+      404:
+        description: Profile not found
+        schema:
+          $ref: '#/definitions/Error'
+    """
+    return send_from_directory(profile_dir(), profile_id, as_attachment=True)
@@ -1,28 +1,24 @@
+from functools import wraps
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from werkzeug.security import check_password_hash, generate_password_hash
+from flask_jwt_extended import (
+    create_access_token, jwt_required, get_jwt, get_jwt_identity, verify_jwt_in_request,
+)
+from app.services.user_store import get_user_store
 
 auth_bp = Blueprint('auth', __name__)
 
-# Hardcoded demo users
-DEMO_USERS = {
-    'admin': {
-        'id': 'user-admin-001',
-        'username': 'admin',
-        'password': generate_password_hash('admin123'),
-        'role': 'Admin',
-        'name': 'Admin User',
-        'email': 'admin@compliance.local',
-    },
-    'analyst': {
-        'id': 'user-analyst-001',
-        'username': 'analyst',
-        'password': generate_password_hash('analyst123'),
-        'role': 'Analyst',
-        'name': 'Security Analyst',
-        'email': 'analyst@compliance.local',
-    },
-}
+ADMIN_ROLE = 'Admin'
+
+
+def admin_required(fn):
+    """Require a valid JWT whose ``role`` claim is ``Admin``."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        verify_jwt_in_request()
+        if get_jwt().get('role') != ADMIN_ROLE:
+            return jsonify({'message': 'Admin role required'}), 403
+        return fn(*args, **kwargs)
+    return wrapper
 
 
 @auth_bp.route('/login', methods=['POST'])
@@ -89,8 +85,8 @@ def login():
     username = data.get('username', '').strip()
     password = data.get('password', '')
 
-    user = DEMO_USERS.get(username)
-    if not user or not check_password_hash(user['password'], password):
+    user = get_user_store().authenticate(username, password)
+    if not user:
         return jsonify({'message': 'Invalid username or password'}), 401
 
     access_token = create_access_token(
@@ -144,14 +140,14 @@ def me():
     """
     current_user_id = get_jwt_identity()
 
-    for user in DEMO_USERS.values():
-        if user['id'] == current_user_id:
-            return jsonify({
-                'id': user['id'],
-                'username': user['username'],
-                'role': user['role'],
-                'name': user['name'],
-                'email': user['email'],
-            })
+    user = get_user_store().get_by_id(current_user_id)
+    if user:
+        return jsonify({
+            'id': user['id'],
+            'username': user['username'],
+            'role': user['role'],
+            'name': user['name'],
+            'email': user['email'],
+        })
 
     return jsonify({'message': 'User not found'}), 404
@@ -1,5 +1,8 @@
 import uuid
 from flask import Blueprint, jsonify, request
+from app.api.conditional import conditional
+from app.api.fields import parse_fields
+from app.api.rows import columns, fetch_dicts
 from app.extensions import db
 from app.models.boundary_asset import BoundaryAsset
 
@@ -7,6 +10,7 @@ boundary_bp = Blueprint('boundary', __name__)
 
 
 @boundary_bp.route('', methods=['GET'])
+@conditional('boundary_assets')
 def list_boundary_assets():
     """List all system boundary assets.
     ---
@@ -19,6 +23,11 @@ def list_boundary_assets():
         required: false
         default: __default__
         description: Session ID for demo isolation
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma-separated fields to return (e.g. asset_name,asset_type,in_scope); id is always included"
     responses:
       200:
         description: List of boundary assets
@@ -26,10 +35,14 @@ def list_boundary_assets():
           type: array
           items:
             $ref: '#/definitions/BoundaryAsset'
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
-    assets = BoundaryAsset.query.filter_by(session_id=session_id).all()
-    return jsonify([a.to_dict() for a in assets])
+    fields = parse_fields(BoundaryAsset)
+    return jsonify(fetch_dicts(db.select(*columns(BoundaryAsset, fields)).where(
+        BoundaryAsset.session_id == session_id
+    )))
 
 
 @boundary_bp.route('', methods=['POST'])
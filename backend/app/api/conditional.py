@@ -0,0 +1,95 @@
+import hashlib
+from functools import wraps
+from flask import make_response, request
+from app.compression import CompressedPayload
+from app.services.cache import VersionedCache
+from app.services.versioning import SessionVersions
+
+# Rendered (and lazily compressed) bodies of ``conditional(..., cache=True)``
+# views, keyed by session and request path.
+payload_cache = VersionedCache(max_entries=64)
+
+
+def session_validators(session_id, tables, shared=()):
+    """Return ``(token, etag, last_modified)`` for a session's view of ``tables``.
+
+    ``shared`` names tables every session reads, whose counters are kept
+    under ``SessionVersions.GLOBAL``.
+    """
+    versions = SessionVersions.get(session_id, tables)
+    token = SessionVersions.token(session_id, tables, versions=versions)
+    if shared:
+        shared_versions = SessionVersions.get(SessionVersions.GLOBAL, shared)
+        token += '|' + SessionVersions.token(SessionVersions.GLOBAL, shared, versions=shared_versions)
+        versions = {**versions, **{f'{SessionVersions.GLOBAL}.{t}': v for t, v in shared_versions.items()}}
+    etag = hashlib.sha1(f'{session_id}|{request.full_path}|{token}'.encode()).hexdigest()
+    last_modified = SessionVersions.last_modified(versions)
+    if last_modified is not None:
+        last_modified = last_modified.astimezone().replace(microsecond=0)
+    return token, etag, last_modified
+
+
+def _not_modified(etag, last_modified):
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def _set_validators(response, etag, last_modified):
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Always revalidate; without this browsers may apply heuristic freshness
+    # to Last-Modified and serve stale data after a write.
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+
+
+def _render(view, args, kwargs, key, token):
+    payload = payload_cache.get(key, token)
+    if payload is None:
+        response = make_response(view(*args, **kwargs))
+        if response.status_code != 200 or response.is_streamed:
+            return response
+        payload = CompressedPayload(response.get_data(), response.mimetype)
+        payload_cache.set(key, token, payload)
+    return payload.response()
+
+
+def conditional(*tables, cache=False, shared=()):
+    """Answer conditional GETs with 304 before the view runs any queries.
+
+    ETag and Last-Modified are derived from the session's write counters for
+    ``tables`` and the global counters for ``shared`` tables (see
+    ``SessionVersions``), so they change exactly when one of the tables the
+    view reads from is written. ``If-None-Match`` takes precedence over
+    ``If-Modified-Since``.
+
+    With ``cache=True`` the rendered 200 body is also kept in
+    ``payload_cache`` under the same token, so a full GET after another
+    client's request is served without running the view, and each
+    compressed variant is built once per version.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            session_id = request.args.get('session_id', '__default__')
+            token, etag, last_modified = session_validators(session_id, tables, shared)
+
+            if _not_modified(etag, last_modified):
+                response = make_response('', 304)
+                _set_validators(response, etag, last_modified)
+                return response
+
+            if cache:
+                key = (session_id, request.full_path)
+                response = _render(view, args, kwargs, key, token)
+            else:
+                response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                _set_validators(response, etag, last_modified)
+            return response
+        return wrapper
+    return decorator
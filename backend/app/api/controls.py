@@ -1,17 +1,27 @@
 import uuid
 from datetime import datetime
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request, stream_with_context
+from sqlalchemy.orm import joinedload, selectinload
+from app.api.conditional import conditional
+from app.compression import compress_stream, stream_encoding
+from app.api.fields import parse_fields, wants
+from app.api.rows import columns, fetch_dicts, split_row
 from app.extensions import db
 from app.models.control import Control
+from app.models.control_definition import ControlDefinition
 from app.models.control_family import ControlFamily
 from app.models.assessment_objective import AssessmentObjective
 from app.models.evidence import Evidence
 from app.models.poam import POAMItem
+from app.oscal_export import MODELS as OSCAL_MODELS, document as oscal_document, iter_document, session_framework
+from app.services.catalog import FrameworkCatalog
+from app.services.objective_rollup import ObjectiveRollup
 
 controls_bp = Blueprint('controls', __name__)
 
 
 @controls_bp.route('', methods=['GET'])
+@conditional('control_assessments', 'control_families')
 def list_controls():
     """List controls with optional filters and pagination.
     ---
@@ -55,6 +65,11 @@ def list_controls():
         type: integer
         required: false
         default: 50
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma-separated fields to return (e.g. control_number,title,implementation_status); id is always included"
     responses:
       200:
         description: Paginated list of controls
@@ -78,6 +93,8 @@ def list_controls():
               type: integer
             per_page:
               type: integer
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
     family_id = request.args.get('family_id')
@@ -86,43 +103,47 @@ def list_controls():
     search = request.args.get('search', '').strip()
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 50, type=int)
+    fields = parse_fields(
+        Control, derived=('family_code', 'family_name', *Control.CATALOG_FIELDS), hidden=('definition_id',),
+    )
 
-    query = Control.query.filter_by(session_id=session_id)
+    conditions = [Control.session_id == session_id]
 
     if family_id:
-        query = query.filter_by(family_id=family_id)
+        conditions.append(Control.family_id == family_id)
     if implementation_status:
-        query = query.filter_by(implementation_status=implementation_status)
+        conditions.append(Control.implementation_status == implementation_status)
     if control_type:
-        query = query.filter_by(control_type=control_type)
+        conditions.append(Control.definition_id.in_(
+            db.select(ControlDefinition.id).where(ControlDefinition.control_type == control_type)
+        ))
     if search:
         search_pattern = f'%{search}%'
-        query = query.filter(
+        conditions.append(
             db.or_(
                 Control.control_number.ilike(search_pattern),
-                Control.title.ilike(search_pattern),
-                Control.requirement_text.ilike(search_pattern),
+                Control.definition_id.in_(db.select(ControlDefinition.id).where(db.or_(
+                    ControlDefinition.title.ilike(search_pattern),
+                    ControlDefinition.requirement_text.ilike(search_pattern),
+                ))),
             )
         )
 
-    query = query.order_by(Control.sort_order)
-    total = query.count()
-    controls = query.offset((page - 1) * per_page).limit(per_page).all()
+    total = db.session.query(db.func.count(Control.id)).filter(*conditions).scalar()
 
+    # Control text comes from the framework catalog, not the session's rows.
+    stmt = db.select(
+        *columns(Control, fields, exclude=('definition_id',)), *FrameworkCatalog.control_columns(),
+    ).select_from(Control).where(*conditions)
     # Enrich with family info
-    family_ids = set(c.family_id for c in controls)
-    families = {f.id: f for f in ControlFamily.query.filter(
-        ControlFamily.id.in_(family_ids)
-    ).all()} if family_ids else {}
-
-    results = []
-    for c in controls:
-        d = c.to_dict()
-        fam = families.get(c.family_id)
-        if fam:
-            d['family_code'] = fam.family_code
-            d['family_name'] = fam.name
-        results.append(d)
+    if wants(fields, 'family_code', 'family_name'):
+        stmt = stmt.outerjoin(ControlFamily, ControlFamily.id == Control.family_id)
+        if wants(fields, 'family_code'):
+            stmt = stmt.add_columns(ControlFamily.family_code)
+        if wants(fields, 'family_name'):
+            stmt = stmt.add_columns(ControlFamily.name.label('family_name'))
+    stmt = stmt.order_by(Control.sort_order).offset((page - 1) * per_page).limit(per_page)
+    results = FrameworkCatalog.fill_controls(fetch_dicts(stmt), fields)
 
     return jsonify({
         'controls': results,
@@ -133,6 +154,7 @@ def list_controls():
 
 
 @controls_bp.route('/<control_id>', methods=['GET'])
+@conditional('control_assessments', 'control_families', 'assessment_objectives', 'evidence', 'poam_items')
 def get_control(control_id):
     """Get a single control with objectives, evidence, and POA&M items.
     ---
@@ -174,13 +196,22 @@ def get_control(control_id):
                   type: array
                   items:
                     $ref: '#/definitions/POAMItem'
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
       404:
         description: Control not found
         schema:
           $ref: '#/definitions/Error'
     """
     session_id = request.args.get('session_id', '__default__')
-    control = Control.query.filter_by(
+    # Family and objectives are joined into the control query; evidence and
+    # POA&M items are fetched with one IN query each.
+    control = Control.query.options(
+        joinedload(Control.family),
+        joinedload(Control.objectives),
+        selectinload(Control.evidence_items),
+        selectinload(Control.poam_items),
+    ).filter_by(
         id=control_id, session_id=session_id
     ).first()
 
@@ -189,29 +220,14 @@ def get_control(control_id):
 
     result = control.to_dict()
 
-    # Get family info
-    family = ControlFamily.query.get(control.family_id)
+    family = control.family
     if family:
         result['family_code'] = family.family_code
         result['family_name'] = family.name
 
-    # Get objectives
-    objectives = AssessmentObjective.query.filter_by(
-        control_id=control_id, session_id=session_id
-    ).all()
-    result['objectives'] = [o.to_dict() for o in objectives]
-
-    # Get evidence
-    evidence = Evidence.query.filter_by(
-        control_id=control_id, session_id=session_id
-    ).all()
-    result['evidence'] = [e.to_dict() for e in evidence]
-
-    # Get POA&M items
-    poam = POAMItem.query.filter_by(
-        control_id=control_id, session_id=session_id
-    ).all()
-    result['poam_items'] = [p.to_dict() for p in poam]
+    result['objectives'] = [o.to_dict() for o in control.objectives]
+    result['evidence'] = [e.to_dict() for e in control.evidence_items]
+    result['poam_items'] = [p.to_dict() for p in control.poam_items]
 
     return jsonify(result)
 
@@ -371,7 +387,214 @@ def update_control_status(control_id):
     return jsonify(control.to_dict())
 
 
+def _apply_objective_updates(updates, session_id, assessed_by=None):
+    """Validate and apply ``[{'id', 'status', 'notes'}]`` updates, then roll up.
+
+    Returns ``(objectives, controls, error_response)``; nothing is committed
+    when an error response is returned.
+    """
+    errors = []
+    for i, item in enumerate(updates):
+        if not isinstance(item, dict) or not item.get('id'):
+            errors.append({'row': i + 1, 'message': 'id is required'})
+        elif 'status' in item and item['status'] not in ObjectiveRollup.STATUSES:
+            errors.append({
+                'row': i + 1,
+                'message': f'Invalid status. Must be one of: {list(ObjectiveRollup.STATUSES)}',
+            })
+    if errors:
+        return None, None, (jsonify({'message': 'Invalid objective updates', 'errors': errors}), 400)
+
+    ids = [item['id'] for item in updates]
+    objectives = {o.id: o for o in AssessmentObjective.query.filter(
+        AssessmentObjective.session_id == session_id,
+        AssessmentObjective.id.in_(ids),
+    ).all()}
+    missing = [i for i in ids if i not in objectives]
+    if missing:
+        return None, None, (jsonify({'message': 'Objective not found', 'missing': missing}), 404)
+
+    touched = set()
+    for item in updates:
+        objective = objectives[item['id']]
+        if 'status' in item:
+            objective.status = item['status']
+            touched.add(objective.control_id)
+        if 'notes' in item:
+            objective.notes = item['notes']
+
+    db.session.flush()
+    controls = ObjectiveRollup.recompute(touched, session_id=session_id, assessed_by=assessed_by)
+    return [objectives[i] for i in dict.fromkeys(ids)], controls, None
+
+
+@controls_bp.route('/objectives/<objective_id>', methods=['PUT'])
+def update_objective(objective_id):
+    """Update one assessment objective and roll its status up to the control.
+    ---
+    tags:
+      - Controls
+    parameters:
+      - name: objective_id
+        in: path
+        type: string
+        required: true
+        description: Assessment objective UUID
+      - name: session_id
+        in: query
+        type: string
+        required: false
+        default: __default__
+        description: Session ID for demo isolation
+      - name: body
+        in: body
+        required: true
+        schema:
+          type: object
+          properties:
+            status:
+              type: string
+              enum: [met, not_met, not_assessed, not_applicable, satisfied, other_than_satisfied]
+            notes:
+              type: string
+    responses:
+      200:
+        description: Updated objective with the parent control's recomputed status
+        schema:
+          allOf:
+            - $ref: '#/definitions/AssessmentObjective'
+            - type: object
+              properties:
+                control_implementation_status:
+                  type: string
+      400:
+        description: Missing or non-object body, or invalid status
+        schema:
+          $ref: '#/definitions/Error'
+      404:
+        description: Objective not found
+        schema:
+          $ref: '#/definitions/Error'
+    """
+    session_id = request.args.get('session_id', '__default__')
+    data = request.get_json()
+    if not data:
+        return jsonify({'message': 'Missing request body'}), 400
+    if not isinstance(data, dict):
+        return jsonify({'message': 'Expected a JSON object'}), 400
+
+    update = {k: data[k] for k in ('status', 'notes') if k in data}
+    objectives, controls, error = _apply_objective_updates(
+        [{'id': objective_id, **update}], session_id, data.get('assessed_by')
+    )
+    if error:
+        return error
+
+    # Serialize before commit so expired attributes are not reloaded row by row.
+    result = objectives[0].to_dict()
+    control = next((c for c in controls if c.id == objectives[0].control_id), None)
+    result['control_implementation_status'] = control.implementation_status if control else None
+    db.session.commit()
+    return jsonify(result)
+
+
+@controls_bp.route('/objectives', methods=['PUT'])
+def update_objectives():
+    """Update many assessment objectives in one transaction.
+    ---
+    tags:
+      - Controls
+    parameters:
+      - name: session_id
+        in: query
+        type: string
+        required: false
+        default: __default__
+        description: Session ID for demo isolation
+      - name: body
+        in: body
+        required: true
+        description: Either a JSON array of updates or an object with an ``objectives`` array
+        schema:
+          type: object
+          properties:
+            objectives:
+              type: array
+              items:
+                type: object
+                required:
+                  - id
+                properties:
+                  id:
+                    type: string
+                  status:
+                    type: string
+                    enum: [met, not_met, not_assessed, not_applicable, satisfied, other_than_satisfied]
+                  notes:
+                    type: string
+            assessed_by:
+              type: string
+    responses:
+      200:
+        description: Updated objectives and the recomputed status of each affected control
+        schema:
+          type: object
+          properties:
+            updated:
+              type: integer
+            objectives:
+              type: array
+              items:
+                $ref: '#/definitions/AssessmentObjective'
+            controls:
+              type: array
+              items:
+                type: object
+                properties:
+                  id:
+                    type: string
+                  control_number:
+                    type: string
+                  implementation_status:
+                    type: string
+      400:
+        description: Invalid input; no objectives were changed
+        schema:
+          $ref: '#/definitions/Error'
+      404:
+        description: One or more objectives not found; no objectives were changed
+        schema:
+          $ref: '#/definitions/Error'
+    """
+    session_id = request.args.get('session_id', '__default__')
+    data = request.get_json()
+    updates = data.get('objectives') if isinstance(data, dict) else data
+    if not updates or not isinstance(updates, list):
+        return jsonify({'message': 'Expected a JSON array of objective updates'}), 400
+
+    assessed_by = data.get('assessed_by') if isinstance(data, dict) else None
+    objectives, controls, error = _apply_objective_updates(updates, session_id, assessed_by)
+    if error:
+        return error
+
+    result = {
+        'updated': len(objectives),
+        'objectives': [o.to_dict() for o in objectives],
+        'controls': [
+            {
+                'id': c.id,
+                'control_number': c.control_number,
+                'implementation_status': c.implementation_status,
+            }
+            for c in controls
+        ],
+    }
+    db.session.commit()
+    return jsonify(result)
+
+
 @controls_bp.route('/families', methods=['GET'])
+@conditional('control_families', 'control_assessments')
 def list_families():
     """List all control families with status breakdown.
     ---
@@ -384,6 +607,12 @@ def list_families():
         required: false
         default: __default__
         description: Session ID for demo isolation
+      - name: include
+        in: query
+        type: string
+        required: false
+        enum: [controls]
+        description: Set to "controls" to embed each family's controls (ordered by sort_order)
     responses:
       200:
         description: List of control families with status counts
@@ -399,30 +628,84 @@ def list_families():
                   status_breakdown:
                     type: object
                     description: Map of implementation_status to count
+                  controls:
+                    type: array
+                    description: Only present with include=controls
+                    items:
+                      $ref: '#/definitions/Control'
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
-    families = ControlFamily.query.filter_by(
-        session_id=session_id
-    ).order_by(ControlFamily.sort_order).all()
-
-    results = []
-    for fam in families:
-        d = fam.to_dict()
-        # Get actual control count and status breakdown
-        controls = Control.query.filter_by(
-            family_id=fam.id, session_id=session_id
-        ).all()
-        d['actual_control_count'] = len(controls)
-        d['status_breakdown'] = {}
-        for c in controls:
-            s = c.implementation_status or 'not_assessed'
-            d['status_breakdown'][s] = d['status_breakdown'].get(s, 0) + 1
-        results.append(d)
-
-    return jsonify(results)
+    include = set(filter(None, request.args.get('include', '').split(',')))
+
+    if 'controls' in include:
+        # Families and their controls in one round trip; the breakdown is
+        # tallied from the joined rows.
+        rows = db.session.execute(
+            db.select(
+                *columns(ControlFamily, exclude=('definition_id',)),
+                *FrameworkCatalog.family_columns(),
+                *columns(Control, prefix='control__', exclude=('definition_id',)),
+                *FrameworkCatalog.control_columns(prefix='control__'),
+            ).select_from(ControlFamily).outerjoin(
+                Control, db.and_(
+                    Control.family_id == ControlFamily.id,
+                    Control.session_id == session_id,
+                )
+            ).where(
+                ControlFamily.session_id == session_id
+            ).order_by(ControlFamily.sort_order, Control.sort_order)
+        ).mappings()
+
+        results = []
+        by_family = {}
+        for row in rows:
+            d = by_family.get(row['id'])
+            if d is None:
+                d = split_row(row, ControlFamily, '', extra=('catalog_definition_id',))
+                d['actual_control_count'] = 0
+                d['status_breakdown'] = {}
+                d['controls'] = []
+                by_family[d['id']] = d
+                results.append(d)
+            control = split_row(row, Control, 'control__', extra=('catalog_definition_id',))
+            if control is not None:
+                s = control['implementation_status'] or 'not_assessed'
+                d['actual_control_count'] += 1
+                d['status_breakdown'][s] = d['status_breakdown'].get(s, 0) + 1
+                d['controls'].append(control)
+
+        FrameworkCatalog.fill_families(results)
+        FrameworkCatalog.fill_controls(c for d in results for c in d['controls'])
+        return jsonify(results)
+
+    families = FrameworkCatalog.fill_families(fetch_dicts(db.select(
+        *columns(ControlFamily, exclude=('definition_id',)), *FrameworkCatalog.family_columns(),
+    ).where(
+        ControlFamily.session_id == session_id
+    ).order_by(ControlFamily.sort_order)))
+
+    status = db.func.coalesce(Control.implementation_status, 'not_assessed')
+    counts = db.session.query(
+        Control.family_id, status, db.func.count(Control.id)
+    ).filter(
+        Control.session_id == session_id
+    ).group_by(Control.family_id, status).all()
+
+    breakdowns = {}
+    for family_id, s, count in counts:
+        breakdowns.setdefault(family_id, {})[s] = count
+
+    for d in families:
+        d['status_breakdown'] = breakdowns.get(d['id'], {})
+        d['actual_control_count'] = sum(d['status_breakdown'].values())
+
+    return jsonify(families)
 
 
 @controls_bp.route('/export', methods=['GET'])
+@conditional('control_assessments', 'control_families', 'assessment_objectives', cache=True)
 def export_controls():
     """Export all controls with objectives for reporting.
     ---
@@ -460,36 +743,105 @@ def export_controls():
               type: integer
             exported_at:
               type: string
-              description: ISO timestamp of export
+              description: ISO timestamp at which this version of the export was built
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
-    controls = Control.query.filter_by(
-        session_id=session_id
-    ).order_by(Control.sort_order).all()
-
-    family_ids = set(c.family_id for c in controls)
-    families = {f.id: f for f in ControlFamily.query.filter(
-        ControlFamily.id.in_(family_ids)
-    ).all()} if family_ids else {}
-
-    results = []
-    for c in controls:
-        d = c.to_dict()
-        fam = families.get(c.family_id)
-        if fam:
-            d['family_code'] = fam.family_code
-            d['family_name'] = fam.name
-
-        # Include objectives
-        objectives = AssessmentObjective.query.filter_by(
-            control_id=c.id, session_id=session_id
-        ).all()
-        d['objectives'] = [o.to_dict() for o in objectives]
-
-        results.append(d)
+    results = FrameworkCatalog.fill_controls(fetch_dicts(
+        db.select(
+            *columns(Control, exclude=('definition_id',)),
+            ControlFamily.family_code,
+            ControlFamily.name.label('family_name'),
+            *FrameworkCatalog.control_columns(),
+        ).select_from(Control).outerjoin(
+            ControlFamily, ControlFamily.id == Control.family_id
+        ).where(
+            Control.session_id == session_id
+        ).order_by(Control.sort_order)
+    ))
+
+    # Include objectives: one query for the whole session, grouped here.
+    objectives = {}
+    for o in fetch_dicts(db.select(*columns(AssessmentObjective)).where(
+        AssessmentObjective.session_id == session_id
+    )):
+        objectives.setdefault(o['control_id'], []).append(o)
+    for d in results:
+        d['objectives'] = objectives.get(d['id'], [])
 
     return jsonify({
         'controls': results,
         'total': len(results),
         'exported_at': datetime.now().isoformat(),
     })
+
+
+@controls_bp.route('/export/oscal/<model>', methods=['GET'])
+@conditional(
+    'frameworks', 'control_assessments', 'assessment_objectives', 'evidence',
+    'poam_items', 'poam_milestones', 'boundary_assets',
+)
+def export_oscal(model):
+    """Stream an OSCAL System Security Plan or Assessment Results document.
+    ---
+    tags:
+      - Controls
+    produces:
+      - application/json
+    parameters:
+      - name: model
+        in: path
+        type: string
+        required: true
+        enum: [ssp, assessment-results]
+        description: OSCAL model to export
+      - name: session_id
+        in: query
+        type: string
+        required: false
+        default: __default__
+        description: Session ID for demo isolation
+      - name: framework_id
+        in: query
+        type: string
+        required: false
+        description: Framework to export; required when the session has more than one
+    responses:
+      200:
+        description: >
+          OSCAL 1.1.2 JSON, sent with chunked transfer encoding as it is read
+          from the database (gzip/brotli encoded when accepted)
+        schema:
+          type: object
+      400:
+        description: Session has more than one framework and no framework_id was given
+        schema:
+          $ref: '#/definitions/Error'
+      404:
+        description: Unknown model or framework not found
+        schema:
+          $ref: '#/definitions/Error'
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
+    """
+    session_id = request.args.get('session_id', '__default__')
+    if model not in OSCAL_MODELS:
+        return jsonify({'message': f'Unknown OSCAL model. Must be one of: {list(OSCAL_MODELS)}'}), 404
+    try:
+        framework = session_framework(session_id, request.args.get('framework_id'))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    if framework is None:
+        return jsonify({'message': 'Framework not found'}), 404
+
+    chunks = iter_document(oscal_document(model, session_id, framework))
+    encoding = stream_encoding()
+    if encoding is not None:
+        chunks = compress_stream(chunks, encoding)
+    response = current_app.response_class(stream_with_context(chunks), mimetype='application/json')
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.headers['Content-Disposition'] = f'attachment; filename={model}.json'
+    return response
@@ -0,0 +1,125 @@
+from flask import Blueprint, jsonify, request
+from app.api.conditional import conditional
+from app.services.crosswalk import Crosswalk
+
+crosswalk_bp = Blueprint('crosswalk', __name__)
+
+
+@crosswalk_bp.route('', methods=['GET'])
+def list_crosswalks():
+    """List the framework pairs that have control mappings.
+    ---
+    tags:
+      - Crosswalk
+    responses:
+      200:
+        description: Framework pairs with their mapping counts
+        schema:
+          type: array
+          items:
+            type: object
+            properties:
+              source:
+                type: object
+                properties:
+                  name:
+                    type: string
+                  version:
+                    type: string
+              target:
+                type: object
+                properties:
+                  name:
+                    type: string
+                  version:
+                    type: string
+              mappings:
+                type: integer
+              hops:
+                type: integer
+                description: 1 for direct mappings, more when composed through another framework
+    """
+    return jsonify(Crosswalk.pairs())
+
+
+@crosswalk_bp.route('/projection', methods=['GET'])
+@conditional('control_assessments', 'evidence', shared=('control_mappings',))
+def get_projection():
+    """Project the session's control statuses and evidence onto another framework.
+    ---
+    tags:
+      - Crosswalk
+    parameters:
+      - name: session_id
+        in: query
+        type: string
+        required: false
+        default: __default__
+        description: Session ID for demo isolation
+      - name: framework
+        in: query
+        type: string
+        required: true
+        description: Target framework name (e.g. CMMC Level 2)
+      - name: version
+        in: query
+        type: string
+        required: false
+        description: Target framework version (e.g. 2.0); may be omitted when the catalog has only one
+    responses:
+      200:
+        description: Every target control with its projected status and the assessed controls mapped onto it
+        schema:
+          type: object
+          properties:
+            framework:
+              type: object
+            session_id:
+              type: string
+            total_controls:
+              type: integer
+            mapped_controls:
+              type: integer
+            status_breakdown:
+              type: object
+            controls:
+              type: array
+              items:
+                type: object
+                properties:
+                  family_code:
+                    type: string
+                  control_number:
+                    type: string
+                  title:
+                    type: string
+                  weight:
+                    type: integer
+                  projected_status:
+                    type: string
+                  evidence_count:
+                    type: integer
+                  sources:
+                    type: array
+                    items:
+                      type: object
+      400:
+        description: Missing framework parameter
+        schema:
+          $ref: '#/definitions/Error'
+      404:
+        description: Framework not in the catalog
+        schema:
+          $ref: '#/definitions/Error'
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
+    """
+    session_id = request.args.get('session_id', '__default__')
+    framework = request.args.get('framework')
+    if not framework:
+        return jsonify({'message': 'framework is required'}), 400
+
+    projection = Crosswalk.project(session_id, framework, request.args.get('version'))
+    if projection is None:
+        return jsonify({'message': 'Framework not found'}), 404
+    return jsonify(projection)
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify, request
+from app.api.conditional import conditional
 from app.extensions import db
 from app.models.control import Control
 from app.models.control_family import ControlFamily
@@ -35,6 +36,7 @@ RISK_COLORS = {
 
 
 @dashboard_bp.route('', methods=['GET'])
+@conditional('control_assessments', 'control_families', 'poam_items', 'boundary_assets', cache=True)
 def get_dashboard():
     """Get compliance dashboard with SPRS score, control breakdown, POA&M summary, and boundary count.
     ---
@@ -121,6 +123,8 @@ def get_dashboard():
                     type: string
                   value:
                     type: integer
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
 
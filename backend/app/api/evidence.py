@@ -1,14 +1,19 @@
 import uuid
 from datetime import datetime
 from flask import Blueprint, jsonify, request
+from app.api.conditional import conditional
+from app.api.fields import parse_fields, wants
+from app.api.rows import columns, fetch_dicts
 from app.extensions import db
 from app.models.evidence import Evidence
 from app.models.control import Control
+from app.models.control_definition import ControlDefinition
 
 evidence_bp = Blueprint('evidence', __name__)
 
 
 @evidence_bp.route('', methods=['GET'])
+@conditional('evidence', 'control_assessments')
 def list_evidence():
     """List all evidence items with optional control filter.
     ---
@@ -26,6 +31,11 @@ def list_evidence():
         type: string
         required: false
         description: Filter by control UUID
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma-separated fields to return (e.g. title,evidence_type,control_number); id is always included"
     responses:
       200:
         description: List of evidence items enriched with control info
@@ -40,27 +50,31 @@ def list_evidence():
                     type: string
                   control_title:
                     type: string
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
     control_id = request.args.get('control_id')
+    fields = parse_fields(Evidence, derived=('control_number', 'control_title'))
 
-    query = Evidence.query.filter_by(session_id=session_id)
+    stmt = db.select(*columns(Evidence, fields)).select_from(Evidence).where(
+        Evidence.session_id == session_id
+    )
 
     if control_id:
-        query = query.filter_by(control_id=control_id)
-
-    evidence_items = query.order_by(Evidence.uploaded_at.desc()).all()
-
-    results = []
-    for e in evidence_items:
-        d = e.to_dict()
-        # Include control info
-        control = Control.query.get(e.control_id)
-        if control:
-            d['control_number'] = control.control_number
-            d['control_title'] = control.title
-        results.append(d)
-
+        stmt = stmt.where(Evidence.control_id == control_id)
+
+    # Include control info
+    if wants(fields, 'control_number', 'control_title'):
+        stmt = stmt.outerjoin(Control, Control.id == Evidence.control_id)
+        if wants(fields, 'control_number'):
+            stmt = stmt.add_columns(Control.control_number)
+        if wants(fields, 'control_title'):
+            stmt = stmt.outerjoin(
+                ControlDefinition, ControlDefinition.id == Control.definition_id
+            ).add_columns(ControlDefinition.title.label('control_title'))
+
+    results = fetch_dicts(stmt.order_by(Evidence.uploaded_at.desc()))
     return jsonify(results)
 
 
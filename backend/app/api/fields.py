@@ -0,0 +1,41 @@
+"""
+Sparse fieldsets for list endpoints.
+
+``?fields=control_number,title,implementation_status`` limits both the SQL
+projection and the serialized keys to the named fields; ``id`` is always
+included. Without ``fields`` the full ``to_dict()`` shape is returned.
+"""
+from flask import request
+from app.api.rows import column_keys
+from app.errors import BadRequestError
+
+
+def parse_fields(model, derived=(), hidden=()):
+    """Return the requested field names (``id`` first), or None for all fields.
+
+    ``derived`` names keys a view adds on top of the model's columns (e.g.
+    ``family_code``); ``hidden`` names columns that are never returned.
+    Unknown names raise ``BadRequestError``.
+    """
+    raw = request.args.get('fields', '').strip()
+    if not raw:
+        return None
+
+    allowed = [key for key in column_keys(model) if key not in hidden] + list(derived)
+    fields = ['id']
+    for name in (part.strip() for part in raw.split(',')):
+        if name and name not in fields:
+            fields.append(name)
+
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise BadRequestError(
+            f"Unknown field(s): {', '.join(unknown)}",
+            payload={'allowed_fields': allowed},
+        )
+    return fields
+
+
+def wants(fields, *names):
+    """True when any of ``names`` should appear in the output."""
+    return fields is None or any(name in fields for name in names)
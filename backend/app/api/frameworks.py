@@ -1,11 +1,40 @@
 from flask import Blueprint, jsonify, request
+from app.api.conditional import conditional
+from app.api.rows import fetch_dicts
+from app.extensions import db
 from app.models.framework import Framework
 from app.models.control_family import ControlFamily
+from app.services.catalog import FrameworkCatalog
 
 frameworks_bp = Blueprint('frameworks', __name__)
 
 
+# Family fields the session row also carries, used when the catalog lacks the family.
+FAMILY_ROW_FIELDS = ('name', 'control_count', 'sort_order')
+
+
+def _framework_fields(framework, definition=None):
+    """Catalog fields of a framework row, or the row's own copy if the catalog lacks it."""
+    definition = definition or FrameworkCatalog.get(framework['name'], framework['version'])
+    if definition is not None:
+        return definition.to_dict()
+    return dict(db.session.execute(
+        db.select(*(getattr(Framework, f) for f in FrameworkCatalog.FRAMEWORK_FIELDS))
+        .where(Framework.id == framework['id'])
+    ).mappings().one())
+
+
+def _family_dict(definition, row):
+    """A family row with its catalog fields, or the row's own fields (and no description)."""
+    own = {field: row.pop(field) for field in FAMILY_ROW_FIELDS}
+    family = definition.families.get(row['family_code']) if definition is not None else None
+    if family is None:
+        return {'family_code': row['family_code'], **own, 'description': None, **row}
+    return {**family.to_dict(), **row}
+
+
 @frameworks_bp.route('', methods=['GET'])
+@conditional('frameworks')
 def list_frameworks():
     """List all compliance frameworks.
     ---
@@ -25,13 +54,19 @@ def list_frameworks():
           type: array
           items:
             $ref: '#/definitions/Framework'
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
-    frameworks = Framework.query.filter_by(session_id=session_id).all()
-    return jsonify([f.to_dict() for f in frameworks])
+    # The session's rows only say which definitions it uses; the text is cached.
+    frameworks = fetch_dicts(db.select(
+        Framework.id, Framework.name, Framework.version, Framework.session_id,
+    ).where(Framework.session_id == session_id))
+    return jsonify([{**_framework_fields(f), **f} for f in frameworks])
 
 
 @frameworks_bp.route('/<framework_id>', methods=['GET'])
+@conditional('frameworks', 'control_families')
 def get_framework(framework_id):
     """Get a single framework with its control families.
     ---
@@ -65,20 +100,29 @@ def get_framework(framework_id):
         description: Framework not found
         schema:
           $ref: '#/definitions/Error'
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
-    framework = Framework.query.filter_by(
-        id=framework_id, session_id=session_id
-    ).first()
+    framework = db.session.execute(db.select(
+        Framework.id, Framework.name, Framework.version, Framework.session_id,
+    ).where(
+        Framework.id == framework_id, Framework.session_id == session_id,
+    )).mappings().first()
 
     if not framework:
         return jsonify({'message': 'Framework not found'}), 404
 
-    families = ControlFamily.query.filter_by(
-        framework_id=framework_id, session_id=session_id
-    ).order_by(ControlFamily.sort_order).all()
+    definition = FrameworkCatalog.get(framework['name'], framework['version'])
+    families = fetch_dicts(db.select(
+        ControlFamily.id, ControlFamily.framework_id, ControlFamily.family_code, ControlFamily.session_id,
+        *(getattr(ControlFamily, f) for f in FAMILY_ROW_FIELDS),
+    ).where(
+        ControlFamily.framework_id == framework_id, ControlFamily.session_id == session_id,
+    ).order_by(ControlFamily.sort_order))
 
-    result = framework.to_dict()
-    result['families'] = [f.to_dict() for f in families]
+    result = {**_framework_fields(framework, definition), **framework}
+    result['families'] = [_family_dict(definition, f) for f in families]
 
     return jsonify(result)
+
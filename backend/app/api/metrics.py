@@ -0,0 +1,22 @@
+from flask import Blueprint, Response
+from app.metrics import registry
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('', methods=['GET'])
+def get_metrics():
+    """Per-route latency, SQL query-count and DB-time histograms.
+    ---
+    tags:
+      - System
+    security: []
+    produces:
+      - text/plain
+    responses:
+      200:
+        description: Metrics in Prometheus text exposition format
+        schema:
+          type: string
+    """
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
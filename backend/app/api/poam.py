@@ -1,14 +1,21 @@
 import uuid
 from datetime import datetime
 from flask import Blueprint, jsonify, request
+from app.api.conditional import conditional
+from app.api.fields import parse_fields, wants
+from app.api.rows import columns, fetch_dicts
 from app.extensions import db
 from app.models.poam import POAMItem
 from app.models.control import Control
+from app.models.control_definition import ControlDefinition
+from app.services.cost_forecaster import CostForecaster
+from app.services.milestone_tracker import MilestoneTracker
 
 poam_bp = Blueprint('poam', __name__)
 
 
 @poam_bp.route('', methods=['GET'])
+@conditional('poam_items', 'control_assessments')
 def list_poam():
     """List all POA&M items with optional filters.
     ---
@@ -33,6 +40,11 @@ def list_poam():
         required: false
         enum: [critical, high, moderate, low]
         description: Filter by risk level
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma-separated fields to return (e.g. weakness_description,status,planned_completion_date); id is always included"
     responses:
       200:
         description: List of POA&M items enriched with control info
@@ -47,29 +59,33 @@ def list_poam():
                     type: string
                   control_title:
                     type: string
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
     """
     session_id = request.args.get('session_id', '__default__')
     status = request.args.get('status')
     risk_level = request.args.get('risk_level')
+    fields = parse_fields(POAMItem, derived=('control_number', 'control_title'))
 
-    query = POAMItem.query.filter_by(session_id=session_id)
+    stmt = db.select(*columns(POAMItem, fields)).select_from(POAMItem).where(
+        POAMItem.session_id == session_id
+    )
 
     if status:
-        query = query.filter_by(status=status)
+        stmt = stmt.where(POAMItem.status == status)
     if risk_level:
-        query = query.filter_by(risk_level=risk_level)
-
-    items = query.order_by(POAMItem.created_at.desc()).all()
+        stmt = stmt.where(POAMItem.risk_level == risk_level)
 
-    results = []
-    for p in items:
-        d = p.to_dict()
-        control = Control.query.get(p.control_id)
-        if control:
-            d['control_number'] = control.control_number
-            d['control_title'] = control.title
-        results.append(d)
+    if wants(fields, 'control_number', 'control_title'):
+        stmt = stmt.outerjoin(Control, Control.id == POAMItem.control_id)
+        if wants(fields, 'control_number'):
+            stmt = stmt.add_columns(Control.control_number)
+        if wants(fields, 'control_title'):
+            stmt = stmt.outerjoin(
+                ControlDefinition, ControlDefinition.id == Control.definition_id
+            ).add_columns(ControlDefinition.title.label('control_title'))
 
+    results = fetch_dicts(stmt.order_by(POAMItem.created_at.desc()))
     return jsonify(results)
 
 
@@ -128,7 +144,7 @@ def create_poam():
               default: open
             milestones:
               type: string
-              description: JSON string of milestones array
+              description: "JSON array of {description, status} milestones (string or array)"
               default: "[]"
     responses:
       201:
@@ -160,6 +176,11 @@ def create_poam():
     if not control:
         return jsonify({'message': 'Control not found'}), 404
 
+    try:
+        milestones = MilestoneTracker.parse(data.get('milestones', '[]'))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
     now = datetime.now().isoformat()
 
     item = POAMItem(
@@ -176,13 +197,14 @@ def create_poam():
         estimated_cost=data.get('estimated_cost'),
         cost_notes=data.get('cost_notes'),
         status=data.get('status', 'open'),
-        milestones=data.get('milestones', '[]'),
+        milestones=MilestoneTracker.dumps(milestones),
         created_at=now,
         updated_at=now,
         session_id=session_id,
     )
 
     db.session.add(item)
+    MilestoneTracker.sync(item)
     db.session.commit()
 
     return jsonify(item.to_dict()), 201
@@ -264,11 +286,18 @@ def update_poam(poam_id):
     if not data:
         return jsonify({'message': 'Missing request body'}), 400
 
+    if 'milestones' in data:
+        try:
+            milestones = MilestoneTracker.parse(data['milestones'])
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        item.milestones = MilestoneTracker.dumps(milestones)
+
     updatable_fields = [
         'weakness_description', 'remediation_plan', 'risk_level',
         'responsible_person', 'responsible_team', 'planned_start_date',
         'planned_completion_date', 'actual_completion_date', 'estimated_cost',
-        'cost_notes', 'status', 'milestones',
+        'cost_notes', 'status',
     ]
 
     for field in updatable_fields:
@@ -277,6 +306,9 @@ def update_poam(poam_id):
 
     item.updated_at = datetime.now().isoformat()
 
+    if 'milestones' in data:
+        MilestoneTracker.sync(item)
+
     db.session.commit()
     return jsonify(item.to_dict())
 
@@ -325,3 +357,228 @@ def delete_poam(poam_id):
     db.session.commit()
 
     return jsonify({'message': 'POA&M item deleted'}), 200
+
+
+@poam_bp.route('/milestones/analytics', methods=['GET'])
+@conditional('poam_milestones', 'poam_items', 'control_assessments')
+def milestone_analytics():
+    """Milestone completion ratios per item, team and risk level, plus burn-down.
+    ---
+    tags:
+      - POA&M
+    parameters:
+      - name: session_id
+        in: query
+        type: string
+        required: false
+        default: __default__
+        description: Session ID for demo isolation
+    responses:
+      200:
+        description: Milestone analytics computed from the normalized milestone table
+        schema:
+          type: object
+          properties:
+            summary:
+              type: object
+              properties:
+                total:
+                  type: integer
+                completed:
+                  type: integer
+                in_progress:
+                  type: integer
+                planned:
+                  type: integer
+                completion_ratio:
+                  type: number
+            by_item:
+              type: array
+              items:
+                type: object
+                properties:
+                  poam_id:
+                    type: string
+                  control_id:
+                    type: string
+                  control_number:
+                    type: string
+                  risk_level:
+                    type: string
+                  responsible_team:
+                    type: string
+                  status:
+                    type: string
+                  total:
+                    type: integer
+                  completed:
+                    type: integer
+                  in_progress:
+                    type: integer
+                  completion_ratio:
+                    type: number
+            by_team:
+              type: array
+              items:
+                type: object
+                properties:
+                  responsible_team:
+                    type: string
+                  items:
+                    type: integer
+                  total:
+                    type: integer
+                  completed:
+                    type: integer
+                  completion_ratio:
+                    type: number
+            by_risk:
+              type: array
+              items:
+                type: object
+                properties:
+                  risk_level:
+                    type: string
+                  items:
+                    type: integer
+                  total:
+                    type: integer
+                  completed:
+                    type: integer
+                  completion_ratio:
+                    type: number
+            burndown:
+              type: array
+              items:
+                type: object
+                properties:
+                  month:
+                    type: string
+                    example: "2026-03"
+                  planned_remaining:
+                    type: integer
+                  actual_remaining:
+                    type: integer
+                  completed:
+                    type: integer
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
+    """
+    session_id = request.args.get('session_id', '__default__')
+    return jsonify(MilestoneTracker.get_analytics(session_id=session_id))
+
+
+@poam_bp.route('/costs', methods=['GET'])
+@conditional('poam_items', 'control_assessments', 'control_families')
+def cost_rollup():
+    """POA&M cost rollup and monthly spend forecast.
+    ---
+    tags:
+      - POA&M
+    parameters:
+      - name: session_id
+        in: query
+        type: string
+        required: false
+        default: __default__
+        description: Session ID for demo isolation
+    responses:
+      200:
+        description: >
+          Estimated and remaining cost by month, team, risk level and control family.
+          Cancelled items are excluded; remaining cost covers open and in-progress items.
+        schema:
+          type: object
+          properties:
+            totals:
+              type: object
+              properties:
+                items:
+                  type: integer
+                estimated_cost:
+                  type: number
+                remaining_cost:
+                  type: number
+                unestimated_items:
+                  type: integer
+            by_month:
+              type: array
+              items:
+                type: object
+                properties:
+                  month:
+                    type: string
+                    example: "2026-03"
+                  estimated_cost:
+                    type: number
+                  remaining_cost:
+                    type: number
+                  cumulative_cost:
+                    type: number
+            unscheduled:
+              type: object
+              description: Items with neither a planned start nor completion date
+              properties:
+                items:
+                  type: integer
+                estimated_cost:
+                  type: number
+                remaining_cost:
+                  type: number
+            by_team:
+              type: array
+              items:
+                type: object
+                properties:
+                  responsible_team:
+                    type: string
+                  items:
+                    type: integer
+                  estimated_cost:
+                    type: number
+                  remaining_cost:
+                    type: number
+                  unestimated_items:
+                    type: integer
+            by_risk:
+              type: array
+              items:
+                type: object
+                properties:
+                  risk_level:
+                    type: string
+                  items:
+                    type: integer
+                  estimated_cost:
+                    type: number
+                  remaining_cost:
+                    type: number
+                  unestimated_items:
+                    type: integer
+            by_family:
+              type: array
+              items:
+                type: object
+                properties:
+                  family_code:
+                    type: string
+                  family_name:
+                    type: string
+                  items:
+                    type: integer
+                  estimated_cost:
+                    type: number
+                  remaining_cost:
+                    type: number
+                  unestimated_items:
+                    type: integer
+      304:
+        description: Not modified since the ETag supplied in If-None-Match
+      400:
+        description: An item's planned dates span more than 10 years
+    """
+    session_id = request.args.get('session_id', '__default__')
+    try:
+        return jsonify(CostForecaster.get_rollup(session_id=session_id))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
@@ -0,0 +1,43 @@
+"""
+Core read path for list and export endpoints.
+
+Hydrating ORM instances (identity map, instance state, attribute
+instrumentation) only to call ``to_dict()`` dominates the cost of large list
+responses. Each model's ``to_dict()`` keys are exactly its column attribute
+keys, so these helpers select the columns with a Core ``select()`` labelled by
+those keys and turn every ``Row`` mapping straight into the same dict. The
+column-to-key map is built once per model and shared by every endpoint.
+"""
+from functools import lru_cache
+from app.extensions import db
+
+
+@lru_cache(maxsize=None)
+def column_map(model):
+    """``((key, Column), ...)`` in declaration order, matching ``to_dict()``."""
+    return tuple((attr.key, attr.columns[0]) for attr in model.__mapper__.column_attrs)
+
+
+def column_keys(model):
+    return tuple(key for key, _ in column_map(model))
+
+
+def columns(model, fields=None, prefix='', exclude=()):
+    """Labelled columns of ``model`` (all of them, or only those in ``fields``)."""
+    return [
+        column.label(prefix + key)
+        for key, column in column_map(model)
+        if (fields is None or key in fields) and key not in exclude
+    ]
+
+
+def fetch_dicts(stmt):
+    """Execute ``stmt`` and return one plain dict per row."""
+    return [dict(mapping) for mapping in db.session.execute(stmt).mappings()]
+
+
+def split_row(mapping, model, prefix, extra=()):
+    """Pull ``model``'s prefixed columns (and ``extra`` keys) out of a joined row (None if all NULL)."""
+    d = {key: mapping[prefix + key] for key in column_keys(model) if prefix + key in mapping}
+    d.update((key, mapping[prefix + key]) for key in extra)
+    return d if d['id'] is not None else None
@@ -0,0 +1,214 @@
+"""
+Migrate a database created before control text moved into the shared catalog.
+
+Older databases keep every control's title, requirement text, plain-English
+summary and guidance on each session's ``controls`` row, and every family's
+description on its ``control_families`` row. ``migrate_catalog()`` copies
+that text into ``control_definitions`` / ``family_definitions`` (once per
+framework name and version, taken from the ``__default__`` session when it
+has the framework), renames ``controls`` to ``control_assessments``, points
+each session row at its definition and drops the duplicated columns. Session
+``plain_english`` / ``guidance_text`` that differ from the catalog are kept as
+per-session overrides. An empty ``control_assessments`` table (left by
+``init-db`` on an old database) is dropped first.
+
+Every run then creates the tables and indexes the database lacks (write
+counters, milestones, users, crosswalk mappings) and, while ``poam_milestones``
+is empty, fills it from each item's milestones JSON as ``sync-milestones`` does.
+"""
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.schema import CreateTable
+from app.extensions import db
+from app.models.control import Control
+from app.models.control_definition import ControlDefinition
+from app.models.control_family import ControlFamily
+from app.models.control_mapping import ControlMapping
+from app.models.evidence import Evidence
+from app.models.family_definition import FamilyDefinition
+
+CONTROL_TEXT_COLUMNS = ('title', 'requirement_text', 'control_type', 'weight', 'sprs_points_if_not_met')
+
+
+def needs_migration(engine):
+    """True if ``engine``'s database still has the per-session ``controls`` text columns."""
+    inspector = inspect(engine)
+    if not inspector.has_table('controls'):
+        return False
+    return 'requirement_text' in {column['name'] for column in inspector.get_columns('controls')}
+
+
+def _representatives(conn):
+    """``{framework row id: (name, version)}``, one row per framework name and version."""
+    chosen = {}
+    for framework_id, name, version, session_id in conn.execute(text(
+        'SELECT id, name, version, session_id FROM frameworks'
+    )):
+        key = (name, version)
+        if key not in chosen or session_id == '__default__':
+            chosen[key] = framework_id
+    return {framework_id: key for key, framework_id in chosen.items()}
+
+
+def _insert_definitions(conn, representatives):
+    from app.seed import make_definition_id
+
+    families, controls = [], []
+    for framework_id, (name, version) in representatives.items():
+        params = {'framework_id': framework_id}
+        for row in conn.execute(text(
+            'SELECT family_code, name, description, control_count, sort_order '
+            'FROM control_families WHERE framework_id = :framework_id'
+        ), params).mappings():
+            families.append({
+                'id': make_definition_id('family', name, version, row['family_code']),
+                'framework_name': name,
+                'framework_version': version,
+                **row,
+            })
+        for row in conn.execute(text(
+            'SELECT cf.family_code, c.control_number, c.title, c.requirement_text, c.plain_english, '
+            'c.guidance_text, c.control_type, c.weight, c.sprs_points_if_not_met '
+            'FROM controls c JOIN control_families cf ON cf.id = c.family_id '
+            'WHERE cf.framework_id = :framework_id'
+        ), params).mappings():
+            controls.append({
+                'id': make_definition_id('control', name, version, row['control_number']),
+                'framework_name': name,
+                'framework_version': version,
+                **row,
+            })
+
+    if families:
+        conn.execute(FamilyDefinition.__table__.insert(), families)
+    if controls:
+        conn.execute(ControlDefinition.__table__.insert(), controls)
+    return len(families), len(controls)
+
+
+def _require_definition(conn, table):
+    """Make the backfilled ``definition_id`` of ``table`` NOT NULL, as the model declares it.
+
+    Raises ValueError if a row has no definition.
+    """
+    missing = conn.execute(text(f'SELECT COUNT(*) FROM {table.name} WHERE definition_id IS NULL')).scalar()
+    if missing:
+        raise ValueError(f'{missing} {table.name} rows have no catalog definition')
+    if conn.dialect.name != 'sqlite':
+        conn.execute(text(f'ALTER TABLE {table.name} ALTER COLUMN definition_id SET NOT NULL'))
+        return
+
+    # SQLite cannot change a column's constraints: copy the rows into a table
+    # built from the model and swap it in.
+    metadata = MetaData()
+    for other in db.metadata.sorted_tables:
+        other.to_metadata(metadata)
+    rebuilt = table.to_metadata(metadata, name=f'_{table.name}_rebuilt')
+    conn.execute(CreateTable(rebuilt))
+    columns = ', '.join(column.name for column in table.columns)
+    conn.execute(text(f'INSERT INTO {rebuilt.name} ({columns}) SELECT {columns} FROM {table.name}'))
+    conn.execute(text(f'DROP TABLE {table.name}'))
+    conn.execute(text(f'ALTER TABLE {rebuilt.name} RENAME TO {table.name}'))
+
+
+def create_missing(engine):
+    """Create the tables and indexes a database built earlier lacks."""
+    db.metadata.create_all(engine, checkfirst=True)
+    for index in (*Control.__table__.indexes, *Evidence.__table__.indexes):
+        index.create(engine, checkfirst=True)
+
+
+def backfill_milestones():
+    """Fill ``poam_milestones`` from every POA&M item's milestones JSON.
+
+    Returns the number of items synced; items whose JSON cannot be parsed
+    are skipped.
+    """
+    from app.models.poam import POAMItem
+    from app.services.milestone_tracker import MilestoneTracker
+
+    count = 0
+    for item in POAMItem.query.all():
+        try:
+            MilestoneTracker.sync(item)
+        except ValueError:
+            continue
+        count += 1
+    db.session.commit()
+    return count
+
+
+def _finish(engine):
+    from app.services.catalog import FrameworkCatalog
+
+    create_missing(engine)
+    with engine.begin() as conn:
+        FrameworkCatalog.changed(connection=conn)
+        synced = conn.execute(text('SELECT 1 FROM poam_milestones LIMIT 1')).first()
+    if synced is None:
+        backfill_milestones()
+
+
+def migrate_catalog(engine=None):
+    """Move control and family text into the catalog tables.
+
+    Returns ``(families, controls)`` definition counts, or None if the
+    database does not need migrating. The move runs in one transaction;
+    missing tables are created after it. Raises ValueError if both
+    ``controls`` and ``control_assessments`` hold rows, or if a session row
+    has no definition.
+    """
+    engine = engine or db.engine
+    if not needs_migration(engine):
+        _finish(engine)
+        return None
+
+    with engine.begin() as conn:
+        if inspect(conn).has_table('control_assessments'):
+            if conn.execute(text('SELECT COUNT(*) FROM control_assessments')).scalar():
+                raise ValueError('Both controls and control_assessments hold rows; migrate manually')
+            conn.execute(text('DROP TABLE control_assessments'))
+
+        FamilyDefinition.__table__.create(conn, checkfirst=True)
+        ControlDefinition.__table__.create(conn, checkfirst=True)
+        counts = _insert_definitions(conn, _representatives(conn))
+
+        conn.execute(text('ALTER TABLE controls RENAME TO control_assessments'))
+        conn.execute(text('ALTER TABLE control_assessments ADD COLUMN definition_id VARCHAR(36)'))
+        conn.execute(text(
+            'UPDATE control_assessments SET definition_id = ('
+            ' SELECT d.id FROM control_families cf'
+            ' JOIN frameworks f ON f.id = cf.framework_id'
+            ' JOIN control_definitions d ON d.framework_name = f.name'
+            '  AND d.framework_version = f.version'
+            '  AND d.control_number = control_assessments.control_number'
+            ' WHERE cf.id = control_assessments.family_id)'
+        ))
+        for column in ('plain_english', 'guidance_text'):
+            # Text equal to the catalog's is not an override.
+            conn.execute(text(
+                f'UPDATE control_assessments SET {column} = NULL WHERE {column} = ('
+                f' SELECT d.{column} FROM control_definitions d'
+                f' WHERE d.id = control_assessments.definition_id)'
+            ))
+        for column in CONTROL_TEXT_COLUMNS:
+            conn.execute(text(f'ALTER TABLE control_assessments DROP COLUMN {column}'))
+        _require_definition(conn, Control.__table__)
+
+        conn.execute(text('ALTER TABLE control_families ADD COLUMN definition_id VARCHAR(36)'))
+        conn.execute(text(
+            'UPDATE control_families SET definition_id = ('
+            ' SELECT d.id FROM frameworks f'
+            ' JOIN family_definitions d ON d.framework_name = f.name'
+            '  AND d.framework_version = f.version'
+            '  AND d.family_code = control_families.family_code'
+            ' WHERE f.id = control_families.framework_id)'
+        ))
+        conn.execute(text('ALTER TABLE control_families DROP COLUMN description'))
+        _require_definition(conn, ControlFamily.__table__)
+
+        if inspect(conn).has_table('session_versions'):
+            conn.execute(text(
+                "UPDATE session_versions SET table_name = 'control_assessments' WHERE table_name = 'controls'"
+            ))
+    _finish(engine)
+    return counts
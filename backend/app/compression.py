@@ -0,0 +1,146 @@
+"""
+Response compression.
+
+Responses of at least ``COMPRESS_MIN_SIZE`` bytes with a compressible
+mimetype are encoded with brotli (when the ``brotli`` package is installed)
+or gzip, whichever the client's ``Accept-Encoding`` prefers. Responses that
+already carry a ``Content-Encoding`` (e.g. the pre-gzipped OpenAPI spec),
+streamed responses and non-200 responses are left alone; views that stream
+encode their chunks themselves with ``compress_stream``.
+
+``CompressedPayload`` holds a rendered body together with its encoded
+variants; each encoding is produced once and reused, so cached payloads (see
+``conditional(..., cache=True)``) skip both serialization and compression on
+repeat hits.
+"""
+import gzip
+import threading
+import zlib
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = (
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+)
+
+
+def available_encodings():
+    """Encodings this process can produce, in server preference order."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def is_compressible(mimetype):
+    return bool(mimetype) and (mimetype.startswith('text/') or mimetype in COMPRESSIBLE_MIMETYPES)
+
+
+def negotiate(size):
+    """Return the encoding to use for a body of ``size`` bytes, or None."""
+    config = current_app.config
+    if not config.get('COMPRESS_ENABLED', True) or size < config.get('COMPRESS_MIN_SIZE', 1024):
+        return None
+    return request.accept_encodings.best_match(available_encodings())
+
+
+def compress(data, encoding):
+    config = current_app.config
+    if encoding == 'br':
+        return brotli.compress(data, quality=config.get('COMPRESS_BR_QUALITY', 5))
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=config.get('COMPRESS_LEVEL', 6), mtime=0)
+    raise ValueError(f"Unsupported encoding '{encoding}'")
+
+
+def stream_encoding():
+    """Return the encoding to use for a streamed body of unknown length, or None."""
+    if not current_app.config.get('COMPRESS_ENABLED', True):
+        return None
+    return request.accept_encodings.best_match(available_encodings())
+
+
+def compress_stream(chunks, encoding):
+    """Encode an iterable of byte chunks incrementally; returns an iterator of encoded chunks."""
+    config = current_app.config
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config.get('COMPRESS_BR_QUALITY', 5))
+        process, finish = compressor.process, compressor.finish
+    elif encoding == 'gzip':
+        compressor = zlib.compressobj(config.get('COMPRESS_LEVEL', 6), zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        process, finish = compressor.compress, compressor.flush
+    else:
+        raise ValueError(f"Unsupported encoding '{encoding}'")
+
+    def encoded():
+        for chunk in chunks:
+            data = process(chunk)
+            if data:
+                yield data
+        yield finish()
+    return encoded()
+
+
+class CompressedPayload:
+    """A rendered response body plus its lazily built encoded variants."""
+
+    __slots__ = ('body', 'mimetype', '_encoded', '_lock')
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+        self._encoded = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding):
+        data = self._encoded.get(encoding)
+        if data is None:
+            with self._lock:
+                data = self._encoded.get(encoding)
+                if data is None:
+                    data = self._encoded[encoding] = compress(self.body, encoding)
+        return data
+
+    def response(self):
+        """Build a response for the current request's ``Accept-Encoding``."""
+        response = current_app.response_class(mimetype=self.mimetype)
+        encoding = negotiate(len(self.body)) if is_compressible(self.mimetype) else None
+        if encoding is None:
+            response.set_data(self.body)
+        else:
+            response.set_data(self.encoded(encoding))
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+def _after_request(response):
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or 'Content-Encoding' in response.headers
+        or not is_compressible(response.mimetype)
+    ):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    length = response.calculate_content_length()
+    encoding = negotiate(length if length is not None else len(response.get_data()))
+    if encoding is None:
+        return response
+    response.set_data(compress(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def register_compression(app):
+    if not app.config.get('COMPRESS_ENABLED', True):
+        return
+    # Registered before the other after_request hooks so it runs last and
+    # sees the final body (e.g. an inline profile).
+    app.after_request(_after_request)
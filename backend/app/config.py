@@ -3,6 +3,27 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Demo users. Hashes are precomputed (``flask hash-password``) so that no KDF
+# runs at import time; override with AUTH_USERS_FILE or USER_STORE=database.
+DEMO_USERS = [
+    {
+        'id': 'user-admin-001',
+        'username': 'admin',
+        'password_hash': 'scrypt:32768:8:1$nPRnQfNRfUfgX4wK$255007402d9f44a49de3fd4465ab58d557a72cb1f0b307382cc5ab844c39a91c7cbfa92afbc99a5dca0d07c84f84c82e654bed294cc9e31b0e23962a56a199c4',
+        'role': 'Admin',
+        'name': 'Admin User',
+        'email': 'admin@compliance.local',
+    },
+    {
+        'id': 'user-analyst-001',
+        'username': 'analyst',
+        'password_hash': 'scrypt:32768:8:1$MTqojIrEKBdOPIRM$4cad6ff6329b758fc9b6b61c0a4050fc7bc8986b74a4a3963da9f615c2439ad1eaa47f68ff50286115a50f2d22eeac5a3198a1787004b57a14304aeda5357916',
+        'role': 'Analyst',
+        'name': 'Security Analyst',
+        'email': 'analyst@compliance.local',
+    },
+]
+
 
 class BaseConfig:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -11,6 +32,28 @@ class BaseConfig:
     JWT_ACCESS_TOKEN_EXPIRES = 3600
     JWT_REFRESH_TOKEN_EXPIRES = 86400 * 30
     JWT_TOKEN_LOCATION = ['headers']
+    OPENAPI_SPEC_PATH = os.getenv('OPENAPI_SPEC_PATH')
+    SEED_SNAPSHOT_PATH = os.getenv('SEED_SNAPSHOT_PATH')
+    # auto | orjson | stdlib; auto uses orjson when installed.
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'auto')
+    # gzip/brotli for compressible responses of at least COMPRESS_MIN_SIZE bytes.
+    COMPRESS_ENABLED = os.getenv('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+    COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', '6'))
+    COMPRESS_BR_QUALITY = int(os.getenv('COMPRESS_BR_QUALITY', '5'))
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    # Statements slower than this are logged with their query plan; unset disables.
+    SLOW_QUERY_THRESHOLD_MS = os.getenv('SLOW_QUERY_THRESHOLD_MS', '200') or None
+    SLOW_QUERY_LOG_PATH = os.getenv('SLOW_QUERY_LOG_PATH')
+    SLOW_QUERY_BUFFER_SIZE = int(os.getenv('SLOW_QUERY_BUFFER_SIZE', '200'))
+    SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', 'true').lower() == 'true'
+    # Admin-only ``?__profile=1``; profiles land in PROFILE_DIR (default instance/profiles).
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'true').lower() == 'true'
+    PROFILE_DIR = os.getenv('PROFILE_DIR')
+    PROFILE_MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', '50'))
+    USER_STORE = os.getenv('USER_STORE', 'config')
+    AUTH_USERS_FILE = os.getenv('AUTH_USERS_FILE')
+    AUTH_USERS = DEMO_USERS
 
 
 class DevelopmentConfig(BaseConfig):
@@ -0,0 +1,74 @@
+"""
+JSON provider selection.
+
+``JSON_PROVIDER`` chooses how ``jsonify`` serializes responses:
+
+* ``auto`` (default): orjson when it is installed, otherwise the stdlib;
+* ``orjson``: require orjson;
+* ``stdlib``: Flask's default provider.
+
+The orjson provider produces JSON equivalent to Flask's default, not
+byte-identical: it decodes to the same values (sorted keys, ``datetime`` as
+HTTP dates, ``Decimal``/``UUID``/dataclasses via Flask's ``default``), but
+non-ASCII text is written as raw UTF-8 rather than ``\\uXXXX`` escapes.
+The exception is NaN/Infinity, which become ``null`` rather than the
+non-standard ``NaN``/``Infinity`` tokens. It falls back to the stdlib for
+anything orjson rejects, such as integers wider than 64 bits.
+Pretty-printed debug output also uses the stdlib.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """``DefaultJSONProvider`` with orjson doing the encoding."""
+
+    def _options(self, sort_keys):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def _encode(self, obj, sort_keys):
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options(sort_keys))
+        except (orjson.JSONEncodeError, TypeError):
+            return None
+
+    def dumps(self, obj, **kwargs):
+        if set(kwargs) - {'sort_keys', 'default'}:
+            return super().dumps(obj, **kwargs)
+        encoded = self._encode(obj, kwargs.get('sort_keys', self.sort_keys))
+        if encoded is None:
+            return super().dumps(obj, **kwargs)
+        return encoded.decode()
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(obj)
+        encoded = self._encode(obj, self.sort_keys)
+        if encoded is None:
+            return super().response(obj)
+        return self._app.response_class(encoded + b'\n', mimetype=self.mimetype)
+
+
+JSON_PROVIDERS = {
+    'stdlib': DefaultJSONProvider,
+    'orjson': OrjsonProvider,
+}
+
+
+def init_json_provider(app):
+    name = app.config.get('JSON_PROVIDER', 'auto')
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'stdlib'
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f"Unknown JSON_PROVIDER '{name}'. Choose from: auto, {', '.join(JSON_PROVIDERS)}")
+    if name == 'orjson' and orjson is None:
+        raise RuntimeError('JSON_PROVIDER=orjson but the orjson package is not installed')
+    app.json = JSON_PROVIDERS[name](app)
@@ -0,0 +1,144 @@
+"""
+Request timing and SQL query-count instrumentation.
+
+Every request records its latency, the number of SQL statements it executed
+and the time spent in them (via SQLAlchemy cursor events). Results are kept in
+per-route histograms, exported in Prometheus text format at ``/api/metrics``
+and summarized per response in a ``Server-Timing`` header.
+
+Metrics are held in process memory, so with several gunicorn workers each
+scrape reflects the worker that served it; every series carries a ``worker``
+label (the pid) so they can be summed on the Prometheus side.
+"""
+import os
+import threading
+import time
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.total += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    """Per-route histograms keyed by ``(method, endpoint, status)``."""
+
+    METRICS = (
+        ('ctl_http_request_duration_seconds', 'Request latency in seconds.', DURATION_BUCKETS),
+        ('ctl_http_request_db_seconds', 'Time spent executing SQL per request in seconds.', DURATION_BUCKETS),
+        ('ctl_http_request_sql_queries', 'SQL statements executed per request.', QUERY_BUCKETS),
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {name: {} for name, _, _ in self.METRICS}
+
+    def observe(self, labels, duration, db_time, queries):
+        values = (duration, db_time, queries)
+        with self._lock:
+            for (name, _, buckets), value in zip(self.METRICS, values):
+                series = self._series[name]
+                if labels not in series:
+                    series[labels] = Histogram(buckets)
+                series[labels].observe(value)
+
+    def reset(self):
+        with self._lock:
+            for series in self._series.values():
+                series.clear()
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        worker = str(os.getpid())
+        lines = []
+        with self._lock:
+            for name, help_text, _ in self.METRICS:
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} histogram')
+                for (method, endpoint, status), hist in sorted(self._series[name].items()):
+                    base = (
+                        f'method="{method}",endpoint="{_escape(endpoint)}",'
+                        f'status="{status}",worker="{worker}"'
+                    )
+                    for bound, count in zip(hist.buckets, hist.counts):
+                        lines.append(f'{name}_bucket{{{base},le="{bound}"}} {count}')
+                    lines.append(f'{name}_bucket{{{base},le="+Inf"}} {hist.total}')
+                    lines.append(f'{name}_sum{{{base}}} {hist.sum}')
+                    lines.append(f'{name}_count{{{base}}} {hist.total}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+registry = MetricsRegistry()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the statement's own execution context: after_cursor_execute
+    # does not fire for a statement that raises, so a per-connection stack
+    # would leave a stale start time for the next query on that connection.
+    if has_request_context() and context is not None:
+        context._ctl_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not has_request_context():
+        return
+    start = getattr(context, '_ctl_query_start', None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    g.sql_queries = g.get('sql_queries', 0) + 1
+    g.sql_time = g.get('sql_time', 0.0) + elapsed
+
+
+def _before_request():
+    g.request_start = time.perf_counter()
+    g.sql_queries = 0
+    g.sql_time = 0.0
+
+
+def _after_request(response):
+    start = g.get('request_start')
+    if start is None:
+        return response
+
+    duration = time.perf_counter() - start
+    queries = g.get('sql_queries', 0)
+    db_time = g.get('sql_time', 0.0)
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+
+    registry.observe((request.method, endpoint, response.status_code), duration, db_time, queries)
+    response.headers.add(
+        'Server-Timing',
+        f'app;dur={duration * 1000:.2f}, db;dur={db_time * 1000:.2f};desc="{queries} queries"',
+    )
+    return response
+
+
+def register_metrics(app):
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
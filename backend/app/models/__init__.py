@@ -1,17 +1,29 @@
 from app.models.framework import Framework
+from app.models.family_definition import FamilyDefinition
+from app.models.control_definition import ControlDefinition
+from app.models.control_mapping import ControlMapping
 from app.models.control_family import ControlFamily
 from app.models.control import Control
 from app.models.assessment_objective import AssessmentObjective
 from app.models.evidence import Evidence
 from app.models.poam import POAMItem
+from app.models.poam_milestone import POAMMilestone
 from app.models.boundary_asset import BoundaryAsset
+from app.models.session_version import SessionVersion
+from app.models.user import User
 
 __all__ = [
     'Framework',
+    'FamilyDefinition',
+    'ControlDefinition',
+    'ControlMapping',
     'ControlFamily',
     'Control',
     'AssessmentObjective',
     'Evidence',
     'POAMItem',
+    'POAMMilestone',
     'BoundaryAsset',
+    'SessionVersion',
+    'User',
 ]
@@ -5,7 +5,7 @@ class AssessmentObjective(db.Model):
     __tablename__ = 'assessment_objectives'
 
     id = db.Column(db.String(36), primary_key=True)
-    control_id = db.Column(db.String(36), db.ForeignKey('controls.id'), nullable=False)
+    control_id = db.Column(db.String(36), db.ForeignKey('control_assessments.id'), nullable=False)
     objective_number = db.Column(db.String(30), nullable=False)
     objective_text = db.Column(db.Text, nullable=False)
     status = db.Column(db.String(30), default='not_assessed')
@@ -1,20 +1,33 @@
+from functools import cached_property
 from app.extensions import db
 
 
 class Control(db.Model):
-    __tablename__ = 'controls'
+    """
+    A session's assessment of one catalog control.
+
+    The control's static text lives once in ``control_definitions`` and is
+    read through the per-worker ``FrameworkCatalog``; ``plain_english`` and
+    ``guidance_text`` here are per-session overrides (NULL means the
+    catalog's text).
+    """
+
+    __tablename__ = 'control_assessments'
+    __table_args__ = (
+        # Crosswalk projections find a session's assessments by definition.
+        db.Index('ix_control_assessments_definition_session', 'definition_id', 'session_id'),
+    )
+
+    CATALOG_FIELDS = ('title', 'requirement_text', 'control_type', 'weight', 'sprs_points_if_not_met')
+    OVERRIDE_FIELDS = ('plain_english', 'guidance_text')
 
     id = db.Column(db.String(36), primary_key=True)
     family_id = db.Column(db.String(36), db.ForeignKey('control_families.id'), nullable=False)
+    definition_id = db.Column(db.String(36), db.ForeignKey('control_definitions.id'), nullable=False)
     control_number = db.Column(db.String(20), nullable=False)
-    title = db.Column(db.String(300), nullable=False)
-    requirement_text = db.Column(db.Text)
     plain_english = db.Column(db.Text)
     guidance_text = db.Column(db.Text)
-    control_type = db.Column(db.String(20))
     implementation_status = db.Column(db.String(30), default='not_assessed')
-    weight = db.Column(db.Integer, default=1)
-    sprs_points_if_not_met = db.Column(db.Integer)
     implementation_notes = db.Column(db.Text)
     assessor_notes = db.Column(db.Text)
     last_assessed_date = db.Column(db.String(30))
@@ -22,23 +35,50 @@ class Control(db.Model):
     sort_order = db.Column(db.Integer)
     session_id = db.Column(db.String(100), default='__default__')
 
-    objectives = db.relationship('AssessmentObjective', backref='control', lazy='dynamic')
-    evidence_items = db.relationship('Evidence', backref='control', lazy='dynamic')
-    poam_items = db.relationship('POAMItem', backref='control', lazy='dynamic')
+    objectives = db.relationship('AssessmentObjective', backref='control', lazy='select')
+    evidence_items = db.relationship('Evidence', backref='control', lazy='select')
+    poam_items = db.relationship('POAMItem', backref='control', lazy='select')
+
+    @cached_property
+    def definition(self):
+        """The shared ``CatalogControl`` (definitions do not change, so it is kept per instance)."""
+        from app.services.catalog import FrameworkCatalog
+        return FrameworkCatalog.control(self.definition_id)
+
+    @property
+    def title(self):
+        return self.definition.title
+
+    @property
+    def requirement_text(self):
+        return self.definition.requirement_text
+
+    @property
+    def control_type(self):
+        return self.definition.control_type
+
+    @property
+    def weight(self):
+        return self.definition.weight
+
+    @property
+    def sprs_points_if_not_met(self):
+        return self.definition.sprs_points_if_not_met
 
     def to_dict(self):
+        definition = self.definition
         return {
             'id': self.id,
             'family_id': self.family_id,
             'control_number': self.control_number,
-            'title': self.title,
-            'requirement_text': self.requirement_text,
-            'plain_english': self.plain_english,
-            'guidance_text': self.guidance_text,
-            'control_type': self.control_type,
+            'title': definition.title,
+            'requirement_text': definition.requirement_text,
+            'plain_english': definition.plain_english if self.plain_english is None else self.plain_english,
+            'guidance_text': definition.guidance_text if self.guidance_text is None else self.guidance_text,
+            'control_type': definition.control_type,
             'implementation_status': self.implementation_status,
-            'weight': self.weight,
-            'sprs_points_if_not_met': self.sprs_points_if_not_met,
+            'weight': definition.weight,
+            'sprs_points_if_not_met': definition.sprs_points_if_not_met,
             'implementation_notes': self.implementation_notes,
             'assessor_notes': self.assessor_notes,
             'last_assessed_date': self.last_assessed_date,
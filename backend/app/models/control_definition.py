@@ -0,0 +1,39 @@
+from app.extensions import db
+
+
+class ControlDefinition(db.Model):
+    """Static text of one control in a framework, shared by every session."""
+
+    __tablename__ = 'control_definitions'
+    __table_args__ = (
+        db.UniqueConstraint('framework_name', 'framework_version', 'control_number'),
+    )
+
+    id = db.Column(db.String(36), primary_key=True)
+    framework_name = db.Column(db.String(200), nullable=False)
+    framework_version = db.Column(db.String(50))
+    family_code = db.Column(db.String(10))
+    control_number = db.Column(db.String(20), nullable=False)
+    title = db.Column(db.String(300), nullable=False)
+    requirement_text = db.Column(db.Text)
+    plain_english = db.Column(db.Text)
+    guidance_text = db.Column(db.Text)
+    control_type = db.Column(db.String(20))
+    weight = db.Column(db.Integer, default=1)
+    sprs_points_if_not_met = db.Column(db.Integer)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'framework_name': self.framework_name,
+            'framework_version': self.framework_version,
+            'family_code': self.family_code,
+            'control_number': self.control_number,
+            'title': self.title,
+            'requirement_text': self.requirement_text,
+            'plain_english': self.plain_english,
+            'guidance_text': self.guidance_text,
+            'control_type': self.control_type,
+            'weight': self.weight,
+            'sprs_points_if_not_met': self.sprs_points_if_not_met,
+        }
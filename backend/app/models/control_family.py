@@ -6,15 +6,22 @@ class ControlFamily(db.Model):
 
     id = db.Column(db.String(36), primary_key=True)
     framework_id = db.Column(db.String(36), db.ForeignKey('frameworks.id'), nullable=False)
+    definition_id = db.Column(db.String(36), db.ForeignKey('family_definitions.id'), nullable=False)
     family_code = db.Column(db.String(10), nullable=False)
     name = db.Column(db.String(200), nullable=False)
-    description = db.Column(db.Text)
     control_count = db.Column(db.Integer)
     sort_order = db.Column(db.Integer)
     session_id = db.Column(db.String(100), default='__default__')
 
     controls = db.relationship('Control', backref='family', lazy='dynamic')
 
+    @property
+    def description(self):
+        """Shared text from ``family_definitions`` (via the ``FrameworkCatalog``)."""
+        from app.services.catalog import FrameworkCatalog
+        family = FrameworkCatalog.family(self.definition_id)
+        return family.description if family else None
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -0,0 +1,47 @@
+from app.extensions import db
+
+
+class ControlMapping(db.Model):
+    """
+    One crosswalk edge: how a control in one framework relates to a control
+    in another.
+
+    Mappings are shared by every session, like the definitions they join.
+    Both directions are stored, along with mappings composed through an
+    intermediate framework (``hops`` > 1), so projecting onto a framework is
+    a single lookup on the target framework index. ``relationship``
+    describes the source relative to the target: ``equivalent``, ``subset``
+    (the source covers part of the target), ``superset`` or ``intersects``.
+    """
+
+    __tablename__ = 'control_mappings'
+    __table_args__ = (
+        db.UniqueConstraint('source_definition_id', 'target_definition_id'),
+        db.Index(
+            'ix_control_mappings_target_framework',
+            'target_framework_name', 'target_framework_version', 'target_definition_id',
+        ),
+    )
+
+    id = db.Column(db.String(36), primary_key=True)
+    source_definition_id = db.Column(db.String(36), db.ForeignKey('control_definitions.id'), nullable=False)
+    target_definition_id = db.Column(db.String(36), db.ForeignKey('control_definitions.id'), nullable=False)
+    source_framework_name = db.Column(db.String(200), nullable=False)
+    source_framework_version = db.Column(db.String(50))
+    target_framework_name = db.Column(db.String(200), nullable=False)
+    target_framework_version = db.Column(db.String(50))
+    relationship = db.Column(db.String(20), nullable=False, default='equivalent')
+    hops = db.Column(db.Integer, nullable=False, default=1)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'source_definition_id': self.source_definition_id,
+            'target_definition_id': self.target_definition_id,
+            'source_framework_name': self.source_framework_name,
+            'source_framework_version': self.source_framework_version,
+            'target_framework_name': self.target_framework_name,
+            'target_framework_version': self.target_framework_version,
+            'relationship': self.relationship,
+            'hops': self.hops,
+        }
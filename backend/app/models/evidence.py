@@ -6,7 +6,7 @@ class Evidence(db.Model):
     __tablename__ = 'evidence'
 
     id = db.Column(db.String(36), primary_key=True)
-    control_id = db.Column(db.String(36), db.ForeignKey('controls.id'), nullable=False)
+    control_id = db.Column(db.String(36), db.ForeignKey('control_assessments.id'), nullable=False, index=True)
     evidence_type = db.Column(db.String(30))
     title = db.Column(db.String(300), nullable=False)
     description = db.Column(db.Text)
@@ -0,0 +1,31 @@
+from app.extensions import db
+
+
+class FamilyDefinition(db.Model):
+    """Static text of one control family in a framework, shared by every session."""
+
+    __tablename__ = 'family_definitions'
+    __table_args__ = (
+        db.UniqueConstraint('framework_name', 'framework_version', 'family_code'),
+    )
+
+    id = db.Column(db.String(36), primary_key=True)
+    framework_name = db.Column(db.String(200), nullable=False)
+    framework_version = db.Column(db.String(50))
+    family_code = db.Column(db.String(10), nullable=False)
+    name = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text)
+    control_count = db.Column(db.Integer)
+    sort_order = db.Column(db.Integer)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'framework_name': self.framework_name,
+            'framework_version': self.framework_version,
+            'family_code': self.family_code,
+            'name': self.name,
+            'description': self.description,
+            'control_count': self.control_count,
+            'sort_order': self.sort_order,
+        }
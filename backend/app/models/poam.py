@@ -6,7 +6,7 @@ class POAMItem(db.Model):
     __tablename__ = 'poam_items'
 
     id = db.Column(db.String(36), primary_key=True)
-    control_id = db.Column(db.String(36), db.ForeignKey('controls.id'), nullable=False)
+    control_id = db.Column(db.String(36), db.ForeignKey('control_assessments.id'), nullable=False)
     weakness_description = db.Column(db.Text)
     remediation_plan = db.Column(db.Text)
     risk_level = db.Column(db.String(20), default='moderate')
@@ -23,6 +23,11 @@ class POAMItem(db.Model):
     updated_at = db.Column(db.String(30), default=lambda: datetime.now().isoformat())
     session_id = db.Column(db.String(100), default='__default__')
 
+    milestone_items = db.relationship(
+        'POAMMilestone', backref='poam_item', lazy='dynamic',
+        cascade='all, delete-orphan', order_by='POAMMilestone.position',
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -0,0 +1,26 @@
+from app.extensions import db
+
+
+class POAMMilestone(db.Model):
+    __tablename__ = 'poam_milestones'
+
+    id = db.Column(db.String(36), primary_key=True)
+    poam_id = db.Column(db.String(36), db.ForeignKey('poam_items.id'), nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
+    description = db.Column(db.Text)
+    status = db.Column(db.String(30), default='planned')
+    due_date = db.Column(db.String(30))
+    completed_at = db.Column(db.String(30))
+    session_id = db.Column(db.String(100), default='__default__', index=True)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'poam_id': self.poam_id,
+            'position': self.position,
+            'description': self.description,
+            'status': self.status,
+            'due_date': self.due_date,
+            'completed_at': self.completed_at,
+            'session_id': self.session_id,
+        }
@@ -0,0 +1,18 @@
+from app.extensions import db
+
+
+class SessionVersion(db.Model):
+    __tablename__ = 'session_versions'
+
+    session_id = db.Column(db.String(100), primary_key=True)
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.String(30))
+
+    def to_dict(self):
+        return {
+            'session_id': self.session_id,
+            'table_name': self.table_name,
+            'version': self.version,
+            'updated_at': self.updated_at,
+        }
@@ -0,0 +1,21 @@
+from app.extensions import db
+
+
+class User(db.Model):
+    __tablename__ = 'users'
+
+    id = db.Column(db.String(36), primary_key=True)
+    username = db.Column(db.String(100), unique=True, nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
+    role = db.Column(db.String(30), default='Analyst')
+    name = db.Column(db.String(200))
+    email = db.Column(db.String(200))
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'username': self.username,
+            'role': self.role,
+            'name': self.name,
+            'email': self.email,
+        }
@@ -0,0 +1,331 @@
+"""
+OpenAPI document and Swagger UI.
+
+flasgger is only imported when the spec actually has to be generated from the
+view docstrings. Production images run ``flask build-openapi`` at build time so
+``/apispec.json`` is served straight from a precomputed (and pre-gzipped) file;
+without that file the spec is generated on the first request and memoized for
+the life of the worker.
+"""
+import gzip
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+from flask import Blueprint, Response, current_app, request, send_from_directory
+
+
+SWAGGER_TEMPLATE = {
+    "info": {
+        "title": "Compliance Tracker Lite API",
+        "description": "API for the Compliance Tracker — NIST SP 800-171 control assessment, "
+                       "POA&M management, evidence tracking, system boundary mapping, and SPRS scoring.",
+        "version": "1.0.0",
+    },
+    "securityDefinitions": {
+        "Bearer": {
+            "type": "apiKey",
+            "name": "Authorization",
+            "in": "header",
+            "description": "JWT token. Enter: **Bearer {your-jwt-token}**"
+        }
+    },
+    "security": [{"Bearer": []}],
+    "basePath": "/",
+    "schemes": ["http", "https"],
+    "definitions": {
+        "Error": {
+            "type": "object",
+            "properties": {
+                "message": {"type": "string"}
+            }
+        },
+        "Framework": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string"},
+                "version": {"type": "string"},
+                "description": {"type": "string"},
+                "total_controls": {"type": "integer"},
+                "total_objectives": {"type": "integer"},
+                "session_id": {"type": "string"}
+            }
+        },
+        "ControlFamily": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "framework_id": {"type": "string"},
+                "family_code": {"type": "string"},
+                "name": {"type": "string"},
+                "description": {"type": "string"},
+                "control_count": {"type": "integer"},
+                "sort_order": {"type": "integer"},
+                "session_id": {"type": "string"}
+            }
+        },
+        "Control": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "family_id": {"type": "string"},
+                "control_number": {"type": "string"},
+                "title": {"type": "string"},
+                "requirement_text": {"type": "string"},
+                "plain_english": {"type": "string"},
+                "guidance_text": {"type": "string"},
+                "control_type": {"type": "string"},
+                "implementation_status": {"type": "string", "enum": [
+                    "implemented", "partially_implemented", "planned",
+                    "not_implemented", "not_applicable", "not_assessed"
+                ]},
+                "weight": {"type": "integer"},
+                "sprs_points_if_not_met": {"type": "integer"},
+                "implementation_notes": {"type": "string"},
+                "assessor_notes": {"type": "string"},
+                "last_assessed_date": {"type": "string"},
+                "assessed_by": {"type": "string"},
+                "sort_order": {"type": "integer"},
+                "session_id": {"type": "string"}
+            }
+        },
+        "AssessmentObjective": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "control_id": {"type": "string"},
+                "objective_number": {"type": "string"},
+                "objective_text": {"type": "string"},
+                "status": {"type": "string", "enum": [
+                    "implemented", "partially_implemented", "planned",
+                    "not_implemented", "not_applicable", "not_assessed"
+                ]},
+                "notes": {"type": "string"},
+                "session_id": {"type": "string"}
+            }
+        },
+        "Evidence": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "control_id": {"type": "string"},
+                "evidence_type": {"type": "string"},
+                "title": {"type": "string"},
+                "description": {"type": "string"},
+                "file_path": {"type": "string"},
+                "external_url": {"type": "string"},
+                "uploaded_at": {"type": "string"},
+                "uploaded_by": {"type": "string"},
+                "session_id": {"type": "string"}
+            }
+        },
+        "POAMItem": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "control_id": {"type": "string"},
+                "weakness_description": {"type": "string"},
+                "remediation_plan": {"type": "string"},
+                "risk_level": {"type": "string", "enum": ["critical", "high", "moderate", "low"]},
+                "responsible_person": {"type": "string"},
+                "responsible_team": {"type": "string"},
+                "planned_start_date": {"type": "string"},
+                "planned_completion_date": {"type": "string"},
+                "actual_completion_date": {"type": "string"},
+                "estimated_cost": {"type": "number"},
+                "cost_notes": {"type": "string"},
+                "status": {"type": "string", "enum": ["open", "in_progress", "completed", "cancelled"]},
+                "milestones": {"type": "string"},
+                "created_at": {"type": "string"},
+                "updated_at": {"type": "string"},
+                "session_id": {"type": "string"}
+            }
+        },
+        "POAMMilestone": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "poam_id": {"type": "string"},
+                "position": {"type": "integer"},
+                "description": {"type": "string"},
+                "status": {"type": "string", "enum": ["planned", "in_progress", "completed"]},
+                "due_date": {"type": "string"},
+                "completed_at": {"type": "string"},
+                "session_id": {"type": "string"}
+            }
+        },
+        "BoundaryAsset": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "boundary_name": {"type": "string"},
+                "asset_tracker_id": {"type": "string"},
+                "asset_name": {"type": "string"},
+                "asset_type": {"type": "string"},
+                "data_classification": {"type": "string"},
+                "in_scope": {"type": "integer"},
+                "notes": {"type": "string"},
+                "session_id": {"type": "string"}
+            }
+        }
+    }
+}
+
+SWAGGER_CONFIG = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": "apispec",
+            "route": "/apispec.json",
+            "rule_filter": lambda rule: rule.rule.startswith('/api/'),
+            "model_filter": lambda tag: True,
+        }
+    ],
+    "static_url_path": "/flasgger_static",
+    "swagger_ui": True,
+    "specs_route": "/apidocs/"
+}
+
+
+SWAGGER_UI_HTML = """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8">
+    <title>{title}</title>
+    <link rel="stylesheet" type="text/css" href="{static}/swagger-ui.css">
+    <link rel="icon" type="image/png" href="{static}/favicon-32x32.png">
+  </head>
+  <body>
+    <div id="swagger-ui"></div>
+    <script src="{static}/swagger-ui-bundle.js"></script>
+    <script src="{static}/swagger-ui-standalone-preset.js"></script>
+    <script>
+      window.ui = SwaggerUIBundle({{
+        url: "{spec_url}",
+        dom_id: "#swagger-ui",
+        deepLinking: true,
+        presets: [SwaggerUIBundle.presets.apis, SwaggerUIStandalonePreset],
+        layout: "StandaloneLayout"
+      }});
+    </script>
+  </body>
+</html>
+"""
+
+_lock = threading.Lock()
+
+
+def _swagger_static_folder():
+    """Locate flasgger's bundled Swagger UI assets without importing flasgger."""
+    spec = importlib.util.find_spec('flasgger')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(list(spec.submodule_search_locations)[0], 'ui3', 'static')
+
+
+def spec_path(app):
+    return app.config.get('OPENAPI_SPEC_PATH') or os.path.join(app.instance_path, 'apispec.json')
+
+
+def generate_spec(app):
+    """Build the OpenAPI document from the view docstrings (imports flasgger)."""
+    from flasgger import Swagger
+
+    swagger = Swagger(None, config=SWAGGER_CONFIG, template=SWAGGER_TEMPLATE)
+    swagger.app = app
+    with app.app_context():
+        return swagger.get_apispecs(SWAGGER_CONFIG['specs'][0]['endpoint'])
+
+
+def _package(body):
+    return {
+        'body': body,
+        'gzip': gzip.compress(body, compresslevel=9, mtime=0),
+        'etag': hashlib.sha1(body).hexdigest(),
+    }
+
+
+def build_spec_file(app, path=None):
+    """Write the spec and a gzipped copy next to it; returns the JSON path."""
+    path = path or spec_path(app)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    packaged = _package(json.dumps(generate_spec(app), sort_keys=True).encode('utf-8'))
+    with open(path, 'wb') as f:
+        f.write(packaged['body'])
+    with open(path + '.gz', 'wb') as f:
+        f.write(packaged['gzip'])
+    return path
+
+
+def load_spec(app):
+    """Return the memoized spec, reading the precomputed file or generating it once."""
+    state = app.extensions.setdefault('openapi', {})
+    if 'spec' in state:
+        return state['spec']
+
+    with _lock:
+        if 'spec' in state:
+            return state['spec']
+
+        path = spec_path(app)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                body = f.read()
+            packaged = _package(body) if not os.path.exists(path + '.gz') else None
+            if packaged is None:
+                with open(path + '.gz', 'rb') as f:
+                    packaged = {
+                        'body': body,
+                        'gzip': f.read(),
+                        'etag': hashlib.sha1(body).hexdigest(),
+                    }
+        else:
+            packaged = _package(json.dumps(generate_spec(app), sort_keys=True).encode('utf-8'))
+
+        state['spec'] = packaged
+        return packaged
+
+
+openapi_bp = Blueprint('openapi', __name__)
+
+
+@openapi_bp.route('/apispec.json', methods=['GET'])
+def apispec():
+    spec = load_spec(current_app)
+
+    if 'gzip' in request.accept_encodings:
+        response = Response(spec['gzip'], mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(spec['body'], mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(spec['etag'], weak=True)
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@openapi_bp.route('/apidocs/', methods=['GET'])
+def apidocs():
+    return Response(
+        SWAGGER_UI_HTML.format(
+            title=SWAGGER_TEMPLATE['info']['title'],
+            static=SWAGGER_CONFIG['static_url_path'],
+            spec_url=SWAGGER_CONFIG['specs'][0]['route'],
+        ),
+        mimetype='text/html',
+    )
+
+
+@openapi_bp.route(SWAGGER_CONFIG['static_url_path'] + '/<path:filename>', methods=['GET'])
+def swagger_static(filename):
+    folder = _swagger_static_folder()
+    if folder is None:
+        return Response('Swagger UI assets are not installed', status=404)
+    return send_from_directory(folder, filename)
+
+
+def register_openapi(app):
+    app.register_blueprint(openapi_bp)
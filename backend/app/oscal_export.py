@@ -0,0 +1,594 @@
+"""
+Export a session's assessment of one framework as OSCAL JSON.
+
+Two OSCAL models are produced:
+
+- ``ssp`` (System Security Plan): controls become implemented requirements
+  of a single ``this-system`` component, in-scope boundary assets become
+  inventory items, and evidence becomes back-matter resources linked from the
+  controls it supports.
+- ``assessment-results``: one result whose findings are the assessed
+  objectives (the control itself for controls without objectives), whose
+  observations are the evidence items, and whose risks are the POA&M items,
+  with their milestones as remediation tasks.
+
+Documents are written while they are read. A document is a skeleton of dicts
+whose large arrays are generators over ``yield_per`` queries; ``write_json``
+walks it and yields JSON text, and ``iter_document`` batches that text into
+byte chunks for a chunked response or a file. The per-control lists (a
+control's evidence, objectives and POA&M items) come from separate queries
+sorted the same way as the controls and are consumed in step with them, so
+memory use stays at one control's rows however large the session is.
+
+Element UUIDs are derived from row ids, so they are stable across exports.
+The document UUID is new on every export, as OSCAL expects of a new revision.
+Statuses that OSCAL has no value for (e.g. ``not_assessed``) are kept in
+props in the ``NS`` namespace.
+"""
+import json
+import re
+import uuid
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import chain, groupby
+from operator import itemgetter
+from app.api.rows import columns, fetch_dicts
+from app.extensions import db
+from app.models.framework import Framework
+from app.models.control_family import ControlFamily
+from app.models.control import Control
+from app.models.assessment_objective import AssessmentObjective
+from app.models.evidence import Evidence
+from app.models.poam import POAMItem
+from app.models.poam_milestone import POAMMilestone
+from app.models.boundary_asset import BoundaryAsset
+from app.seed import NAMESPACE
+from app.services.catalog import FrameworkCatalog
+from app.services.objective_rollup import ObjectiveRollup
+from app.services.versioning import SessionVersions
+
+OSCAL_VERSION = '1.1.2'
+NS = 'urn:compliance-tracker-lite:oscal'
+MODELS = ('ssp', 'assessment-results')
+TABLES = {
+    'ssp': ('frameworks', 'control_assessments', 'evidence', 'boundary_assets'),
+    'assessment-results': (
+        'frameworks', 'control_assessments', 'assessment_objectives', 'evidence', 'poam_items', 'poam_milestones',
+    ),
+}
+CHUNK_SIZE = 64 * 1024
+YIELD_PER = 500
+
+IMPLEMENTATION_STATES = {
+    'implemented': 'implemented',
+    'partially_implemented': 'partial',
+    'planned': 'planned',
+    'not_applicable': 'not-applicable',
+}
+# Finding status for controls assessed without objectives.
+CONTROL_FINDING_STATES = {
+    'implemented': 'satisfied',
+    'not_applicable': 'satisfied',
+    'partially_implemented': 'not-satisfied',
+    'planned': 'not-satisfied',
+    'not_implemented': 'not-satisfied',
+}
+RISK_STATES = {'open': 'open', 'in_progress': 'remediating', 'completed': 'closed', 'cancelled': 'closed'}
+
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+_EMPTY = object()
+# Leaf types, checked before the (slower) ABC check for iterators.
+_PLAIN = frozenset((str, int, float, bool, type(None), list))
+
+
+# -- streaming JSON -----------------------------------------------------------
+
+def _streamed(value):
+    """Whether ``value`` is or contains (through dicts) an iterator."""
+    kind = type(value)
+    if kind is dict:
+        return any(map(_streamed, value.values()))
+    return kind not in _PLAIN and isinstance(value, Iterator)
+
+
+def write_json(value):
+    """Yield ``value`` as compact JSON text.
+
+    Iterators (e.g. generators) are written as arrays while they are
+    consumed. An object member whose iterator yields nothing is left out,
+    since OSCAL arrays may not be empty.
+    """
+    if isinstance(value, Iterator):
+        yield '['
+        for i, item in enumerate(value):
+            if i:
+                yield ','
+            yield from write_json(item)
+        yield ']'
+    elif isinstance(value, dict) and _streamed(value):
+        yield '{'
+        first = True
+        for key, member in value.items():
+            if isinstance(member, Iterator):
+                head = next(member, _EMPTY)
+                if head is _EMPTY:
+                    continue
+                member = chain((head,), member)
+            yield f'{_encode(key)}:' if first else f',{_encode(key)}:'
+            first = False
+            yield from write_json(member)
+        yield '}'
+    else:
+        yield _encode(value)
+
+
+def iter_document(document, chunk_size=CHUNK_SIZE):
+    """``write_json(document)`` as UTF-8 byte chunks of about ``chunk_size`` bytes."""
+    parts, size = [], 0
+    for text in write_json(document):
+        parts.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            yield ''.join(parts).encode()
+            parts, size = [], 0
+    if parts:
+        yield ''.join(parts).encode()
+
+
+# -- identifiers and values ---------------------------------------------------
+
+def element_uuid(kind, key):
+    return str(uuid.uuid5(NAMESPACE, f'oscal/{kind}/{key}'))
+
+
+def _clean(text):
+    return re.sub(r'[^\w.\-]+', '', re.sub(r'[\[(]', '.', text.lower())).strip('.')
+
+
+def token(number):
+    """An OSCAL token for a control number (``AC-2(1)`` -> ``ac-2.1``, ``3.1.1`` -> ``_3.1.1``)."""
+    value = _clean(number)
+    return value if re.match(r'[^\W\d]', value) else f'_{value}'
+
+
+def objective_token(control_number, objective_number):
+    """``<control token>_obj.<part>`` for an objective (``3.1.1[a]`` -> ``_3.1.1_obj.a``)."""
+    if objective_number.startswith(control_number):
+        objective_number = objective_number[len(control_number):]
+    suffix = _clean(objective_number)
+    return f'{token(control_number)}_obj.{suffix}' if suffix else f'{token(control_number)}_obj'
+
+
+def timestamp(value, default=None):
+    """An ISO date-time with a UTC offset, as OSCAL requires (naive values are local time)."""
+    if not value:
+        return default
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return default
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed.isoformat()
+
+
+def _props(*props):
+    """``{name, value[, ns]}`` props for the ``(name, value, ns)`` triples with a value."""
+    return [
+        {'name': name, 'value': str(value), **({'ns': ns} if ns else {})}
+        for name, value, ns in props if value not in (None, '')
+    ]
+
+
+def _compact(d):
+    """``d`` without members that are None or empty lists (OSCAL rejects both)."""
+    return {key: value for key, value in d.items() if value is not None and value != []}
+
+
+# -- queries ------------------------------------------------------------------
+
+def session_framework(session_id, framework_id=None):
+    """The session's framework row as a dict, or None if there is none.
+
+    Without ``framework_id`` the session must have exactly one framework;
+    raises ValueError if it has several.
+    """
+    stmt = db.select(*columns(Framework)).where(Framework.session_id == session_id)
+    if framework_id:
+        stmt = stmt.where(Framework.id == framework_id)
+    rows = fetch_dicts(stmt.order_by(Framework.name).limit(2))
+    if framework_id is None and len(rows) > 1:
+        raise ValueError('Session has more than one framework; pass framework_id')
+    return rows[0] if rows else None
+
+
+def _in_framework(stmt, session_id, framework, *order_by):
+    """Restrict ``stmt`` (which must join ``Control``) to the framework, in control order."""
+    return stmt.join(ControlFamily, ControlFamily.id == Control.family_id).where(
+        Control.session_id == session_id,
+        ControlFamily.framework_id == framework['id'],
+    ).order_by(Control.sort_order, Control.id, *order_by)
+
+
+def _rows(stmt):
+    """Stream ``stmt``'s row mappings, fetching ``YIELD_PER`` at a time."""
+    yield from db.session.execute(stmt.execution_options(yield_per=YIELD_PER)).mappings()
+
+
+class _Grouped:
+    """Rows sorted like another stream, handed out one key at a time.
+
+    Every group's key must appear in the driving stream, in the same order;
+    ``take(key)`` returns the rows for ``key`` (or none) and moves on.
+    """
+
+    def __init__(self, rows, key='control_id'):
+        self._groups = groupby(rows, itemgetter(key))
+        self._head = next(self._groups, None)
+
+    def take(self, key):
+        if self._head is None or self._head[0] != key:
+            return []
+        rows = list(self._head[1])
+        self._head = next(self._groups, None)
+        return rows
+
+
+def _controls(session_id, framework, *fields):
+    return _rows(_in_framework(
+        db.select(Control.id, Control.control_number, *fields), session_id, framework,
+    ))
+
+
+def _control_evidence(session_id, framework, *fields):
+    return _rows(_in_framework(
+        db.select(Evidence.control_id, Evidence.id, *fields).join(Control, Control.id == Evidence.control_id),
+        session_id, framework, Evidence.uploaded_at, Evidence.id,
+    ))
+
+
+def _control_poam(session_id, framework, *fields):
+    return _rows(_in_framework(
+        db.select(POAMItem.control_id, POAMItem.id, *fields).join(Control, Control.id == POAMItem.control_id),
+        session_id, framework, POAMItem.id,
+    ))
+
+
+def _metadata(title, session_id, model):
+    versions = SessionVersions.get(session_id, TABLES[model])
+    modified = SessionVersions.last_modified(versions) or datetime.now()
+    return {
+        'title': title,
+        'last-modified': modified.astimezone().isoformat(),
+        # Sum of the write counters: goes up with every change to the data exported.
+        'version': str(sum(version for version, _ in versions.values())),
+        'oscal-version': OSCAL_VERSION,
+        'props': _props(('session-id', session_id, NS)),
+    }
+
+
+def _framework_title(framework):
+    name, version = framework['name'], framework['version']
+    return name if not version or name.endswith(version) else f'{name} {version}'
+
+
+# -- System Security Plan -----------------------------------------------------
+
+def _inventory_items(session_id):
+    for asset in _rows(db.select(*columns(BoundaryAsset)).where(
+        BoundaryAsset.session_id == session_id, BoundaryAsset.in_scope == 1,
+    ).order_by(BoundaryAsset.boundary_name, BoundaryAsset.asset_name, BoundaryAsset.id)):
+        yield _compact({
+            'uuid': element_uuid('inventory-item', asset['id']),
+            'description': asset['asset_name'] or asset['asset_tracker_id'] or 'Unnamed asset',
+            'props': _props(
+                ('asset-id', asset['asset_tracker_id'], None),
+                ('asset-type', asset['asset_type'], None),
+                ('data-classification', asset['data_classification'], NS),
+                ('boundary', asset['boundary_name'], NS),
+            ),
+            'remarks': asset['notes'],
+        })
+
+
+def _implemented_requirements(session_id, framework, component_uuid):
+    evidence = _Grouped(_control_evidence(session_id, framework))
+    for control in _controls(
+        session_id, framework, Control.implementation_status, Control.implementation_notes, Control.assessor_notes,
+    ):
+        status = control['implementation_status'] or 'not_assessed'
+        state = IMPLEMENTATION_STATES.get(status)
+        yield _compact({
+            'uuid': element_uuid('implemented-requirement', control['id']),
+            'control-id': token(control['control_number']),
+            'props': _props(('implementation-status', status, NS)),
+            'links': [
+                {'href': f"#{element_uuid('resource', e['id'])}", 'rel': 'evidence'}
+                for e in evidence.take(control['id'])
+            ],
+            'by-components': [_compact({
+                'component-uuid': component_uuid,
+                'uuid': element_uuid('by-component', control['id']),
+                'description': control['implementation_notes'] or 'No implementation statement recorded.',
+                'implementation-status': {'state': state} if state else None,
+            })],
+            'remarks': control['assessor_notes'],
+        })
+
+
+def _evidence_resources(session_id, framework):
+    for e in _control_evidence(
+        session_id, framework, Evidence.evidence_type, Evidence.title, Evidence.description,
+        Evidence.file_path, Evidence.external_url,
+    ):
+        href = e['external_url'] or e['file_path']
+        yield _compact({
+            'uuid': element_uuid('resource', e['id']),
+            'title': e['title'],
+            'description': e['description'],
+            'props': _props(('type', 'evidence', None), ('evidence-type', e['evidence_type'], NS)),
+            'rlinks': [{'href': href}] if href else None,
+        })
+
+
+def ssp_document(session_id, framework):
+    """The OSCAL System Security Plan skeleton for ``write_json``."""
+    title = _framework_title(framework)
+    system_key = f"{session_id}/{framework['id']}"
+    component_uuid = element_uuid('component', system_key)
+    profile_uuid = element_uuid('framework', framework['id'])
+
+    boundaries, classifications = {}, {}
+    for name, classification, count in db.session.execute(db.select(
+        BoundaryAsset.boundary_name, BoundaryAsset.data_classification, db.func.count(BoundaryAsset.id),
+    ).where(
+        BoundaryAsset.session_id == session_id, BoundaryAsset.in_scope == 1,
+    ).group_by(BoundaryAsset.boundary_name, BoundaryAsset.data_classification)):
+        if name:
+            boundaries[name] = boundaries.get(name, 0) + count
+        if classification:
+            classifications[classification] = classifications.get(classification, 0) + count
+    system_name = '; '.join(sorted(boundaries)) or f'{title} system'
+
+    return {'system-security-plan': {
+        'uuid': str(uuid.uuid4()),
+        'metadata': _metadata(f'{title} System Security Plan', session_id, 'ssp'),
+        'import-profile': {'href': f'#{profile_uuid}'},
+        'system-characteristics': {
+            'system-ids': [{'identifier-type': 'https://ietf.org/rfc/rfc4122', 'id': element_uuid('system', system_key)}],
+            'system-name': system_name,
+            'description': f'The system assessed against {title}.',
+            'system-information': {'information-types': [
+                {
+                    'uuid': element_uuid('information-type', f'{session_id}/{classification}'),
+                    'title': classification,
+                    'description': f'{classification} information on {count} in-scope asset(s).',
+                }
+                for classification, count in sorted(classifications.items())
+            ] or [{
+                'uuid': element_uuid('information-type', session_id),
+                'title': 'System information',
+                'description': 'No in-scope asset records a data classification.',
+            }]},
+            'status': {'state': 'operational'},
+            'authorization-boundary': {'description': '\n'.join(
+                f'{name}: {count} in-scope asset(s).' for name, count in sorted(boundaries.items())
+            ) or 'No in-scope boundary assets are recorded.'},
+        },
+        'system-implementation': {
+            'users': [{'uuid': element_uuid('user', system_key), 'title': 'System users'}],
+            'components': [{
+                'uuid': component_uuid,
+                'type': 'this-system',
+                'title': system_name,
+                'description': 'The system as a whole.',
+                'status': {'state': 'operational'},
+            }],
+            'inventory-items': _inventory_items(session_id),
+        },
+        'control-implementation': {
+            'description': f'Implementation of the {title} controls.',
+            'implemented-requirements': _implemented_requirements(session_id, framework, component_uuid),
+        },
+        'back-matter': {'resources': chain(
+            [_compact({'uuid': profile_uuid, 'title': title, 'description': framework['description']})],
+            _evidence_resources(session_id, framework),
+        )},
+    }}
+
+
+# -- Assessment Results -------------------------------------------------------
+
+def _observations(session_id, framework, now):
+    for e in _control_evidence(
+        session_id, framework, Evidence.evidence_type, Evidence.title, Evidence.description,
+        Evidence.file_path, Evidence.external_url, Evidence.uploaded_at, Evidence.uploaded_by,
+        Control.control_number,
+    ):
+        href = e['external_url'] or e['file_path']
+        yield _compact({
+            'uuid': element_uuid('observation', e['id']),
+            'title': e['title'],
+            'description': e['description'] or e['title'],
+            'props': _props(
+                ('control-number', e['control_number'], NS),
+                ('evidence-type', e['evidence_type'], NS),
+                ('uploaded-by', e['uploaded_by'], NS),
+            ),
+            'methods': ['EXAMINE'],
+            'relevant-evidence': [_compact({'href': href, 'description': e['title']})],
+            'collected': timestamp(e['uploaded_at'], now),
+        })
+
+
+def _task(milestone):
+    due = timestamp(milestone['due_date'])
+    return _compact({
+        'uuid': element_uuid('task', milestone['id']),
+        'type': 'milestone',
+        'title': milestone['description'] or f"Milestone {milestone['position'] + 1}",
+        'props': _props(('milestone-status', milestone['status'], NS)),
+        'timing': {'on-date': {'date': due}} if due else None,
+    })
+
+
+def _risks(session_id, framework):
+    milestones = _Grouped(_rows(_in_framework(
+        db.select(*columns(POAMMilestone))
+        .join(POAMItem, POAMItem.id == POAMMilestone.poam_id)
+        .join(Control, Control.id == POAMItem.control_id),
+        session_id, framework, POAMItem.id, POAMMilestone.position,
+    )), key='poam_id')
+    for p in _control_poam(
+        session_id, framework, *columns(POAMItem, (
+            'weakness_description', 'remediation_plan', 'risk_level', 'responsible_person', 'responsible_team',
+            'planned_completion_date', 'estimated_cost', 'status',
+        )), Control.control_number,
+    ):
+        status = p['status'] or 'open'
+        yield _compact({
+            'uuid': element_uuid('risk', p['id']),
+            'title': f"POA&M item for {p['control_number']}",
+            'description': p['weakness_description'] or f"Weakness in {p['control_number']}.",
+            'statement': f"{(p['risk_level'] or 'unrated').capitalize()} risk from a weakness in {p['control_number']}.",
+            'props': _props(
+                ('control-number', p['control_number'], NS),
+                ('risk-level', p['risk_level'], NS),
+                ('poam-status', status, NS),
+                ('responsible-person', p['responsible_person'], NS),
+                ('responsible-team', p['responsible_team'], NS),
+                ('estimated-cost', p['estimated_cost'], NS),
+            ),
+            'status': RISK_STATES.get(status, 'open'),
+            'deadline': timestamp(p['planned_completion_date']),
+            'remediations': [_compact({
+                'uuid': element_uuid('remediation', p['id']),
+                'lifecycle': 'completed' if RISK_STATES.get(status) == 'closed' else 'planned',
+                'title': 'Remediation plan',
+                'description': p['remediation_plan'] or 'No remediation plan recorded.',
+                'tasks': [_task(m) for m in milestones.take(p['id'])],
+            })],
+        })
+
+
+def _finding(kind, key, title, description, target, related, remarks):
+    return _compact({
+        'uuid': element_uuid(f'finding/{kind}', key),
+        'title': title,
+        'description': description,
+        'target': target,
+        **related,
+        'remarks': remarks,
+    })
+
+
+def _findings(session_id, framework):
+    objectives = _Grouped(_rows(_in_framework(
+        db.select(
+            AssessmentObjective.control_id, AssessmentObjective.id, AssessmentObjective.objective_number,
+            AssessmentObjective.objective_text, AssessmentObjective.status, AssessmentObjective.notes,
+        ).join(Control, Control.id == AssessmentObjective.control_id),
+        session_id, framework, AssessmentObjective.objective_number, AssessmentObjective.id,
+    )))
+    evidence = _Grouped(_control_evidence(session_id, framework))
+    poam = _Grouped(_control_poam(session_id, framework))
+
+    for control in _controls(
+        session_id, framework, Control.definition_id, Control.implementation_status, Control.assessor_notes,
+    ):
+        number = control['control_number']
+        status = control['implementation_status'] or 'not_assessed'
+        state = IMPLEMENTATION_STATES.get(status)
+        related = {
+            'related-observations': [
+                {'observation-uuid': element_uuid('observation', e['id'])} for e in evidence.take(control['id'])
+            ],
+            'related-risks': [{'risk-uuid': element_uuid('risk', p['id'])} for p in poam.take(control['id'])],
+        }
+        implementation = {
+            'implementation-status': {'state': state} if state else None,
+            'props': _props(('implementation-status', status, NS)),
+        }
+
+        control_objectives = objectives.take(control['id'])
+        for o in control_objectives:
+            if o['status'] in ObjectiveRollup.MET:
+                finding_state = 'satisfied'
+            elif o['status'] in ObjectiveRollup.NOT_MET:
+                finding_state = 'not-satisfied'
+            else:
+                continue
+            yield _finding('objective', o['id'], f"Objective {o['objective_number']}", o['objective_text'], _compact({
+                'type': 'objective-id',
+                'target-id': objective_token(number, o['objective_number']),
+                'status': {'state': finding_state},
+                **implementation,
+            }), related, o['notes'])
+
+        finding_state = CONTROL_FINDING_STATES.get(status)
+        if not control_objectives and finding_state:
+            definition = FrameworkCatalog.control(control['definition_id'])
+            yield _finding('control', control['id'], f'Control {number}', definition.title if definition else number, _compact({
+                'type': 'statement-id',
+                'target-id': f'{token(number)}_smt',
+                'status': {'state': finding_state},
+                **implementation,
+            }), related, control['assessor_notes'])
+
+
+def assessment_results_document(session_id, framework):
+    """The OSCAL Assessment Results skeleton for ``write_json``."""
+    title = _framework_title(framework)
+    key = f"{session_id}/{framework['id']}"
+    plan_uuid = element_uuid('assessment-plan', key)
+    now = datetime.now().astimezone().isoformat()
+    first, last = db.session.execute(_in_framework(
+        db.select(db.func.min(Control.last_assessed_date), db.func.max(Control.last_assessed_date)),
+        session_id, framework,
+    ).order_by(None)).one()
+
+    return {'assessment-results': {
+        'uuid': str(uuid.uuid4()),
+        'metadata': _metadata(f'{title} Assessment Results', session_id, 'assessment-results'),
+        'import-ap': {'href': f'#{plan_uuid}'},
+        # A one-item iterator, so the result's streamed members are written lazily.
+        'results': iter([_compact({
+            'uuid': element_uuid('result', key),
+            'title': f'Assessment of {title}',
+            'description': f'Objective and control statuses, evidence and POA&M items for {title}.',
+            'start': timestamp(first, now),
+            'end': timestamp(last),
+            'reviewed-controls': {'control-selections': [{'include-all': {}}]},
+            'observations': _observations(session_id, framework, now),
+            'risks': _risks(session_id, framework),
+            'findings': _findings(session_id, framework),
+        })]),
+        'back-matter': {'resources': [{
+            'uuid': plan_uuid,
+            'title': f'{title} assessment objectives',
+            'description': 'No separate OSCAL assessment plan; objectives are those of the framework.',
+        }]},
+    }}
+
+
+DOCUMENTS = {'ssp': ssp_document, 'assessment-results': assessment_results_document}
+
+
+def document(model, session_id, framework):
+    """The skeleton of an OSCAL ``model`` (one of ``MODELS``) for a session framework."""
+    return DOCUMENTS[model](session_id, framework)
+
+
+def export_oscal(f, model, session_id='__default__', framework_id=None):
+    """Write an OSCAL document to the binary file ``f``; returns the number of bytes written.
+
+    Raises ValueError if the framework cannot be resolved.
+    """
+    framework = session_framework(session_id, framework_id)
+    if framework is None:
+        raise ValueError('Framework not found')
+    size = 0
+    for chunk in iter_document(document(model, session_id, framework)):
+        f.write(chunk)
+        size += len(chunk)
+    return size
@@ -0,0 +1,272 @@
+"""
+Import a framework from an OSCAL catalog (JSON).
+
+``flask import-framework catalog.json`` streams the file with ijson instead
+of ``json.load``: the parser walks the token stream and only one control
+group (e.g. 800-53's Access Control family) is materialised at a time. Each
+group is mapped and bulk-inserted before the next is read:
+
+- catalog ``metadata`` -> ``Framework`` (``title`` / ``version``)
+- each top-level group -> a family (code from its ``label`` prop, else its id)
+- each control and control enhancement -> a control (number from its
+  ``label`` prop); ``statement`` parts become the requirement text and
+  ``guidance`` parts the guidance, with parameter insertions rendered as
+  ``[Assignment: ...]`` / ``[Selection: ...]``
+- the leaves of ``assessment-objective`` parts -> ``AssessmentObjective``
+
+Family and control text goes into the shared catalog tables, which is all
+an import writes by default (the framework can then be a crosswalk target).
+Each session named with ``--session-id`` also gets ``Framework``,
+``ControlFamily``, ``Control`` and ``AssessmentObjective`` rows that
+reference it, and counts the controls in its dashboard. OSCAL catalogs carry
+no SPRS weights, so imported controls have none and are not scored.
+Withdrawn controls are skipped. IDs are deterministic, so re-importing the
+same catalog is a no-op.
+"""
+import re
+import uuid
+import ijson
+from app.extensions import db
+from app.models.framework import Framework
+from app.models.family_definition import FamilyDefinition
+from app.models.control_definition import ControlDefinition
+from app.models.control_family import ControlFamily
+from app.models.control import Control
+from app.models.assessment_objective import AssessmentObjective
+from app.seed import NAMESPACE, bulk_upsert, make_definition_id, make_id
+from app.services.catalog import FrameworkCatalog
+from app.services.versioning import SessionVersions
+
+PARAM_INSERT = re.compile(r'\{\{\s*insert:\s*param,\s*([^\s}]+)\s*\}\}')
+
+
+def read_metadata(f):
+    """The catalog's ``metadata`` object (None if missing); stops reading once it is parsed."""
+    return next(ijson.items(f, 'catalog.metadata'), None)
+
+
+def iter_groups(f):
+    """Each top-level ``catalog.groups`` item, built one at a time by ijson's C backend."""
+    return ijson.items(f, 'catalog.groups.item', use_float=True)
+
+
+def prop(item, name):
+    return next((p.get('value') for p in item.get('props', ()) if p.get('name') == name), None)
+
+
+def render_param(param):
+    if param is None:
+        return '[Assignment: organization-defined value]'
+    select = param.get('select')
+    if select:
+        how = ' (one or more)' if select.get('how-many') == 'one-or-more' else ''
+        return f"[Selection{how}: {'; '.join(select.get('choice', ()))}]"
+    return f"[Assignment: {param.get('label') or param['id']}]"
+
+
+def prose(part, params):
+    """Flatten a part and its sub-parts into text, labels first."""
+    text = PARAM_INSERT.sub(lambda m: render_param(params.get(m.group(1))), part.get('prose', ''))
+    label = prop(part, 'label')
+    lines = [f'{label} {text}'.strip() if label else text] if (text or label) else []
+    for child in part.get('parts', ()):
+        lines.extend(prose(child, params))
+    return [line for line in lines if line]
+
+
+def objectives(part, params):
+    """``(number, text)`` for each leaf of an assessment-objective part."""
+    children = [p for p in part.get('parts', ()) if p.get('name') == 'assessment-objective']
+    if not children:
+        # The label is the objective number, so it is not repeated in the text.
+        text = '\n'.join(prose({**part, 'props': ()}, params))
+        return [(prop(part, 'label') or part.get('id'), text)] if text else []
+    return [objective for child in children for objective in objectives(child, params)]
+
+
+def walk_controls(controls, params=None, enhancement=False):
+    """``(control, params in scope, is_enhancement)`` for controls and their enhancements, depth first."""
+    for control in controls:
+        if prop(control, 'status') == 'withdrawn':
+            continue
+        scope = {**(params or {}), **{p['id']: p for p in control.get('params', ())}}
+        yield control, scope, enhancement
+        yield from walk_controls(control.get('controls', ()), scope, enhancement=True)
+
+
+def map_group(group):
+    """Map one OSCAL group to ``(family, [control dicts])`` in catalog terms."""
+    family_code = prop(group, 'label') or group['id'].upper()
+    controls = []
+    pending = [group]
+    while pending:
+        node = pending.pop(0)
+        pending.extend(node.get('groups', ()))
+        for control, params, enhancement in walk_controls(node.get('controls', ())):
+            parts = {}
+            for part in control.get('parts', ()):
+                parts.setdefault(part.get('name'), []).append(part)
+            controls.append({
+                'family_code': family_code,
+                'control_number': prop(control, 'label') or control['id'],
+                'title': control.get('title') or control['id'],
+                'requirement_text': '\n'.join(
+                    line for part in parts.get('statement', ()) for line in prose(part, params)
+                ) or None,
+                'guidance_text': '\n\n'.join(
+                    '\n'.join(prose(part, params)) for part in parts.get('guidance', ())
+                ) or None,
+                'control_type': 'enhancement' if enhancement else 'base',
+                'objectives': [
+                    objective for part in parts.get('assessment-objective', ())
+                    for objective in objectives(part, params)
+                ],
+            })
+    family = {
+        'family_code': family_code,
+        'name': group.get('title') or family_code,
+        'control_count': len(controls),
+    }
+    return family, controls
+
+
+def framework_key(name, version):
+    return str(uuid.uuid5(NAMESPACE, f'oscal/{name}/{version}'))
+
+
+class CatalogImport:
+    """Writes one streamed catalog's rows, group by group."""
+
+    def __init__(self, session_ids=(), name=None, version=None):
+        self.session_ids = list(session_ids)
+        self.name, self.version = name, version
+        self.key = None
+        self.families = self.controls = self.objectives = 0
+
+    def start(self, metadata):
+        if metadata is None and not self.name:
+            raise ValueError('Not an OSCAL catalog: no catalog metadata found')
+        metadata = metadata or {}
+        self.name = self.name or metadata.get('title')
+        self.version = self.version or metadata.get('version')
+        if not self.name:
+            raise ValueError('Catalog has no metadata title; pass --name')
+        self.key = framework_key(self.name, self.version)
+        bulk_upsert(Framework, [
+            {
+                'id': make_id(self.key, session_id),
+                'name': self.name,
+                'version': self.version,
+                'description': metadata.get('remarks'),
+                'session_id': session_id,
+            }
+            for session_id in self.session_ids
+        ])
+
+    def add_group(self, group):
+        family, controls = map_group(group)
+        code = family['family_code']
+        if len(code) > ControlFamily.family_code.type.length:
+            raise ValueError(f'Family code too long: {code}')
+        for control in controls:
+            if len(control['control_number']) > Control.control_number.type.length:
+                raise ValueError(f"Control number too long: {control['control_number']}")
+        self.families += 1
+        catalog = (self.name, self.version)
+        family_definition_id = make_definition_id('family', *catalog, code)
+        rows = {model: [] for model in (FamilyDefinition, ControlDefinition, ControlFamily, Control, AssessmentObjective)}
+        rows[FamilyDefinition].append({
+            'id': family_definition_id,
+            'framework_name': self.name,
+            'framework_version': self.version,
+            'sort_order': self.families,
+            **family,
+        })
+        for control in controls:
+            number = control['control_number']
+            rows[ControlDefinition].append({
+                'id': make_definition_id('control', *catalog, number),
+                'framework_name': self.name,
+                'framework_version': self.version,
+                'plain_english': None,
+                'weight': None,
+                'sprs_points_if_not_met': None,
+                **{k: v for k, v in control.items() if k != 'objectives'},
+            })
+
+        for session_id in self.session_ids:
+            def sid(name):
+                return make_id(f'{self.key}/{name}', session_id)
+
+            family_id = sid(f'family-{code}')
+            rows[ControlFamily].append({
+                'id': family_id,
+                'framework_id': make_id(self.key, session_id),
+                'definition_id': family_definition_id,
+                'family_code': code,
+                'name': family['name'],
+                'control_count': family['control_count'],
+                'sort_order': self.families,
+                'session_id': session_id,
+            })
+            for sort_order, control in enumerate(controls, start=self.controls + 1):
+                number = control['control_number']
+                control_id = sid(f'control-{number}')
+                rows[Control].append({
+                    'id': control_id,
+                    'family_id': family_id,
+                    'definition_id': make_definition_id('control', *catalog, number),
+                    'control_number': number,
+                    'implementation_status': 'not_assessed',
+                    'sort_order': sort_order,
+                    'session_id': session_id,
+                })
+                rows[AssessmentObjective].extend({
+                    'id': sid(f'objective-{number}-{objective_number}'),
+                    'control_id': control_id,
+                    'objective_number': objective_number,
+                    'objective_text': text,
+                    'status': 'not_assessed',
+                    'session_id': session_id,
+                } for objective_number, text in control['objectives'])
+
+        for model, model_rows in rows.items():
+            bulk_upsert(model, model_rows)
+        self.controls += len(controls)
+        self.objectives += sum(len(c['objectives']) for c in controls)
+
+    def finish(self):
+        db.session.execute(db.update(Framework).where(
+            Framework.id.in_([make_id(self.key, session_id) for session_id in self.session_ids])
+        ).values(total_controls=self.controls, total_objectives=self.objectives))
+        tables = [model.__tablename__ for model in (Framework, ControlFamily, Control, AssessmentObjective)]
+        for session_id in self.session_ids:
+            SessionVersions.bump(session_id, tables)
+        FrameworkCatalog.changed()
+
+
+def import_catalog(path, session_ids=(), name=None, version=None):
+    """Stream an OSCAL catalog file into the catalog (and ``session_ids``) and commit.
+
+    Returns ``{'name', 'version', 'families', 'controls', 'objectives'}``.
+    Raises ValueError for catalogs that cannot be mapped.
+    """
+    job = CatalogImport(session_ids, name=name, version=version)
+    with open(path, 'rb') as f:
+        # Metadata comes first in NIST's catalogs, so this pass reads little.
+        job.start(read_metadata(f))
+        f.seek(0)
+        for group in iter_groups(f):
+            job.add_group(group)
+    if not job.families:
+        raise ValueError('Not an OSCAL catalog: no control groups found')
+    job.finish()
+    db.session.commit()
+    FrameworkCatalog.clear()
+    return {
+        'name': job.name,
+        'version': job.version,
+        'families': job.families,
+        'controls': job.controls,
+        'objectives': job.objectives,
+    }
@@ -0,0 +1,207 @@
+"""
+On-demand request profiling.
+
+An admin (JWT ``role`` claim ``Admin``) can add ``?__profile=1`` to any request
+to run it under ``cProfile``, or ``?__profile=sample`` to run it under a
+wall-clock sampling profiler. The profile is written to ``PROFILE_DIR``
+(``.pstats`` for cProfile, speedscope JSON for samples) and named in the
+``X-Profile-Id`` response header; ``/api/admin/profiles`` lists and serves
+stored profiles. Adding ``__profile_inline=1`` returns the profile itself
+instead of the normal response body (a pstats text report or the speedscope
+document).
+
+The switch is silently ignored for everyone else, so the parameter cannot be
+used to probe for admin tokens.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from flask import Response, current_app, g, request
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+
+
+class SamplingProfiler:
+    """Periodically captures the stack of one thread; exports speedscope JSON."""
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.frames = []
+        self._frame_index = {}
+        self.samples = []
+        self.weights = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.ended = time.perf_counter()
+
+    def _frame_id(self, code):
+        key = (code.co_filename, code.co_name, code.co_firstlineno)
+        if key not in self._frame_index:
+            self._frame_index[key] = len(self.frames)
+            self.frames.append({
+                'name': code.co_name, 'file': code.co_filename, 'line': code.co_firstlineno,
+            })
+        return self._frame_index[key]
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_id(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append(stack)
+            self.weights.append(now - last)
+            last = now
+
+    def to_speedscope(self, name):
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': self.frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': self.ended - self.started,
+                'samples': self.samples,
+                'weights': self.weights,
+            }],
+            'name': name,
+            'exporter': 'compliance-tracker-lite',
+        }
+
+
+def profile_dir(app=None):
+    app = app or current_app
+    return app.config.get('PROFILE_DIR') or os.path.join(app.instance_path, 'profiles')
+
+
+def list_profiles(app=None):
+    directory = profile_dir(app)
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in sorted(os.listdir(directory), reverse=True):
+        path = os.path.join(directory, name)
+        profiles.append({
+            'id': name,
+            'size': os.path.getsize(path),
+            'created_at': datetime.fromtimestamp(os.path.getmtime(path)).isoformat(),
+        })
+    return profiles
+
+
+def _is_admin():
+    try:
+        verify_jwt_in_request(optional=True)
+        return (get_jwt() or {}).get('role') == 'Admin'
+    except Exception:  # noqa: BLE001 - bad tokens simply mean "no profiling"
+        return False
+
+
+def _requested_mode():
+    value = request.args.get('__profile')
+    if not value or value in ('0', 'false'):
+        return None
+    return 'sample' if value == 'sample' else 'cprofile'
+
+
+def _before_request():
+    mode = _requested_mode()
+    if mode is None or not _is_admin():
+        return
+    if mode == 'sample':
+        profiler = SamplingProfiler(
+            threading.get_ident(), current_app.config.get('PROFILE_SAMPLE_INTERVAL', 0.001)
+        )
+        profiler.start()
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    g.profiler = (mode, profiler)
+
+
+def _prune(directory, keep):
+    names = sorted(os.listdir(directory))
+    for name in names[:max(len(names) - keep, 0)]:
+        os.remove(os.path.join(directory, name))
+
+
+def _after_request(response):
+    active = g.pop('profiler', None)
+    if active is None:
+        return response
+    mode, profiler = active
+
+    endpoint = request.url_rule.rule if request.url_rule else request.path
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', endpoint).strip('-') or 'root'
+    profile_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{slug}-{uuid.uuid4().hex[:8]}"
+    title = f'{request.method} {request.full_path}'
+
+    directory = profile_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    if mode == 'sample':
+        profiler.stop()
+        document = profiler.to_speedscope(title)
+        profile_id += '.speedscope.json'
+        with open(os.path.join(directory, profile_id), 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+        inline = Response(json.dumps(document), mimetype='application/json')
+    else:
+        profiler.disable()
+        profile_id += '.pstats'
+        profiler.dump_stats(os.path.join(directory, profile_id))
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(
+            current_app.config.get('PROFILE_REPORT_LINES', 60)
+        )
+        inline = Response(f'{title}\n{report.getvalue()}', mimetype='text/plain')
+
+    _prune(directory, current_app.config.get('PROFILE_MAX_FILES', 50))
+
+    if request.args.get('__profile_inline') in ('1', 'true'):
+        response = inline
+    response.headers['X-Profile-Id'] = profile_id
+    return response
+
+
+def _teardown_request(exc):
+    # after_request is skipped on unhandled errors; never leave a profiler running.
+    active = g.pop('profiler', None)
+    if active is not None:
+        mode, profiler = active
+        if mode == 'sample':
+            profiler.stop()
+        else:
+            profiler.disable()
+
+
+def register_profiling(app):
+    if not app.config.get('PROFILING_ENABLED', True):
+        return
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
@@ -1,3 +1,9 @@
 from app.services.sprs_calculator import SPRSCalculator
+from app.services.milestone_tracker import MilestoneTracker
+from app.services.versioning import SessionVersions
+from app.services.cost_forecaster import CostForecaster
+from app.services.objective_rollup import ObjectiveRollup
+from app.services.catalog import FrameworkCatalog
+from app.services.crosswalk import Crosswalk
 
-__all__ = ['SPRSCalculator']
+__all__ = ['SPRSCalculator', 'MilestoneTracker', 'SessionVersions', 'CostForecaster', 'ObjectiveRollup', 'FrameworkCatalog', 'Crosswalk']
@@ -0,0 +1,44 @@
+import threading
+from collections import OrderedDict
+
+
+class VersionedCache:
+    """
+    Small in-process LRU cache whose entries are validated by a version token.
+
+    Entries are stored as ``key -> (token, value)``; a lookup with a different
+    token (see ``SessionVersions.token``) is a miss and recomputes the value.
+    Because the token comes from the database, every gunicorn worker agrees on
+    when an entry is stale even though each keeps its own copy.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, token):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != token:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, token, value):
+        with self._lock:
+            self._entries[key] = (token, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, token, compute):
+        value = self.get(key, token)
+        if value is None:
+            value = compute()
+            self.set(key, token, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
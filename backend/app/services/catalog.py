@@ -0,0 +1,283 @@
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from flask import current_app
+from app.extensions import db
+from app.models.framework import Framework
+from app.models.control import Control
+from app.models.control_family import ControlFamily
+from app.models.family_definition import FamilyDefinition
+from app.models.control_definition import ControlDefinition
+from app.services.versioning import SessionVersions
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogControl:
+    id: str
+    family_code: str
+    control_number: str
+    title: str
+    requirement_text: str
+    plain_english: str
+    guidance_text: str
+    control_type: str
+    weight: int
+    sprs_points_if_not_met: int
+
+    def to_dict(self):
+        return {
+            'control_number': self.control_number,
+            'title': self.title,
+            'requirement_text': self.requirement_text,
+            'plain_english': self.plain_english,
+            'guidance_text': self.guidance_text,
+            'control_type': self.control_type,
+            'weight': self.weight,
+            'sprs_points_if_not_met': self.sprs_points_if_not_met,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogFamily:
+    id: str
+    family_code: str
+    name: str
+    description: str
+    control_count: int
+    sort_order: int
+
+    def to_dict(self):
+        return {
+            'family_code': self.family_code,
+            'name': self.name,
+            'description': self.description,
+            'control_count': self.control_count,
+            'sort_order': self.sort_order,
+        }
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CatalogFramework:
+    name: str
+    version: str
+    description: str
+    total_controls: int
+    total_objectives: int
+    families: MappingProxyType   # family_code -> CatalogFamily
+    controls: MappingProxyType   # control_number -> CatalogControl
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'version': self.version,
+            'description': self.description,
+            'total_controls': self.total_controls,
+            'total_objectives': self.total_objectives,
+        }
+
+
+class FrameworkCatalog:
+    """
+    Per-worker, read-only copy of every framework definition.
+
+    Control and family text is stored once per framework in
+    ``control_definitions`` / ``family_definitions``; session rows only
+    reference it. The catalog loads those tables (and each framework's
+    description, from one representative session) once into frozen slotted
+    objects, so views select ids and assessment columns per session and
+    take the text from memory. Definitions are identified by framework
+    ``(name, version)``.
+
+    A lookup that misses reloads the catalog only if the global write
+    counters of ``TABLES`` moved since it was loaded, so frameworks imported
+    after the worker started are picked up while unknown keys (e.g. ids from
+    client input) cost one counter read. Writers of those tables must call
+    ``changed()``. Definitions are not expected to change once loaded;
+    ``clear()`` drops the copy (the seed loader calls it after overwriting
+    rows).
+    """
+
+    CONTROL_FIELDS = tuple(CatalogControl.__slots__)
+    FAMILY_FIELDS = tuple(CatalogFamily.__slots__)
+    FRAMEWORK_FIELDS = ('name', 'version', 'description', 'total_controls', 'total_objectives')
+    TABLES = ('frameworks', 'family_definitions', 'control_definitions')
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _state():
+        return current_app.extensions.setdefault('framework_catalog', {})
+
+    @staticmethod
+    def load():
+        """Read the catalog tables.
+
+        Returns ``{'definitions': {(name, version): CatalogFramework},
+        'by_id': {framework row id: CatalogFramework}, 'controls': {id:
+        CatalogControl}, 'families': {id: CatalogFamily}, 'version': the
+        ``version()`` read before loading}``.
+        """
+        catalog_version = FrameworkCatalog.version()
+        keys = db.session.execute(db.select(Framework.id, Framework.name, Framework.version)).all()
+        representatives = {}
+        for framework_id, name, version in keys:
+            representatives.setdefault((name, version), framework_id)
+
+        families, families_by_id = {}, {}
+        for row in db.session.execute(db.select(
+            FamilyDefinition.framework_name, FamilyDefinition.framework_version,
+            *(getattr(FamilyDefinition, f) for f in FrameworkCatalog.FAMILY_FIELDS),
+        )):
+            family = CatalogFamily(*row[2:])
+            families.setdefault(tuple(row[:2]), {})[family.family_code] = family
+            families_by_id[family.id] = family
+
+        controls, controls_by_id = {}, {}
+        for row in db.session.execute(db.select(
+            ControlDefinition.framework_name, ControlDefinition.framework_version,
+            *(getattr(ControlDefinition, f) for f in FrameworkCatalog.CONTROL_FIELDS),
+        )):
+            control = CatalogControl(*row[2:])
+            controls.setdefault(tuple(row[:2]), {})[control.control_number] = control
+            controls_by_id[control.id] = control
+
+        definitions = {}
+        for row in db.session.execute(
+            db.select(*(getattr(Framework, f) for f in FrameworkCatalog.FRAMEWORK_FIELDS))
+            .where(Framework.id.in_(list(representatives.values())))
+        ):
+            key = (row.name, row.version)
+            definitions[key] = CatalogFramework(
+                *row,
+                families=MappingProxyType(families.get(key, {})),
+                controls=MappingProxyType(controls.get(key, {})),
+            )
+
+        # Frameworks no session uses (e.g. crosswalk targets) still get an entry.
+        for key in controls.keys() | families.keys():
+            if key not in definitions:
+                definitions[key] = CatalogFramework(
+                    *key, description=None, total_controls=len(controls.get(key, {})), total_objectives=None,
+                    families=MappingProxyType(families.get(key, {})),
+                    controls=MappingProxyType(controls.get(key, {})),
+                )
+
+        return {
+            'definitions': definitions,
+            'by_id': {framework_id: definitions[(name, version)] for framework_id, name, version in keys},
+            'controls': controls_by_id,
+            'families': families_by_id,
+            'version': catalog_version,
+        }
+
+    @staticmethod
+    def version():
+        """Validator of the catalog tables (see ``changed()``)."""
+        return SessionVersions.token(SessionVersions.GLOBAL, FrameworkCatalog.TABLES)
+
+    @staticmethod
+    def changed(connection=None):
+        """Record a write to the catalog tables so every worker reloads on its next miss."""
+        SessionVersions.bump(SessionVersions.GLOBAL, FrameworkCatalog.TABLES, connection=connection)
+
+    @staticmethod
+    def _index(index):
+        """One of ``load()``'s mappings, loading the catalog if needed."""
+        state = FrameworkCatalog._state()
+        if state.get('catalog') is None:
+            with FrameworkCatalog._lock:
+                if state.get('catalog') is None:
+                    state['catalog'] = FrameworkCatalog.load()
+        return state['catalog'][index]
+
+    @staticmethod
+    def _lookup(index, key):
+        state = FrameworkCatalog._state()
+        loaded = state.get('catalog')
+        if loaded is not None and (key in loaded[index] or loaded['version'] == FrameworkCatalog.version()):
+            return loaded[index].get(key)
+        with FrameworkCatalog._lock:
+            # Another thread may have reloaded while we waited.
+            if state.get('catalog') is loaded:
+                state['catalog'] = FrameworkCatalog.load()
+            loaded = state['catalog']
+        return loaded[index].get(key)
+
+    @staticmethod
+    def get(name, version):
+        """The ``CatalogFramework`` for ``(name, version)``, or None if it is not in the catalog."""
+        return FrameworkCatalog._lookup('definitions', (name, version))
+
+    @staticmethod
+    def versions(name):
+        """Versions of framework ``name`` in the catalog (reloading once if there are none)."""
+        found = [v for n, v in FrameworkCatalog._index('definitions') if n == name]
+        if not found and FrameworkCatalog.get(name, None) is None:
+            found = [v for n, v in FrameworkCatalog._index('definitions') if n == name]
+        return found
+
+    @staticmethod
+    def for_framework(framework_id):
+        """The ``CatalogFramework`` of a session's framework row, or None."""
+        return FrameworkCatalog._lookup('by_id', framework_id)
+
+    @staticmethod
+    def control(definition_id):
+        return FrameworkCatalog._lookup('controls', definition_id)
+
+    @staticmethod
+    def family(definition_id):
+        return FrameworkCatalog._lookup('families', definition_id)
+
+    @staticmethod
+    def text_fields(fields=None):
+        """Control fields served only from the catalog (those in ``fields``, if given)."""
+        return [f for f in Control.CATALOG_FIELDS if fields is None or f in fields]
+
+    @staticmethod
+    def control_columns(prefix=''):
+        """The column ``fill_controls`` keys on; select it with ``definition_id`` excluded."""
+        return [Control.definition_id.label(prefix + 'catalog_definition_id')]
+
+    @staticmethod
+    def family_columns(prefix=''):
+        """The column ``fill_families`` keys on; select it with ``definition_id`` excluded."""
+        return [ControlFamily.definition_id.label(prefix + 'catalog_definition_id')]
+
+    @staticmethod
+    def fill_controls(rows, fields=None):
+        """Add catalog text to control dicts in place.
+
+        Catalog-only fields are set; the per-session override fields fall
+        back to the catalog text when NULL.
+        """
+        wanted = FrameworkCatalog.text_fields(fields)
+        index = FrameworkCatalog._index('controls')
+        for row in rows:
+            definition_id = row.pop('catalog_definition_id')
+            control = index.get(definition_id) or FrameworkCatalog.control(definition_id)
+            for field in wanted:
+                row[field] = getattr(control, field) if control else None
+            for field in Control.OVERRIDE_FIELDS:
+                if field in row and row[field] is None and control:
+                    row[field] = getattr(control, field)
+        return rows
+
+    @staticmethod
+    def fill_families(rows):
+        """Add the catalog ``description`` to family dicts in place."""
+        index = FrameworkCatalog._index('families')
+        for row in rows:
+            definition_id = row.pop('catalog_definition_id')
+            family = index.get(definition_id) or FrameworkCatalog.family(definition_id)
+            row['description'] = family.description if family else None
+        return rows
+
+    @staticmethod
+    def warm():
+        """Load the catalog now rather than on the first request that needs it."""
+        FrameworkCatalog._state()['catalog'] = FrameworkCatalog.load()
+
+    @staticmethod
+    def clear():
+        FrameworkCatalog._state().pop('catalog', None)
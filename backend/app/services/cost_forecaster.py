@@ -0,0 +1,202 @@
+from datetime import date
+from sqlalchemy import case, func, or_
+from app.extensions import db
+from app.models.control import Control
+from app.models.control_family import ControlFamily
+from app.models.poam import POAMItem
+from app.services.cache import VersionedCache
+from app.services.versioning import SessionVersions
+
+
+class CostForecaster:
+    """
+    POA&M cost rollup and monthly spend forecast.
+
+    All totals are SQL aggregates over ``poam_items``; cancelled items are
+    excluded. ``remaining_cost`` counts items that are still open or in
+    progress. For the monthly forecast each item's ``estimated_cost`` is spread
+    evenly across the months from ``planned_start_date`` to
+    ``planned_completion_date`` (inclusive); items are grouped by their
+    start/end month pair in SQL first, so the Python side only walks distinct
+    date ranges rather than individual items. Items whose dates are not ISO
+    dates (e.g. ``TBD``) are counted as unscheduled; a planned span longer
+    than ``MAX_MONTHS`` is rejected with ValueError.
+    """
+
+    # Everything the rollup reads (by_family joins controls and families).
+    VERSION_TABLES = ('poam_items', 'control_assessments', 'control_families')
+    REMAINING_STATUSES = ('open', 'in_progress')
+    MAX_MONTHS = 120
+
+    _cache = VersionedCache(max_entries=128)
+
+    @staticmethod
+    def _parse_month(value):
+        """``(year, month)`` for a ``YYYY-MM`` prefix, or None if it is not a valid month."""
+        if not value:
+            return None
+        try:
+            parsed = date.fromisoformat(f'{value}-01')
+        except ValueError:
+            return None
+        return parsed.year, parsed.month
+
+    @staticmethod
+    def _month_range(start, end):
+        """Inclusive list of ``YYYY-MM`` strings between two ``(year, month)`` pairs.
+
+        Raises ValueError if the range is longer than ``MAX_MONTHS``.
+        """
+        (year, month), (end_year, end_month) = start, end
+        if (end_year - year) * 12 + end_month - month >= CostForecaster.MAX_MONTHS:
+            raise ValueError(
+                f'Planned dates {year:04d}-{month:02d} to {end_year:04d}-{end_month:02d} span more than '
+                f'{CostForecaster.MAX_MONTHS // 12} years'
+            )
+        months = []
+        while (year, month) <= (end_year, end_month):
+            months.append(f'{year:04d}-{month:02d}')
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
+        return months
+
+    @staticmethod
+    def _base(session_id):
+        return db.session.query().select_from(POAMItem).filter(
+            POAMItem.session_id == session_id,
+            or_(POAMItem.status.is_(None), POAMItem.status != 'cancelled'),
+        )
+
+    @staticmethod
+    def _aggregates():
+        cost = func.coalesce(POAMItem.estimated_cost, 0.0)
+        remaining = case((POAMItem.status.in_(CostForecaster.REMAINING_STATUSES), cost), else_=0.0)
+        return (
+            func.count(POAMItem.id),
+            func.sum(cost),
+            func.sum(remaining),
+            func.sum(case((POAMItem.estimated_cost.is_(None), 1), else_=0)),
+        )
+
+    @staticmethod
+    def _grouped(query, column, key):
+        results = []
+        rows = query.with_entities(column, *CostForecaster._aggregates()).group_by(
+            column
+        ).order_by(func.sum(func.coalesce(POAMItem.estimated_cost, 0.0)).desc()).all()
+        for value, items, estimated, remaining, unestimated in rows:
+            results.append({
+                key: value,
+                'items': items,
+                'estimated_cost': round(estimated or 0.0, 2),
+                'remaining_cost': round(remaining or 0.0, 2),
+                'unestimated_items': unestimated or 0,
+            })
+        return results
+
+    @staticmethod
+    def forecast_by_month(session_id='__default__'):
+        """Spread each item's cost across its planned months.
+
+        Raises ValueError if an item's planned dates span more than ``MAX_MONTHS``.
+        """
+        start = func.substr(
+            func.coalesce(POAMItem.planned_start_date, POAMItem.planned_completion_date), 1, 7
+        )
+        end = func.substr(
+            func.coalesce(POAMItem.planned_completion_date, POAMItem.planned_start_date), 1, 7
+        )
+        cost = func.coalesce(POAMItem.estimated_cost, 0.0)
+        remaining = case((POAMItem.status.in_(CostForecaster.REMAINING_STATUSES), cost), else_=0.0)
+
+        rows = CostForecaster._base(session_id).with_entities(
+            start, end, func.count(POAMItem.id), func.sum(cost), func.sum(remaining),
+        ).group_by(start, end).all()
+
+        months = {}
+        unscheduled = {'items': 0, 'estimated_cost': 0.0, 'remaining_cost': 0.0}
+        for start_month, end_month, items, estimated, remaining_cost in rows:
+            # Like the SQL coalesce: an unparseable date falls back to the other one.
+            start_month = CostForecaster._parse_month(start_month)
+            end_month = CostForecaster._parse_month(end_month)
+            start_month, end_month = start_month or end_month, end_month or start_month
+            if not start_month:
+                unscheduled['items'] += items
+                unscheduled['estimated_cost'] += estimated or 0.0
+                unscheduled['remaining_cost'] += remaining_cost or 0.0
+                continue
+            if end_month < start_month:
+                start_month, end_month = end_month, start_month
+            span = CostForecaster._month_range(start_month, end_month)
+            for month in span:
+                bucket = months.setdefault(month, {'estimated_cost': 0.0, 'remaining_cost': 0.0})
+                bucket['estimated_cost'] += (estimated or 0.0) / len(span)
+                bucket['remaining_cost'] += (remaining_cost or 0.0) / len(span)
+
+        forecast = []
+        cumulative = 0.0
+        for month in sorted(months):
+            cumulative += months[month]['estimated_cost']
+            forecast.append({
+                'month': month,
+                'estimated_cost': round(months[month]['estimated_cost'], 2),
+                'remaining_cost': round(months[month]['remaining_cost'], 2),
+                'cumulative_cost': round(cumulative, 2),
+            })
+
+        unscheduled['estimated_cost'] = round(unscheduled['estimated_cost'], 2)
+        unscheduled['remaining_cost'] = round(unscheduled['remaining_cost'], 2)
+        return forecast, unscheduled
+
+    @staticmethod
+    def compute_rollup(session_id='__default__'):
+        """Compute the full cost rollup without consulting the cache."""
+        base = CostForecaster._base(session_id)
+
+        items, estimated, remaining, unestimated = base.with_entities(
+            *CostForecaster._aggregates()
+        ).one()
+
+        with_family = base.join(Control, Control.id == POAMItem.control_id).join(
+            ControlFamily, ControlFamily.id == Control.family_id
+        )
+        by_family = []
+        rows = with_family.with_entities(
+            ControlFamily.family_code, ControlFamily.name, *CostForecaster._aggregates()
+        ).group_by(ControlFamily.family_code, ControlFamily.name).order_by(
+            ControlFamily.family_code
+        ).all()
+        for code, name, fam_items, fam_estimated, fam_remaining, fam_unestimated in rows:
+            by_family.append({
+                'family_code': code,
+                'family_name': name,
+                'items': fam_items,
+                'estimated_cost': round(fam_estimated or 0.0, 2),
+                'remaining_cost': round(fam_remaining or 0.0, 2),
+                'unestimated_items': fam_unestimated or 0,
+            })
+
+        by_month, unscheduled = CostForecaster.forecast_by_month(session_id)
+
+        return {
+            'totals': {
+                'items': items or 0,
+                'estimated_cost': round(estimated or 0.0, 2),
+                'remaining_cost': round(remaining or 0.0, 2),
+                'unestimated_items': unestimated or 0,
+            },
+            'by_month': by_month,
+            'unscheduled': unscheduled,
+            'by_team': CostForecaster._grouped(base, POAMItem.responsible_team, 'responsible_team'),
+            'by_risk': CostForecaster._grouped(base, POAMItem.risk_level, 'risk_level'),
+            'by_family': by_family,
+        }
+
+    @staticmethod
+    def get_rollup(session_id='__default__'):
+        """Return the cost rollup, reusing the cached copy until the data it reads changes."""
+        token = SessionVersions.token(session_id, CostForecaster.VERSION_TABLES)
+        return CostForecaster._cache.get_or_compute(
+            session_id, token, lambda: CostForecaster.compute_rollup(session_id)
+        )
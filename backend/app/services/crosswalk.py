@@ -0,0 +1,263 @@
+import uuid
+from collections import deque
+from app.extensions import db
+from app.models.control import Control
+from app.models.control_mapping import ControlMapping
+from app.models.evidence import Evidence
+from app.services.catalog import FrameworkCatalog
+from app.services.versioning import SessionVersions
+
+
+class Crosswalk:
+    """
+    Map controls between frameworks and project a session's assessment onto
+    another framework.
+
+    A crosswalk file names a ``source`` and ``target`` framework (both must
+    already be in the catalog) and lists ``{source, target, relationship}``
+    control-number pairs. ``load()`` stores every pair in both directions and
+    then recomputes the mappings composed through intermediate frameworks,
+    so e.g. Rev 3 -> Rev 2 -> CMMC resolves without a Rev 3 -> CMMC file.
+
+    A projected status is the weakest status among the session's controls
+    mapped onto the target control (``STATUS_ORDER``, weakest first). An
+    implemented control that covers only part of the target (``subset`` or
+    ``intersects``) counts as partially implemented.
+    """
+
+    RELATIONSHIPS = ('equivalent', 'subset', 'superset', 'intersects')
+    INVERSE = {'equivalent': 'equivalent', 'subset': 'superset', 'superset': 'subset', 'intersects': 'intersects'}
+    PARTIAL = ('subset', 'intersects')
+    STATUS_ORDER = (
+        'not_implemented', 'planned', 'partially_implemented', 'not_assessed', 'implemented', 'not_applicable',
+    )
+    MAX_HOPS = 3
+
+    @staticmethod
+    def mapping_id(source_definition_id, target_definition_id):
+        from app.seed import NAMESPACE
+        return str(uuid.uuid5(NAMESPACE, f'mapping/{source_definition_id}/{target_definition_id}'))
+
+    @staticmethod
+    def compose(first, second):
+        """Relationship of A to C given A->B (``first``) and B->C (``second``)."""
+        if first == 'equivalent':
+            return second
+        if second == 'equivalent' or first == second:
+            return first
+        return 'intersects'
+
+    @staticmethod
+    def _row(source_id, source_key, target_id, target_key, relationship, hops):
+        return {
+            'id': Crosswalk.mapping_id(source_id, target_id),
+            'source_definition_id': source_id,
+            'target_definition_id': target_id,
+            'source_framework_name': source_key[0],
+            'source_framework_version': source_key[1],
+            'target_framework_name': target_key[0],
+            'target_framework_version': target_key[1],
+            'relationship': relationship,
+            'hops': hops,
+        }
+
+    @staticmethod
+    def build_rows(data):
+        """Direct mapping rows (both directions) for a crosswalk file.
+
+        Raises ValueError for frameworks or controls missing from the catalog
+        and for unknown relationships.
+        """
+        keys, frameworks = [], []
+        for side in ('source', 'target'):
+            key = (data[side]['name'], data[side].get('version'))
+            framework = FrameworkCatalog.get(*key)
+            if framework is None:
+                raise ValueError(f'Framework not in catalog: {key[0]} {key[1] or ""}'.strip())
+            keys.append(key)
+            frameworks.append(framework)
+
+        rows = []
+        for mapping in data['mappings']:
+            relationship = mapping.get('relationship', 'equivalent')
+            if relationship not in Crosswalk.RELATIONSHIPS:
+                raise ValueError(f'Invalid relationship {relationship!r}. Must be one of: {Crosswalk.RELATIONSHIPS}')
+            source = frameworks[0].controls.get(mapping['source'])
+            target = frameworks[1].controls.get(mapping['target'])
+            if source is None or target is None:
+                raise ValueError(f"Unknown control in mapping {mapping['source']} -> {mapping['target']}")
+            rows.append(Crosswalk._row(source.id, keys[0], target.id, keys[1], relationship, 1))
+            rows.append(Crosswalk._row(
+                target.id, keys[1], source.id, keys[0], Crosswalk.INVERSE[relationship], 1,
+            ))
+        return rows
+
+    @staticmethod
+    def composed_rows(direct):
+        """Mappings reachable through up to ``MAX_HOPS`` direct mappings.
+
+        ``direct`` are direct mapping rows. Only the shortest path between two
+        controls is kept, and a control gets composed mappings only into
+        frameworks it has no direct mappings into.
+        """
+        edges = {}
+        framework_of = {}
+        for row in direct:
+            edges.setdefault(row['source_definition_id'], []).append(
+                (row['target_definition_id'], row['relationship'])
+            )
+            framework_of[row['source_definition_id']] = (row['source_framework_name'], row['source_framework_version'])
+            framework_of[row['target_definition_id']] = (row['target_framework_name'], row['target_framework_version'])
+
+        composed = []
+        for start, first_edges in edges.items():
+            seen = {start} | {target for target, _ in first_edges}
+            mapped = {framework_of[start]} | {framework_of[target] for target, _ in first_edges}
+            queue = deque((target, relationship, 1) for target, relationship in first_edges)
+            while queue:
+                node, relationship, hops = queue.popleft()
+                if hops == Crosswalk.MAX_HOPS:
+                    continue
+                for target, step in edges.get(node, ()):
+                    if target in seen:
+                        continue
+                    seen.add(target)
+                    combined = Crosswalk.compose(relationship, step)
+                    queue.append((target, combined, hops + 1))
+                    if framework_of[target] not in mapped:
+                        composed.append(Crosswalk._row(
+                            start, framework_of[start], target, framework_of[target], combined, hops + 1,
+                        ))
+        return composed
+
+    @staticmethod
+    def load(data):
+        """Store a crosswalk file's mappings and recompute composed ones.
+
+        Re-loading a file updates its relationships and bumps the global
+        ``control_mappings`` counter, so cached projections are revalidated.
+        Returns the number of mappings in the file. Does not commit.
+        """
+        from app.seed import bulk_upsert
+
+        bulk_upsert(ControlMapping, Crosswalk.build_rows(data), overwrite=True)
+        db.session.execute(db.delete(ControlMapping).where(ControlMapping.hops > 1))
+        direct = [dict(row) for row in db.session.execute(
+            db.select(*ControlMapping.__table__.c).where(ControlMapping.hops == 1)
+        ).mappings()]
+        bulk_upsert(ControlMapping, Crosswalk.composed_rows(direct))
+        SessionVersions.bump(SessionVersions.GLOBAL, [ControlMapping.__tablename__])
+        return len(data['mappings'])
+
+    @staticmethod
+    def pairs():
+        """Framework pairs that have mappings, with the mapping count and fewest hops."""
+        rows = db.session.execute(db.select(
+            ControlMapping.source_framework_name, ControlMapping.source_framework_version,
+            ControlMapping.target_framework_name, ControlMapping.target_framework_version,
+            db.func.count(ControlMapping.id).label('mappings'),
+            db.func.min(ControlMapping.hops).label('hops'),
+        ).group_by(
+            ControlMapping.source_framework_name, ControlMapping.source_framework_version,
+            ControlMapping.target_framework_name, ControlMapping.target_framework_version,
+        ).order_by(
+            ControlMapping.source_framework_name, ControlMapping.source_framework_version,
+            ControlMapping.target_framework_name, ControlMapping.target_framework_version,
+        )).all()
+        return [
+            {
+                'source': {'name': row[0], 'version': row[1]},
+                'target': {'name': row[2], 'version': row[3]},
+                'mappings': row.mappings,
+                'hops': row.hops,
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def projected_status(sources):
+        """Weakest status among ``sources`` (dicts with status and relationship)."""
+        if not sources:
+            return 'not_assessed'
+        rank = {status: i for i, status in enumerate(Crosswalk.STATUS_ORDER)}
+        statuses = []
+        for source in sources:
+            status = source['implementation_status'] or 'not_assessed'
+            if status == 'implemented' and source['relationship'] in Crosswalk.PARTIAL:
+                status = 'partially_implemented'
+            statuses.append(status)
+        return min(statuses, key=lambda s: rank.get(s, rank['not_assessed']))
+
+    @staticmethod
+    def project(session_id, name, version):
+        """Project a session's control statuses and evidence onto a framework.
+
+        ``version`` may be None when the catalog has a single version of
+        ``name``. Returns None if the framework is not in the catalog. Every
+        target control is listed; those no assessed control maps onto are
+        ``not_assessed`` with no sources.
+        """
+        if version is None:
+            versions = FrameworkCatalog.versions(name)
+            if len(versions) == 1:
+                version = versions[0]
+        target = FrameworkCatalog.get(name, version)
+        if target is None:
+            return None
+
+        # One query: mappings onto the target joined to the session's
+        # assessments of their source controls, with evidence counted.
+        rows = db.session.execute(db.select(
+            ControlMapping.target_definition_id,
+            ControlMapping.source_framework_name,
+            ControlMapping.source_framework_version,
+            ControlMapping.relationship,
+            ControlMapping.hops,
+            Control.id.label('control_id'),
+            Control.control_number,
+            Control.implementation_status,
+            db.func.count(Evidence.id).label('evidence_count'),
+        ).select_from(ControlMapping).join(Control, db.and_(
+            Control.definition_id == ControlMapping.source_definition_id,
+            Control.session_id == session_id,
+        )).outerjoin(
+            Evidence, Evidence.control_id == Control.id
+        ).where(
+            ControlMapping.target_framework_name == name,
+            ControlMapping.target_framework_version.is_(None) if version is None
+            else ControlMapping.target_framework_version == version,
+        ).group_by(
+            ControlMapping.id, Control.id
+        ).order_by(
+            ControlMapping.hops, Control.sort_order
+        )).mappings()
+
+        sources = {}
+        for row in rows:
+            source = dict(row)
+            sources.setdefault(source.pop('target_definition_id'), []).append(source)
+
+        controls = []
+        breakdown = {}
+        for control in target.controls.values():
+            control_sources = sources.get(control.id, [])
+            status = Crosswalk.projected_status(control_sources)
+            breakdown[status] = breakdown.get(status, 0) + 1
+            controls.append({
+                'family_code': control.family_code,
+                'control_number': control.control_number,
+                'title': control.title,
+                'weight': control.weight,
+                'projected_status': status,
+                'evidence_count': sum(s['evidence_count'] for s in control_sources),
+                'sources': control_sources,
+            })
+
+        return {
+            'framework': {'name': name, 'version': version},
+            'session_id': session_id,
+            'total_controls': len(controls),
+            'mapped_controls': sum(1 for c in controls if c['sources']),
+            'status_breakdown': breakdown,
+            'controls': controls,
+        }
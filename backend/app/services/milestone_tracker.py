@@ -0,0 +1,209 @@
+import json
+import uuid
+from datetime import datetime
+from sqlalchemy import case, func
+from app.extensions import db
+from app.models.control import Control
+from app.models.poam import POAMItem
+from app.models.poam_milestone import POAMMilestone
+
+
+class MilestoneTracker:
+    """
+    POA&M milestone normalization and analytics.
+
+    ``POAMItem.milestones`` stays the canonical JSON text the frontend edits.
+    Every write mirrors it into ``poam_milestones`` (one row per milestone) so
+    the analytics below are plain SQL aggregates instead of decoding the JSON
+    of every item on every request.
+
+    Milestone entries are ``{description, status}`` objects with optional
+    ``due_date`` and ``completed_date``. When a milestone has no due date the
+    parent item's ``planned_completion_date`` is used for the planned burn-down.
+    """
+
+    COMPLETED = 'completed'
+
+    @staticmethod
+    def parse(raw):
+        """Parse a milestones payload (JSON text or list) into a list of dicts.
+
+        Raises ValueError if the payload is not a JSON array of objects.
+        """
+        if raw is None or raw == '':
+            return []
+        if isinstance(raw, str):
+            try:
+                raw = json.loads(raw)
+            except ValueError:
+                raise ValueError('milestones must be a JSON array')
+        if not isinstance(raw, list) or not all(isinstance(m, dict) for m in raw):
+            raise ValueError('milestones must be a JSON array of objects')
+        return raw
+
+    @staticmethod
+    def dumps(milestones):
+        """Canonical (compact) JSON text for ``POAMItem.milestones``.
+
+        Every writer uses it, so the same milestones are stored as the same
+        bytes (and produce the same ETags and cached payloads).
+        """
+        return json.dumps(milestones, separators=(',', ':'))
+
+    @staticmethod
+    def sync(item, timestamp=None):
+        """Mirror ``item.milestones`` into the normalized milestone table.
+
+        Rows are matched by position so a milestone that was already completed
+        keeps its original ``completed_at``; newly completed milestones are
+        stamped with ``timestamp`` (defaults to the item's ``updated_at``).
+        """
+        entries = MilestoneTracker.parse(item.milestones)
+        timestamp = timestamp or item.updated_at or datetime.now().isoformat()
+
+        existing = {
+            m.position: m for m in POAMMilestone.query.filter_by(poam_id=item.id)
+        } if item.id else {}
+
+        for position, entry in enumerate(entries):
+            status = entry.get('status') or 'planned'
+            row = existing.pop(position, None)
+            if row is None:
+                row = POAMMilestone(
+                    id=str(uuid.uuid4()),
+                    poam_id=item.id,
+                    position=position,
+                    session_id=item.session_id,
+                )
+                db.session.add(row)
+
+            if status == MilestoneTracker.COMPLETED:
+                row.completed_at = (
+                    entry.get('completed_date')
+                    or (row.completed_at if row.status == MilestoneTracker.COMPLETED else None)
+                    or timestamp
+                )
+            else:
+                row.completed_at = None
+
+            row.description = entry.get('description')
+            row.status = status
+            row.due_date = entry.get('due_date')
+
+        for row in existing.values():
+            db.session.delete(row)
+
+    @staticmethod
+    def _completion(total, completed):
+        return round(completed / total, 4) if total else 0.0
+
+    @staticmethod
+    def _counts():
+        completed = func.sum(case((POAMMilestone.status == MilestoneTracker.COMPLETED, 1), else_=0))
+        in_progress = func.sum(case((POAMMilestone.status == 'in_progress', 1), else_=0))
+        return func.count(POAMMilestone.id), completed, in_progress
+
+    @staticmethod
+    def get_analytics(session_id='__default__'):
+        """Return milestone completion per item, team and risk level plus burn-down."""
+        total_col, completed_col, in_progress_col = MilestoneTracker._counts()
+        joined = db.session.query().select_from(POAMMilestone).join(
+            POAMItem, POAMItem.id == POAMMilestone.poam_id
+        ).filter(POAMMilestone.session_id == session_id)
+
+        by_item = []
+        rows = joined.join(Control, Control.id == POAMItem.control_id).with_entities(
+            POAMItem.id, POAMItem.control_id, Control.control_number,
+            POAMItem.risk_level, POAMItem.responsible_team, POAMItem.status,
+            total_col, completed_col, in_progress_col,
+        ).group_by(
+            POAMItem.id, POAMItem.control_id, Control.control_number,
+            POAMItem.risk_level, POAMItem.responsible_team, POAMItem.status,
+        ).order_by(Control.control_number).all()
+
+        grand_total = grand_completed = grand_in_progress = 0
+        for poam_id, control_id, control_number, risk, team, status, total, completed, in_progress in rows:
+            completed = completed or 0
+            in_progress = in_progress or 0
+            grand_total += total
+            grand_completed += completed
+            grand_in_progress += in_progress
+            by_item.append({
+                'poam_id': poam_id,
+                'control_id': control_id,
+                'control_number': control_number,
+                'risk_level': risk,
+                'responsible_team': team,
+                'status': status,
+                'total': total,
+                'completed': completed,
+                'in_progress': in_progress,
+                'completion_ratio': MilestoneTracker._completion(total, completed),
+            })
+
+        def grouped(column, key):
+            results = []
+            group_rows = joined.with_entities(
+                column, func.count(func.distinct(POAMItem.id)),
+                total_col, completed_col,
+            ).group_by(column).order_by(column).all()
+            for value, items, total, completed in group_rows:
+                completed = completed or 0
+                results.append({
+                    key: value,
+                    'items': items,
+                    'total': total,
+                    'completed': completed,
+                    'completion_ratio': MilestoneTracker._completion(total, completed),
+                })
+            return results
+
+        return {
+            'summary': {
+                'total': grand_total,
+                'completed': grand_completed,
+                'in_progress': grand_in_progress,
+                'planned': grand_total - grand_completed - grand_in_progress,
+                'completion_ratio': MilestoneTracker._completion(grand_total, grand_completed),
+            },
+            'by_item': by_item,
+            'by_team': grouped(POAMItem.responsible_team, 'responsible_team'),
+            'by_risk': grouped(POAMItem.risk_level, 'risk_level'),
+            'burndown': MilestoneTracker.get_burndown(session_id, grand_total),
+        }
+
+    @staticmethod
+    def get_burndown(session_id='__default__', total=None):
+        """Monthly burn-down of remaining milestones, planned versus actual."""
+        base = db.session.query().select_from(POAMMilestone).join(
+            POAMItem, POAMItem.id == POAMMilestone.poam_id
+        ).filter(POAMMilestone.session_id == session_id)
+
+        if total is None:
+            total = base.with_entities(func.count(POAMMilestone.id)).scalar() or 0
+
+        due_month = func.substr(
+            func.coalesce(POAMMilestone.due_date, POAMItem.planned_completion_date), 1, 7
+        )
+        done_month = func.substr(POAMMilestone.completed_at, 1, 7)
+
+        planned = dict(base.with_entities(due_month, func.count(POAMMilestone.id)).filter(
+            due_month.isnot(None)
+        ).group_by(due_month).all())
+        actual = dict(base.with_entities(done_month, func.count(POAMMilestone.id)).filter(
+            POAMMilestone.status == MilestoneTracker.COMPLETED,
+            done_month.isnot(None),
+        ).group_by(done_month).all())
+
+        burndown = []
+        planned_done = actual_done = 0
+        for month in sorted(set(planned) | set(actual)):
+            planned_done += planned.get(month, 0)
+            actual_done += actual.get(month, 0)
+            burndown.append({
+                'month': month,
+                'planned_remaining': total - planned_done,
+                'actual_remaining': total - actual_done,
+                'completed': actual.get(month, 0),
+            })
+        return burndown
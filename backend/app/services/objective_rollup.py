@@ -0,0 +1,90 @@
+from datetime import datetime
+from sqlalchemy import func
+from app.extensions import db
+from app.models.control import Control
+from app.models.assessment_objective import AssessmentObjective
+
+
+class ObjectiveRollup:
+    """
+    Derive a control's implementation status from its assessment objectives.
+
+    Objective statuses use the UI's ``met`` / ``not_met`` vocabulary; the
+    NIST SP 800-171A terms ``satisfied`` / ``other_than_satisfied`` (used by the
+    seed data) are accepted as synonyms. With ``not_applicable`` objectives
+    left out:
+
+    - no applicable objectives: not_applicable
+    - every objective met: implemented
+    - some met: partially_implemented
+    - none met, at least one not met: not_implemented (a control already
+      marked ``planned`` stays planned; both deduct the full SPRS weight)
+    - nothing assessed yet: not_assessed
+
+    Controls without objectives are never touched.
+    """
+
+    STATUSES = ('met', 'not_met', 'not_assessed', 'not_applicable', 'satisfied', 'other_than_satisfied')
+    MET = ('met', 'satisfied')
+    NOT_MET = ('not_met', 'other_than_satisfied')
+
+    @staticmethod
+    def derive_status(counts, current=None):
+        """Map ``{objective_status: count}`` for one control to a control status."""
+        met = sum(counts.get(s, 0) for s in ObjectiveRollup.MET)
+        not_met = sum(counts.get(s, 0) for s in ObjectiveRollup.NOT_MET)
+        applicable = sum(n for s, n in counts.items() if s != 'not_applicable')
+
+        if applicable == 0:
+            return 'not_applicable'
+        if met == applicable:
+            return 'implemented'
+        if met:
+            return 'partially_implemented'
+        if not_met:
+            return 'planned' if current == 'planned' else 'not_implemented'
+        return 'not_assessed'
+
+    @staticmethod
+    def recompute(control_ids, session_id='__default__', assessed_by=None):
+        """Recompute the status of ``control_ids`` within the current transaction.
+
+        Objective counts come from a single grouped query; the changed
+        controls are updated through the ORM so the flush bumps their session
+        version. Returns the affected controls.
+        """
+        control_ids = set(control_ids)
+        if not control_ids:
+            return []
+
+        counts = {}
+        rows = db.session.query(
+            AssessmentObjective.control_id,
+            func.coalesce(AssessmentObjective.status, 'not_assessed'),
+            func.count(AssessmentObjective.id),
+        ).filter(
+            AssessmentObjective.session_id == session_id,
+            AssessmentObjective.control_id.in_(control_ids),
+        ).group_by(
+            AssessmentObjective.control_id,
+            func.coalesce(AssessmentObjective.status, 'not_assessed'),
+        ).all()
+        for control_id, status, count in rows:
+            counts.setdefault(control_id, {})[status] = count
+
+        controls = Control.query.filter(
+            Control.session_id == session_id,
+            Control.id.in_(control_ids),
+        ).all()
+
+        now = datetime.now().isoformat()
+        for control in controls:
+            if control.id not in counts:
+                continue
+            control.implementation_status = ObjectiveRollup.derive_status(
+                counts[control.id], control.implementation_status
+            )
+            control.last_assessed_date = now
+            if assessed_by:
+                control.assessed_by = assessed_by
+        return controls
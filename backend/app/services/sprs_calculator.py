@@ -14,6 +14,9 @@ class SPRSCalculator:
     - not_applicable: 0 deducted
     - not_assessed: 0 deducted
     Score range: -203 to +110
+
+    Controls without a weight (frameworks imported from OSCAL catalogs) are
+    not scored.
     """
 
     BASE_SCORE = 110
@@ -27,7 +30,9 @@ class SPRSCalculator:
         total_deduction = 0
 
         for control in controls:
-            weight = control.weight or 1
+            weight = control.weight
+            if weight is None:
+                continue
             status = control.implementation_status or 'not_assessed'
 
             if status == 'implemented':
@@ -54,7 +59,9 @@ class SPRSCalculator:
         total_deduction = 0
 
         for control in controls:
-            weight = control.weight or 1
+            weight = control.weight
+            if weight is None:
+                continue
             status = control.implementation_status or 'not_assessed'
 
             if status == 'implemented':
@@ -0,0 +1,95 @@
+import json
+from abc import ABC, abstractmethod
+from flask import current_app
+from werkzeug.security import check_password_hash
+
+
+class UserStore(ABC):
+    """
+    Source of login credentials.
+
+    Users are dicts with ``id``, ``username``, ``role``, ``name`` and
+    ``email``; password hashes never leave the store. Hashes are always
+    precomputed (see ``flask hash-password``), so building a store does no KDF
+    work; the only hash check happens in ``authenticate`` at login time.
+    """
+
+    @abstractmethod
+    def get_by_username(self, username):
+        """Return the user dict for ``username``, or None."""
+
+    @abstractmethod
+    def get_by_id(self, user_id):
+        """Return the user dict for ``user_id``, or None."""
+
+    @abstractmethod
+    def authenticate(self, username, password):
+        """Return the user dict if the password matches, else None."""
+
+
+class ConfigUserStore(UserStore):
+    """Users from ``AUTH_USERS`` (a list of dicts) or the JSON file at ``AUTH_USERS_FILE``."""
+
+    def __init__(self, users):
+        self._hashes = {u['username']: u['password_hash'] for u in users}
+        users = [{k: v for k, v in u.items() if k != 'password_hash'} for u in users]
+        self._by_username = {u['username']: u for u in users}
+        self._by_id = {u['id']: u for u in users}
+
+    @classmethod
+    def from_config(cls, config):
+        path = config.get('AUTH_USERS_FILE')
+        if path:
+            with open(path) as f:
+                return cls(json.load(f))
+        return cls(config.get('AUTH_USERS') or [])
+
+    def get_by_username(self, username):
+        return self._by_username.get(username)
+
+    def get_by_id(self, user_id):
+        return self._by_id.get(user_id)
+
+    def authenticate(self, username, password):
+        password_hash = self._hashes.get(username)
+        if not password_hash or not check_password_hash(password_hash, password):
+            return None
+        return self._by_username[username]
+
+
+class DatabaseUserStore(UserStore):
+    """Users from the ``users`` table."""
+
+    def get_by_username(self, username):
+        from app.models.user import User
+        user = User.query.filter_by(username=username).first()
+        return user.to_dict() if user else None
+
+    def get_by_id(self, user_id):
+        from app.models.user import User
+        user = User.query.get(user_id)
+        return user.to_dict() if user else None
+
+    def authenticate(self, username, password):
+        from app.models.user import User
+        user = User.query.filter_by(username=username).first()
+        if not user or not check_password_hash(user.password_hash, password):
+            return None
+        return user.to_dict()
+
+
+USER_STORES = {
+    'config': ConfigUserStore.from_config,
+    'database': lambda config: DatabaseUserStore(),
+}
+
+
+def init_user_store(app):
+    backend = app.config.get('USER_STORE', 'config')
+    if backend not in USER_STORES:
+        raise ValueError(f'Unknown USER_STORE {backend!r}; expected one of {sorted(USER_STORES)}')
+    app.extensions['user_store'] = USER_STORES[backend](app.config)
+
+
+def get_user_store():
+    return current_app.extensions['user_store']
@@ -0,0 +1,106 @@
+from datetime import datetime
+from sqlalchemy import event
+from app.extensions import db
+from app.models.session_version import SessionVersion
+
+
+class SessionVersions:
+    """
+    Per-session, per-table write counters.
+
+    Every ORM flush that inserts, updates or deletes a row carrying a
+    ``session_id`` bumps the ``session_versions`` row for that
+    ``(session_id, table)`` pair inside the same transaction. Readers turn the
+    counters into a cheap validator (``token``) for caches and ETags, so a
+    cached payload is reused until one of the tables it was built from changes.
+
+    Bulk Core statements (``update()``/``insert()`` executed directly) bypass
+    the flush hook and must call ``bump`` themselves.
+
+    Tables shared by every session (the framework catalog, crosswalk
+    mappings) keep their counters under the ``GLOBAL`` pseudo-session.
+    """
+
+    GLOBAL = '__global__'
+
+    @staticmethod
+    def get(session_id, tables):
+        """Return ``{table: (version, updated_at)}`` for the given tables."""
+        rows = db.session.query(
+            SessionVersion.table_name, SessionVersion.version, SessionVersion.updated_at
+        ).filter(
+            SessionVersion.session_id == session_id,
+            SessionVersion.table_name.in_(tables),
+        ).all()
+        found = {name: (version, updated_at) for name, version, updated_at in rows}
+        return {t: found.get(t, (0, None)) for t in tables}
+
+    @staticmethod
+    def token(session_id, tables, versions=None):
+        """Return an opaque string that changes whenever any of ``tables`` is written."""
+        versions = versions or SessionVersions.get(session_id, tables)
+        return '-'.join(
+            f'{versions[t][0]}.{versions[t][1] or ""}' for t in sorted(tables)
+        )
+
+    @staticmethod
+    def last_modified(versions):
+        """Return the most recent write time (naive local ``datetime``) or None."""
+        stamps = [updated_at for _, updated_at in versions.values() if updated_at]
+        return datetime.fromisoformat(max(stamps)) if stamps else None
+
+    @staticmethod
+    def bump(session_id, tables, connection=None):
+        """Increment the version of each table for ``session_id``."""
+        connection = connection or db.session.connection()
+        now = datetime.now().isoformat()
+        table = SessionVersion.__table__
+        dialect = connection.dialect.name
+
+        for name in sorted(set(tables)):
+            if dialect in ('sqlite', 'postgresql'):
+                if dialect == 'sqlite':
+                    from sqlalchemy.dialects.sqlite import insert
+                else:
+                    from sqlalchemy.dialects.postgresql import insert
+                stmt = insert(table).values(
+                    session_id=session_id, table_name=name, version=1, updated_at=now,
+                ).on_conflict_do_update(
+                    index_elements=[table.c.session_id, table.c.table_name],
+                    set_={'version': table.c.version + 1, 'updated_at': now},
+                )
+                connection.execute(stmt)
+                continue
+
+            result = connection.execute(
+                table.update().where(
+                    table.c.session_id == session_id, table.c.table_name == name,
+                ).values(version=table.c.version + 1, updated_at=now)
+            )
+            if result.rowcount == 0:
+                connection.execute(table.insert().values(
+                    session_id=session_id, table_name=name, version=1, updated_at=now,
+                ))
+
+    @staticmethod
+    def _after_flush(session, flush_context):
+        touched = {}
+        for obj in list(session.new) + list(session.deleted) + [
+            o for o in session.dirty if session.is_modified(o)
+        ]:
+            if isinstance(obj, SessionVersion):
+                continue
+            tablename = getattr(obj, '__tablename__', None)
+            if tablename and hasattr(obj, 'session_id'):
+                session_id = obj.session_id or '__default__'
+                touched.setdefault(session_id, set()).add(tablename)
+
+        connection = session.connection()
+        for session_id, tables in touched.items():
+            SessionVersions.bump(session_id, tables, connection=connection)
+
+    @staticmethod
+    def init_app(app):
+        """Install the flush hook that keeps the counters current."""
+        if not event.contains(db.session, 'after_flush', SessionVersions._after_flush):
+            event.listen(db.session, 'after_flush', SessionVersions._after_flush)
@@ -0,0 +1,170 @@
+"""
+Slow-query log.
+
+Statements slower than ``SLOW_QUERY_THRESHOLD_MS`` are recorded with their SQL,
+the *shape* of their bound parameters (types only, never values), duration,
+the endpoint that issued them and, for SELECTs on SQLite/PostgreSQL, the query
+plan. Entries go to an in-memory ring buffer (``/api/admin/slow-queries``) and,
+when ``SLOW_QUERY_LOG_PATH`` is set, to a rotating JSON-lines log file.
+"""
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from flask import has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger('ctl.slow_queries')
+
+
+class SlowQueryLog:
+    """Ring buffer of slow statements plus the cursor hooks that feed it."""
+
+    def __init__(self):
+        self.threshold_ms = None
+        self.explain = True
+        self._entries = deque(maxlen=200)
+        self._lock = threading.Lock()
+
+    def configure(self, threshold_ms, buffer_size=200, explain=True):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        with self._lock:
+            self._entries = deque(self._entries, maxlen=buffer_size)
+
+    def entries(self):
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(json.dumps(entry, default=str))
+
+    # -- cursor events -----------------------------------------------------
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Per execution context, so a statement that raises (and never reaches
+        # after_cursor_execute) leaves nothing behind on the connection.
+        if self.threshold_ms is not None and context is not None:
+            context._ctl_slow_query_start = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, '_ctl_slow_query_start', None)
+        if self.threshold_ms is None or start is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        entry = {
+            'timestamp': datetime.now().isoformat(),
+            'duration_ms': round(duration_ms, 2),
+            'statement': statement,
+            'parameters': parameter_shape(parameters, executemany),
+            'executemany': executemany,
+            'endpoint': None,
+            'method': None,
+            'path': None,
+            'plan': None,
+        }
+        if has_request_context():
+            entry['endpoint'] = request.url_rule.rule if request.url_rule else None
+            entry['method'] = request.method
+            entry['path'] = request.path
+        if self.explain and not executemany:
+            entry['plan'] = explain(conn, statement, parameters)
+        self.record(entry)
+
+
+def parameter_shape(parameters, executemany=False):
+    """Describe bound parameters by type so no CUI or credentials are logged."""
+    if executemany:
+        rows = list(parameters or [])
+        return {'rows': len(rows), 'first': parameter_shape(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+
+def explain(conn, statement, parameters):
+    """Capture the query plan using a raw DBAPI cursor (so no events re-fire).
+
+    On PostgreSQL the EXPLAIN runs inside a savepoint, so a failure does not
+    abort the caller's transaction.
+    """
+    if not statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+        return None
+    dialect = conn.dialect.name
+    if dialect == 'sqlite':
+        sql = f'EXPLAIN QUERY PLAN {statement}'
+    elif dialect == 'postgresql':
+        sql = f'EXPLAIN (FORMAT JSON) {statement}'
+    else:
+        return None
+
+    raw = conn.connection
+    savepoint = dialect == 'postgresql' and not getattr(raw.dbapi_connection, 'autocommit', False)
+    try:
+        cursor = raw.cursor()
+        try:
+            if savepoint:
+                cursor.execute('SAVEPOINT ctl_explain')
+            try:
+                cursor.execute(sql, parameters)
+                rows = cursor.fetchall()
+            except Exception:
+                if savepoint:
+                    cursor.execute('ROLLBACK TO SAVEPOINT ctl_explain')
+                raise
+            if savepoint:
+                cursor.execute('RELEASE SAVEPOINT ctl_explain')
+        finally:
+            cursor.close()
+    except Exception as e:  # noqa: BLE001 - the plan is best-effort diagnostics
+        return {'error': str(e)}
+
+    if dialect == 'sqlite':
+        # (id, parent, notused, detail)
+        return [{'id': r[0], 'parent': r[1], 'detail': r[3]} for r in rows]
+    return rows[0][0] if rows else None
+
+
+slow_query_log = SlowQueryLog()
+
+
+def register_slow_query_log(app):
+    threshold = app.config.get('SLOW_QUERY_THRESHOLD_MS')
+    if threshold is None:
+        return
+
+    slow_query_log.configure(
+        threshold_ms=float(threshold),
+        buffer_size=int(app.config.get('SLOW_QUERY_BUFFER_SIZE', 200)),
+        explain=app.config.get('SLOW_QUERY_EXPLAIN', True),
+    )
+
+    path = app.config.get('SLOW_QUERY_LOG_PATH')
+    if path and not any(getattr(h, 'baseFilename', None) == path for h in logger.handlers):
+        handler = RotatingFileHandler(
+            path,
+            maxBytes=int(app.config.get('SLOW_QUERY_LOG_MAX_BYTES', 10 * 1024 * 1024)),
+            backupCount=int(app.config.get('SLOW_QUERY_LOG_BACKUPS', 5)),
+        )
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.WARNING)
+
+    if not event.contains(Engine, 'before_cursor_execute', slow_query_log.before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', slow_query_log.before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', slow_query_log.after_cursor_execute)
@@ -0,0 +1,76 @@
+"""
+Pre-built seed database snapshots.
+
+``flask build-snapshot`` seeds a fresh SQLite file, runs ANALYZE and VACUUM,
+and writes it atomically; container images build it once so that startup only
+has to copy the file into place (``flask restore-snapshot``) instead of
+creating tables and inserting the seed rows one by one.
+"""
+import os
+import shutil
+from sqlalchemy.engine import make_url
+from app.extensions import db
+
+
+def snapshot_path(app):
+    return app.config.get('SEED_SNAPSHOT_PATH') or os.path.join(app.instance_path, 'seed-snapshot.db')
+
+
+def sqlite_database_path(app):
+    """Filesystem path of the app's SQLite database, or None for other backends."""
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() != 'sqlite' or not url.database or url.database == ':memory:':
+        return None
+    if os.path.isabs(url.database):
+        return url.database
+    # Flask-SQLAlchemy resolves relative SQLite paths against the instance folder.
+    return os.path.join(app.instance_path, url.database)
+
+
+def build_snapshot(output, config_name=None):
+    """Create, seed and compact a SQLite database at ``output``."""
+    from app import create_app
+    from app.seed import seed
+
+    output = os.path.abspath(output)
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    tmp = output + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+
+    app = create_app(config_name, SQLALCHEMY_DATABASE_URI=f'sqlite:///{tmp}')
+    with app.app_context():
+        db.create_all()
+        seed()
+        db.session.remove()
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.exec_driver_sql('ANALYZE')
+            conn.exec_driver_sql('VACUUM')
+        db.engine.dispose()
+
+    os.replace(tmp, output)
+    return output
+
+
+def restore_snapshot(app, snapshot=None, force=False):
+    """Copy the snapshot into the app's database path.
+
+    Returns the target path, or None if there is nothing to restore: the
+    app does not use a file-based SQLite database (e.g. PostgreSQL), or the
+    database already exists and ``force`` is not set. Raises ValueError if
+    the snapshot is missing.
+    """
+    snapshot = snapshot or snapshot_path(app)
+    target = sqlite_database_path(app)
+    if target is None:
+        return None
+    if not os.path.exists(snapshot):
+        raise ValueError(f'Snapshot not found: {snapshot}')
+    if os.path.exists(target) and not force:
+        return None
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = target + '.tmp'
+    shutil.copyfile(snapshot, tmp)
+    os.replace(tmp, target)
+    return target
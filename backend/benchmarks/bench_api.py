@@ -0,0 +1,173 @@
+"""API endpoint benchmarks against the synthetic large tenant."""
+import uuid
+
+
+def _get(client, url, headers=None):
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.get_data(as_text=True)[:500]
+    return response
+
+
+def bench_list_controls(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls?session_id={tenant['session_id']}&per_page=100"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_list_controls_search(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls?session_id={tenant['session_id']}&search=access&per_page=100"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_list_controls_sparse(benchmark, sql_queries, client, tenant):
+    url = (
+        f"/api/controls?session_id={tenant['session_id']}&per_page=100"
+        "&fields=control_number,title,implementation_status,family_code"
+    )
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_list_evidence(benchmark, sql_queries, client, tenant):
+    url = f"/api/evidence?session_id={tenant['session_id']}"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_list_evidence_sparse(benchmark, sql_queries, client, tenant):
+    url = f"/api/evidence?session_id={tenant['session_id']}&fields=title,evidence_type,control_number"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_list_poam(benchmark, sql_queries, client, tenant):
+    url = f"/api/poam?session_id={tenant['session_id']}"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_get_control(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls/{tenant['control_id']}?session_id={tenant['session_id']}"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_get_control_not_modified(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls/{tenant['control_id']}?session_id={tenant['session_id']}"
+    etag = _get(client, url).headers['ETag']
+
+    def revalidate():
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        return response
+
+    sql_queries(revalidate)
+    benchmark(revalidate)
+
+
+def bench_export_controls(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls/export?session_id={tenant['session_id']}"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_export_controls_uncached(benchmark, sql_queries, client, tenant):
+    """Cold export: the payload cache is emptied before every round."""
+    from app.api.conditional import payload_cache
+    url = f"/api/controls/export?session_id={tenant['session_id']}"
+
+    def setup():
+        payload_cache.clear()
+        return (client, url), {}
+
+    sql_queries(_get, *setup()[0])
+    benchmark.pedantic(_get, setup=setup, rounds=10, warmup_rounds=1)
+
+
+def bench_export_controls_gzip(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls/export?session_id={tenant['session_id']}"
+    headers = {'Accept-Encoding': 'gzip'}
+    assert _get(client, url, headers).headers['Content-Encoding'] == 'gzip'
+    sql_queries(_get, client, url, headers)
+    benchmark(_get, client, url, headers)
+
+
+def bench_list_families(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls/families?session_id={tenant['session_id']}"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_list_families_with_controls(benchmark, sql_queries, client, tenant):
+    url = f"/api/controls/families?session_id={tenant['session_id']}&include=controls"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_get_dashboard(benchmark, sql_queries, client, tenant):
+    """Warm dashboard: served from the payload cache after the first request."""
+    url = f"/api/dashboard?session_id={tenant['session_id']}"
+    _get(client, url)
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_get_dashboard_uncached(benchmark, sql_queries, client, tenant):
+    """Cold dashboard aggregation: the payload cache is emptied before every round."""
+    from app.api.conditional import payload_cache
+    url = f"/api/dashboard?session_id={tenant['session_id']}"
+
+    def setup():
+        payload_cache.clear()
+        return (client, url), {}
+
+    sql_queries(_get, *setup()[0])
+    benchmark.pedantic(_get, setup=setup, rounds=10, warmup_rounds=1)
+
+
+def bench_get_dashboard_gzip(benchmark, sql_queries, client, tenant):
+    url = f"/api/dashboard?session_id={tenant['session_id']}"
+    headers = {'Accept-Encoding': 'gzip'}
+    sql_queries(_get, client, url, headers)
+    benchmark(_get, client, url, headers)
+
+
+def bench_list_frameworks(benchmark, sql_queries, client, tenant):
+    url = f"/api/frameworks?session_id={tenant['session_id']}"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_get_framework(benchmark, sql_queries, client, tenant):
+    framework_id = _get(client, f"/api/frameworks?session_id={tenant['session_id']}").json[0]['id']
+    url = f"/api/frameworks/{framework_id}?session_id={tenant['session_id']}"
+    sql_queries(_get, client, url)
+    benchmark(_get, client, url)
+
+
+def bench_bulk_upload_evidence(benchmark, sql_queries, client, tenant):
+    """100-row JSON upload; every round uploads new titles."""
+    session_id = tenant['session_id']
+    with client.application.app_context():
+        from app.models import Control
+        numbers = [
+            n for (n,) in Control.query.with_entities(Control.control_number)
+            .filter_by(session_id=session_id).order_by(Control.sort_order).limit(100)
+        ]
+
+    def payload():
+        batch = uuid.uuid4().hex[:8]
+        return (client, [
+            {'control_number': n, 'title': f'Bulk {batch} {i}', 'evidence_type': 'document'}
+            for i, n in enumerate(numbers)
+        ]), {}
+
+    def upload(client, rows):
+        response = client.post(f'/api/evidence/bulk?session_id={session_id}', json=rows)
+        assert response.status_code == 201
+        assert response.json['created'] == len(rows)
+        return response
+
+    sql_queries(upload, *payload()[0])
+    benchmark.pedantic(upload, setup=payload, rounds=10, warmup_rounds=1)
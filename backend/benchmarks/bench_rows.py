@@ -0,0 +1,51 @@
+"""ORM hydration + ``to_dict()`` vs the Core ``select()`` row path (app/api/rows.py).
+
+Each call starts from an empty session so the ORM variant pays for identity-map
+population every time, as a request does. ``extra_info`` records the row count
+and the peak traced memory of one call.
+"""
+import tracemalloc
+import pytest
+from app.api.rows import columns, fetch_dicts
+from app.extensions import db
+from app.models import AssessmentObjective, Control, Evidence
+
+MODELS = [
+    pytest.param(Control, id='controls'),
+    pytest.param(AssessmentObjective, id='objectives'),
+    pytest.param(Evidence, id='evidence'),
+]
+
+
+def _orm(model, session_id):
+    try:
+        return [o.to_dict() for o in model.query.filter_by(session_id=session_id).all()]
+    finally:
+        db.session.remove()
+
+
+def _core(model, session_id):
+    try:
+        return fetch_dicts(db.select(*columns(model)).where(model.session_id == session_id))
+    finally:
+        db.session.remove()
+
+
+def _bench(benchmark, app, tenant, fn, model):
+    with app.app_context():
+        tracemalloc.start()
+        rows = fn(model, tenant['session_id'])
+        benchmark.extra_info['peak_kib'] = round(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+        benchmark.extra_info['rows'] = len(rows)
+        benchmark(fn, model, tenant['session_id'])
+
+
+@pytest.mark.parametrize('model', MODELS)
+def bench_rows_orm(benchmark, app, tenant, model):
+    _bench(benchmark, app, tenant, _orm, model)
+
+
+@pytest.mark.parametrize('model', MODELS)
+def bench_rows_core(benchmark, app, tenant, model):
+    _bench(benchmark, app, tenant, _core, model)
@@ -0,0 +1,54 @@
+"""JSON serialization benchmarks: Flask's stdlib provider vs the orjson provider.
+
+Payloads are the real export and unpaginated list responses for the synthetic
+tenant, so the numbers reflect what ``jsonify`` spends on those endpoints.
+"""
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from app.json_provider import OrjsonProvider, orjson
+
+PROVIDERS = [
+    pytest.param(DefaultJSONProvider, id='stdlib'),
+    pytest.param(OrjsonProvider, id='orjson', marks=pytest.mark.skipif(
+        orjson is None, reason='orjson not installed'
+    )),
+]
+
+ENDPOINTS = {
+    'export_controls': '/api/controls/export',
+    'list_evidence': '/api/evidence',
+    'list_poam': '/api/poam',
+}
+
+
+@pytest.fixture(scope='module')
+def payloads(app, tenant):
+    client = app.test_client()
+    payloads = {}
+    for name, path in ENDPOINTS.items():
+        response = client.get(f"{path}?session_id={tenant['session_id']}")
+        assert response.status_code == 200
+        payloads[name] = response.get_json()
+    return payloads
+
+
+def _bench(benchmark, app, provider_class, payload):
+    provider = provider_class(app)
+    with app.app_context():
+        response = benchmark(provider.response, payload)
+    benchmark.extra_info['bytes'] = len(response.get_data())
+
+
+@pytest.mark.parametrize('provider_class', PROVIDERS)
+def bench_serialize_export_controls(benchmark, app, payloads, provider_class):
+    _bench(benchmark, app, provider_class, payloads['export_controls'])
+
+
+@pytest.mark.parametrize('provider_class', PROVIDERS)
+def bench_serialize_list_evidence(benchmark, app, payloads, provider_class):
+    _bench(benchmark, app, provider_class, payloads['list_evidence'])
+
+
+@pytest.mark.parametrize('provider_class', PROVIDERS)
+def bench_serialize_list_poam(benchmark, app, payloads, provider_class):
+    _bench(benchmark, app, provider_class, payloads['list_poam'])
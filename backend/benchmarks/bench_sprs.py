@@ -0,0 +1,33 @@
+"""SPRSCalculator benchmarks over a large synthetic session."""
+import pytest
+
+
+@pytest.fixture
+def controls(app, tenant):
+    from app.models import Control
+
+    with app.app_context():
+        yield Control.query.filter_by(session_id=tenant['session_id']).all()
+
+
+def bench_sprs_calculate_preloaded(benchmark, controls):
+    from app.services import SPRSCalculator
+
+    benchmark.extra_info['controls'] = len(controls)
+    benchmark(SPRSCalculator.calculate, controls)
+
+
+def bench_sprs_calculate_query(benchmark, sql_queries, app, tenant):
+    from app.services import SPRSCalculator
+
+    with app.app_context():
+        sql_queries(SPRSCalculator.calculate, session_id=tenant['session_id'])
+        benchmark(SPRSCalculator.calculate, session_id=tenant['session_id'])
+
+
+def bench_sprs_breakdown(benchmark, sql_queries, app, tenant):
+    from app.services import SPRSCalculator
+
+    with app.app_context():
+        sql_queries(SPRSCalculator.get_breakdown, session_id=tenant['session_id'])
+        benchmark(SPRSCalculator.get_breakdown, session_id=tenant['session_id'])
@@ -0,0 +1,194 @@
+"""
+Performance regression gate.
+
+Runs the pytest benchmark suite ``runs`` times (``config.runs`` in the
+baseline, or ``--runs``), or reads existing ``--benchmark-json`` files given
+with ``--results``, and compares it with ``benchmarks/baseline.json``. Each
+benchmark is judged on its best (lowest) median across the runs, since
+scheduler and cache noise only ever makes a run slower:
+
+* time: a benchmark regresses when its best median exceeds the baseline
+  median by more than its ``tolerance`` (fraction, default
+  ``default_tolerance``). The limit is relative only, so sub-millisecond
+  benchmarks are held to it as well;
+* queries: a benchmark regresses when ``extra_info.sql_queries`` exceeds its
+  ``max_queries`` budget. Budgets are exact counts and machine independent.
+
+Exits 1 on any regression or missing benchmark, 0 otherwise.
+
+    python -m benchmarks.compare                     # run suite, compare
+    python -m benchmarks.compare --results a.json --results b.json
+    python -m benchmarks.compare --update-baseline   # re-record medians
+
+Timings depend on the machine; re-record the medians (the median of each
+benchmark's run medians) with ``--update-baseline`` when moving to new
+hardware. Updating also records each benchmark's ``spread``, the relative
+range of its run medians; a benchmark only gets a ``tolerance`` above the
+default when its recorded spread calls for one. Tolerances and query budgets
+are kept when updating.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(BACKEND_DIR, 'benchmarks', 'baseline.json')
+
+
+def run_suite(config, extra_args=()):
+    """Run the benchmark suite and return its parsed JSON results."""
+    fd, path = tempfile.mkstemp(suffix='.json', prefix='ctl-bench-')
+    os.close(fd)
+    try:
+        cmd = [
+            sys.executable, '-m', 'pytest', 'benchmarks', '-q',
+            f'--benchmark-json={path}',
+            f"--bench-sessions={config.get('sessions', 3)}",
+            f"--bench-frameworks={config.get('frameworks', 2)}",
+            f"--bench-controls={config.get('controls', 1000)}",
+            *extra_args,
+        ]
+        subprocess.run(cmd, cwd=BACKEND_DIR, check=True)
+        return load_json(path)
+    finally:
+        os.remove(path)
+
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def index_results(results):
+    return {b['name']: b for b in results.get('benchmarks', [])}
+
+
+def merge_results(runs):
+    """Combine several runs' results, keeping each benchmark's fastest run."""
+    best = {}
+    for results in runs:
+        for name, result in index_results(results).items():
+            if name not in best or result['stats']['median'] < best[name]['stats']['median']:
+                best[name] = result
+    return {'benchmarks': list(best.values())}
+
+
+def compare(baseline, results):
+    """Return ``(rows, failed)``; each row describes one baseline benchmark."""
+    current = index_results(results)
+    default_tolerance = baseline.get('default_tolerance', 0.5)
+    rows = []
+    failed = False
+
+    for name, spec in sorted(baseline['benchmarks'].items()):
+        row = {'name': name, 'problems': []}
+        result = current.get(name)
+        if result is None:
+            row['problems'].append('missing from results')
+            rows.append(row)
+            failed = True
+            continue
+
+        median = result['stats']['median']
+        row['median_ms'] = median * 1000
+        if spec.get('median') is not None:
+            tolerance = spec.get('tolerance', default_tolerance)
+            row['baseline_ms'] = spec['median'] * 1000
+            row['change'] = median / spec['median'] - 1 if spec['median'] else 0.0
+            if median > spec['median'] * (1 + tolerance):
+                row['problems'].append(f"slower than baseline by {row['change']:+.0%} (limit +{tolerance:.0%})")
+
+        queries = result.get('extra_info', {}).get('sql_queries')
+        row['queries'] = queries
+        if spec.get('max_queries') is not None:
+            row['max_queries'] = spec['max_queries']
+            if queries is None:
+                row['problems'].append('no sql_queries recorded')
+            elif queries > spec['max_queries']:
+                row['problems'].append(f"{queries} queries exceeds budget of {spec['max_queries']}")
+
+        failed = failed or bool(row['problems'])
+        rows.append(row)
+
+    for name in sorted(set(current) - set(baseline['benchmarks'])):
+        rows.append({'name': name, 'problems': [], 'new': True,
+                     'median_ms': current[name]['stats']['median'] * 1000,
+                     'queries': current[name].get('extra_info', {}).get('sql_queries')})
+    return rows, failed
+
+
+def update_baseline(baseline, runs):
+    """Record each benchmark's typical median and spread, keeping tolerances and query budgets.
+
+    The recorded value is the median of the runs' medians rather than the
+    best one, so that a lucky run does not set a bar later best-of-runs
+    comparisons can only just meet. ``spread`` is the slowest run median
+    over the fastest, minus one.
+    """
+    medians = {}
+    for results in runs:
+        for name, result in index_results(results).items():
+            medians.setdefault(name, []).append(result['stats']['median'])
+    for name, result in index_results(merge_results(runs)).items():
+        spec = baseline['benchmarks'].setdefault(name, {})
+        spec['median'] = round(statistics.median(medians[name]), 6)
+        spec['spread'] = round(max(medians[name]) / min(medians[name]) - 1, 3)
+        queries = result.get('extra_info', {}).get('sql_queries')
+        if queries is not None and 'max_queries' not in spec:
+            spec['max_queries'] = queries
+    return baseline
+
+
+def format_rows(rows):
+    lines = [f"{'benchmark':<36} {'baseline':>10} {'current':>10} {'change':>8} {'queries':>9}  status"]
+    for row in rows:
+        baseline = f"{row['baseline_ms']:.2f}" if 'baseline_ms' in row else '-'
+        current = f"{row['median_ms']:.2f}" if 'median_ms' in row else '-'
+        change = f"{row['change']:+.0%}" if 'change' in row else ''
+        queries = ''
+        if row.get('queries') is not None:
+            queries = str(row['queries'])
+            if row.get('max_queries') is not None:
+                queries += f"/{row['max_queries']}"
+        status = 'new' if row.get('new') else ('; '.join(row['problems']) or 'ok')
+        lines.append(f"{row['name']:<36} {baseline:>10} {current:>10} {change:>8} {queries:>9}  {status}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--results', action='append',
+                        help='compare this --benchmark-json file instead of running the suite (repeatable)')
+    parser.add_argument('--runs', type=int, default=None, help='suite runs (defaults to config.runs, else 3)')
+    parser.add_argument('--update-baseline', action='store_true', help='write current medians to the baseline')
+    parser.add_argument('pytest_args', nargs='*', help='extra arguments passed to pytest')
+    args = parser.parse_args(argv)
+
+    baseline = load_json(args.baseline)
+    config = baseline.get('config', {})
+    if args.results:
+        runs = [load_json(path) for path in args.results]
+    else:
+        runs = [run_suite(config, args.pytest_args) for _ in range(args.runs or config.get('runs', 3))]
+    results = merge_results(runs)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(update_baseline(baseline, runs), f, indent=2)
+            f.write('\n')
+        print(f'Baseline updated: {args.baseline}')
+        return 0
+
+    rows, failed = compare(baseline, results)
+    print(format_rows(rows))
+    print('\nFAILED: performance regression detected' if failed else '\nOK: no regressions')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
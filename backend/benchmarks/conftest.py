@@ -0,0 +1,226 @@
+"""
+Fixtures for the pytest benchmark suite.
+
+    python -m pytest benchmarks --benchmark-json benchmarks/results.json
+
+The suite runs against a temporary SQLite database filled by
+``benchmarks.datagen``; its size is set with ``--bench-sessions``,
+``--bench-frameworks`` and ``--bench-controls``. When pytest-benchmark is
+installed its ``benchmark`` fixture and JSON output are used as-is; otherwise a
+small compatible fixture defined here writes the same JSON layout
+(``benchmarks[].name/stats/extra_info``). Every benchmark records the number of
+SQL statements one call executes in ``extra_info['sql_queries']``.
+"""
+import datetime
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+HAS_PYTEST_BENCHMARK = importlib.util.find_spec('pytest_benchmark') is not None
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('ctl-benchmarks')
+    group.addoption('--bench-sessions', type=int, default=3, help='synthetic sessions')
+    group.addoption('--bench-frameworks', type=int, default=2, help='frameworks per session')
+    group.addoption('--bench-controls', type=int, default=1000, help='controls per framework')
+    if not HAS_PYTEST_BENCHMARK:
+        group.addoption('--benchmark-json', default=None, help='write results to this JSON file')
+        group.addoption('--benchmark-min-rounds', type=int, default=5)
+        group.addoption('--benchmark-max-time', type=float, default=1.0)
+
+
+# -- SQL statement counting ---------------------------------------------------
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@contextmanager
+def count_queries():
+    counter = QueryCounter()
+    event.listen(Engine, 'after_cursor_execute', counter)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, 'after_cursor_execute', counter)
+
+
+# -- fallback benchmark fixture ----------------------------------------------
+
+_RESULTS = []
+
+
+class Benchmark:
+    """Subset of pytest-benchmark's fixture API: ``__call__``, ``pedantic``, ``extra_info``."""
+
+    def __init__(self, name, fullname, min_rounds=5, max_time=1.0):
+        self.name = name
+        self.fullname = fullname
+        self.min_rounds = min_rounds
+        self.max_time = max_time
+        self.extra_info = {}
+        self.timings = []
+
+    def _time(self, fn, args, kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.timings.append(time.perf_counter() - start)
+        return result
+
+    def __call__(self, fn, *args, **kwargs):
+        result = fn(*args, **kwargs)  # warm-up
+        deadline = time.perf_counter() + self.max_time
+        while len(self.timings) < self.min_rounds or time.perf_counter() < deadline:
+            result = self._time(fn, args, kwargs)
+        return result
+
+    def pedantic(self, target, args=(), kwargs=None, setup=None, rounds=1,
+                 iterations=1, warmup_rounds=0):
+        kwargs = kwargs or {}
+        result = None
+        for i in range(warmup_rounds + rounds):
+            call_args, call_kwargs = args, kwargs
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    call_args, call_kwargs = prepared
+            if i < warmup_rounds:
+                target(*call_args, **call_kwargs)
+                continue
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*call_args, **call_kwargs)
+            self.timings.append((time.perf_counter() - start) / iterations)
+        return result
+
+    def as_dict(self):
+        t = self.timings
+        mean = statistics.mean(t)
+        return {
+            'name': self.name,
+            'fullname': self.fullname,
+            'stats': {
+                'min': min(t),
+                'max': max(t),
+                'mean': mean,
+                'median': statistics.median(t),
+                'stddev': statistics.stdev(t) if len(t) > 1 else 0.0,
+                'rounds': len(t),
+                'ops': 1 / mean if mean else 0.0,
+            },
+            'extra_info': self.extra_info,
+        }
+
+
+if not HAS_PYTEST_BENCHMARK:
+    @pytest.fixture
+    def benchmark(request):
+        bench = Benchmark(
+            request.node.name, request.node.nodeid,
+            min_rounds=request.config.getoption('--benchmark-min-rounds'),
+            max_time=request.config.getoption('--benchmark-max-time'),
+        )
+        yield bench
+        if bench.timings:
+            _RESULTS.append(bench.as_dict())
+
+    def pytest_terminal_summary(terminalreporter):
+        if not _RESULTS:
+            return
+        terminalreporter.section('benchmarks')
+        terminalreporter.write_line(
+            f"{'name':<40} {'median ms':>10} {'mean ms':>10} {'rounds':>7} {'queries':>8}"
+        )
+        for r in _RESULTS:
+            s = r['stats']
+            terminalreporter.write_line(
+                f"{r['name']:<40} {s['median'] * 1000:>10.2f} {s['mean'] * 1000:>10.2f} "
+                f"{s['rounds']:>7} {r['extra_info'].get('sql_queries', ''):>8}"
+            )
+
+    def pytest_sessionfinish(session):
+        path = session.config.getoption('--benchmark-json')
+        if not path or not _RESULTS:
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'machine_info': {
+                    'python_version': platform.python_version(),
+                    'platform': platform.platform(),
+                },
+                'datetime': datetime.datetime.now().isoformat(),
+                'benchmarks': _RESULTS,
+            }, f, indent=2)
+
+
+# -- application fixtures -----------------------------------------------------
+
+@pytest.fixture(scope='session')
+def app(request):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from app import create_app
+    from app.extensions import db
+    from app.seed import seed
+    from benchmarks import datagen
+
+    workdir = tempfile.mkdtemp(prefix='ctl-bench-')
+    app = create_app(
+        'testing',
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        SLOW_QUERY_THRESHOLD_MS=None,
+        PROFILING_ENABLED=False,
+    )
+    with app.app_context():
+        db.create_all()
+        seed()
+        app.config['BENCH_ROWS'] = datagen.generate(
+            sessions=request.config.getoption('--bench-sessions'),
+            frameworks=request.config.getoption('--bench-frameworks'),
+            controls=request.config.getoption('--bench-controls'),
+        )
+        # As a worker would be after its first request.
+        from app.services.catalog import FrameworkCatalog
+        FrameworkCatalog.warm()
+    return app
+
+
+@pytest.fixture(scope='session')
+def tenant(app):
+    """The first synthetic session and one of its controls."""
+    from app.models import Control
+    from benchmarks.datagen import session_ids
+
+    session_id = session_ids(1)[0]
+    with app.app_context():
+        control = Control.query.filter_by(session_id=session_id).order_by(Control.sort_order).first()
+        return {'session_id': session_id, 'control_id': control.id}
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def sql_queries(benchmark):
+    """Run ``fn`` once, store its statement count in ``extra_info``, return the result."""
+    def measure(fn, *args, **kwargs):
+        with count_queries() as counter:
+            result = fn(*args, **kwargs)
+        benchmark.extra_info['sql_queries'] = counter.count
+        return result
+    return measure
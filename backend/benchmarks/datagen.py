@@ -0,0 +1,291 @@
+"""
+Synthetic large-tenant data generator.
+
+Creates ``sessions`` x ``frameworks`` synthetic frameworks, each with
+``families`` control families and ``controls`` controls, plus objectives,
+evidence, POA&M items (with milestones) and boundary assets in the same shape
+the seed data uses. Rows are built deterministically from ``--seed`` and
+bulk-inserted with the seed loader's executemany upsert, so re-running against
+the same database is a no-op.
+
+    python -m benchmarks.datagen --database sqlite:///large.db \\
+        --sessions 10 --frameworks 2 --controls 2000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CONTROL_STATUSES = (
+    ('implemented', 50), ('partially_implemented', 15), ('planned', 10),
+    ('not_implemented', 10), ('not_applicable', 5), ('not_assessed', 10),
+)
+OBJECTIVE_STATUSES = (('satisfied', 60), ('other_than_satisfied', 25), ('not_assessed', 15))
+EVIDENCE_TYPES = ('document', 'screenshot', 'configuration', 'log', 'policy')
+RISK_LEVELS = ('low', 'moderate', 'high', 'critical')
+POAM_STATUSES = ('open', 'in_progress', 'completed', 'cancelled')
+TEAMS = ('IT Operations', 'Security', 'HR', 'Facilities', 'Engineering')
+CONTROL_TYPES = ('basic', 'derived')
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def build_session_rows(session_id, frameworks=1, families=14, controls=110,
+                       objectives_per_control=3, evidence_per_control=2,
+                       poam_ratio=0.15, assets=50, seed=0, catalog=True):
+    """Return ``{model: [row dicts]}`` for one synthetic session.
+
+    ``catalog=False`` leaves out the shared definition rows (identical for
+    every session) when another session already supplies them.
+    """
+    from app.models import (
+        FamilyDefinition, ControlDefinition, Framework, ControlFamily, Control,
+        AssessmentObjective, Evidence, POAMItem, POAMMilestone, BoundaryAsset,
+    )
+    from app.seed import make_definition_id, make_id
+
+    rng = random.Random(f'{seed}/{session_id}')
+    today = date(2026, 1, 1)
+    rows = {model: [] for model in (
+        FamilyDefinition, ControlDefinition, Framework, ControlFamily, Control,
+        AssessmentObjective, Evidence, POAMItem, POAMMilestone, BoundaryAsset,
+    )}
+
+    def sid(name):
+        return make_id(f'synthetic/{name}', session_id)
+
+    for f in range(frameworks):
+        # Catalog attributes are the same in every session, like a real framework.
+        catalog_rng = random.Random(f'{seed}/framework-{f}')
+        framework_id = sid(f'framework-{f}')
+        framework = (f'Synthetic Framework {f + 1}', '1.0')
+        rows[Framework].append({
+            'id': framework_id,
+            'name': framework[0],
+            'version': framework[1],
+            'description': 'Generated benchmark framework',
+            'total_controls': controls,
+            'total_objectives': controls * objectives_per_control,
+            'session_id': session_id,
+        })
+
+        family_ids = []
+        for fam in range(families):
+            family_ids.append(sid(f'family-{f}-{fam}'))
+            family_code = f'F{f + 1}.{fam + 1:02d}'
+            definition_id = make_definition_id('family', *framework, family_code)
+            if catalog:
+                rows[FamilyDefinition].append({
+                    'id': definition_id,
+                    'framework_name': framework[0],
+                    'framework_version': framework[1],
+                    'family_code': family_code,
+                    'name': f'Synthetic Family {fam + 1}',
+                    'description': 'Generated benchmark family',
+                    'control_count': -(-controls // families),
+                    'sort_order': fam + 1,
+                })
+            rows[ControlFamily].append({
+                'id': family_ids[-1],
+                'framework_id': framework_id,
+                'definition_id': definition_id,
+                'family_code': family_code,
+                'name': f'Synthetic Family {fam + 1}',
+                'control_count': -(-controls // families),
+                'sort_order': fam + 1,
+                'session_id': session_id,
+            })
+
+        for c in range(controls):
+            fam = c % families
+            control_number = f'{f + 1}.{fam + 1}.{c + 1}'
+            control_id = sid(f'control-{f}-{c}')
+            weight = catalog_rng.choice((1, 1, 1, 3, 5))
+            control_type = catalog_rng.choice(CONTROL_TYPES)
+            status = _weighted(rng, CONTROL_STATUSES)
+            definition_id = make_definition_id('control', *framework, control_number)
+            if catalog:
+                rows[ControlDefinition].append({
+                    'id': definition_id,
+                    'framework_name': framework[0],
+                    'framework_version': framework[1],
+                    'family_code': f'F{f + 1}.{fam + 1:02d}',
+                    'control_number': control_number,
+                    'title': f'Synthetic control {control_number}',
+                    'requirement_text': 'Limit system access to authorized users. ' * 3,
+                    'plain_english': 'Only let the right people in.',
+                    'guidance_text': 'Access control policies control access between subjects. ' * 5,
+                    'control_type': control_type,
+                    'weight': weight,
+                    'sprs_points_if_not_met': -weight,
+                })
+            rows[Control].append({
+                'id': control_id,
+                'family_id': family_ids[fam],
+                'definition_id': definition_id,
+                'control_number': control_number,
+                'plain_english': None,
+                'guidance_text': None,
+                'implementation_status': status,
+                'implementation_notes': 'Implemented via directory groups.' if status == 'implemented' else None,
+                'assessor_notes': None,
+                'last_assessed_date': (today - timedelta(days=rng.randint(0, 365))).isoformat(),
+                'assessed_by': 'benchmark',
+                'sort_order': c + 1,
+                'session_id': session_id,
+            })
+
+            for o in range(objectives_per_control):
+                rows[AssessmentObjective].append({
+                    'id': sid(f'objective-{f}-{c}-{o}'),
+                    'control_id': control_id,
+                    'objective_number': f'{control_number}[{chr(ord("a") + o)}]',
+                    'objective_text': 'Determine if authorized users are identified.',
+                    'status': _weighted(rng, OBJECTIVE_STATUSES),
+                    'notes': None,
+                    'session_id': session_id,
+                })
+
+            for e in range(evidence_per_control):
+                rows[Evidence].append({
+                    'id': sid(f'evidence-{f}-{c}-{e}'),
+                    'control_id': control_id,
+                    'evidence_type': rng.choice(EVIDENCE_TYPES),
+                    'title': f'Evidence {e + 1} for {control_number}',
+                    'description': 'Generated benchmark evidence',
+                    'file_path': None,
+                    'external_url': f'https://evidence.example/{control_number}/{e}',
+                    'uploaded_at': (today - timedelta(days=rng.randint(0, 365))).isoformat(),
+                    'uploaded_by': 'benchmark',
+                    'session_id': session_id,
+                })
+
+            if rng.random() < poam_ratio:
+                poam_id = sid(f'poam-{f}-{c}')
+                start = today + timedelta(days=rng.randint(-180, 90))
+                end = start + timedelta(days=rng.randint(30, 365))
+                poam_status = rng.choice(POAM_STATUSES)
+                milestones = [
+                    {
+                        'description': f'Milestone {m + 1}',
+                        'due_date': (start + (end - start) * (m + 1) / 3).isoformat(),
+                        'status': 'completed' if poam_status == 'completed' or m == 0 else 'planned',
+                    }
+                    for m in range(3)
+                ]
+                rows[POAMItem].append({
+                    'id': poam_id,
+                    'control_id': control_id,
+                    'weakness_description': f'Gap identified in {control_number}',
+                    'remediation_plan': 'Remediate per vendor guidance.',
+                    'risk_level': rng.choice(RISK_LEVELS),
+                    'responsible_person': 'Benchmark Owner',
+                    'responsible_team': rng.choice(TEAMS),
+                    'planned_start_date': start.isoformat(),
+                    'planned_completion_date': end.isoformat(),
+                    'actual_completion_date': end.isoformat() if poam_status == 'completed' else None,
+                    'estimated_cost': round(rng.uniform(500, 50000), 2) if rng.random() < 0.8 else None,
+                    'cost_notes': None,
+                    'status': poam_status,
+                    'milestones': json.dumps(milestones),
+                    'created_at': start.isoformat(),
+                    'updated_at': start.isoformat(),
+                    'session_id': session_id,
+                })
+                for position, milestone in enumerate(milestones):
+                    rows[POAMMilestone].append({
+                        'id': sid(f'milestone-{f}-{c}-{position}'),
+                        'poam_id': poam_id,
+                        'position': position,
+                        'description': milestone['description'],
+                        'status': milestone['status'],
+                        'due_date': milestone['due_date'],
+                        'completed_at': milestone['due_date'] if milestone['status'] == 'completed' else None,
+                        'session_id': session_id,
+                    })
+
+    for a in range(assets):
+        rows[BoundaryAsset].append({
+            'id': sid(f'asset-{a}'),
+            'boundary_name': 'CUI Enclave',
+            'asset_tracker_id': f'SYN-{a:05d}',
+            'asset_name': f'synthetic-host-{a:05d}',
+            'asset_type': rng.choice(('server', 'workstation', 'network', 'cloud')),
+            'data_classification': rng.choice(('CUI', 'FCI', 'Public')),
+            'in_scope': 1,
+            'notes': None,
+            'session_id': session_id,
+        })
+
+    return rows
+
+
+def session_ids(sessions):
+    return [f'synthetic-{i:04d}' for i in range(sessions)]
+
+
+def generate(sessions=1, **options):
+    """Insert synthetic data for ``sessions`` sessions; returns row counts per table.
+
+    Must run inside an application context.
+    """
+    from app.extensions import db
+    from app.seed import bulk_upsert
+    from app.services.catalog import FrameworkCatalog
+    from app.services.versioning import SessionVersions
+
+    counts = {}
+    for i, session_id in enumerate(session_ids(sessions)):
+        rows = build_session_rows(session_id, catalog=i == 0, **options)
+        for model, model_rows in rows.items():
+            bulk_upsert(model, model_rows)
+            counts[model.__tablename__] = counts.get(model.__tablename__, 0) + len(model_rows)
+        SessionVersions.bump(session_id, [
+            model.__tablename__ for model in rows if 'session_id' in model.__table__.c
+        ])
+        FrameworkCatalog.changed()
+        db.session.commit()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database', default=os.getenv('DATABASE_URL', 'sqlite:///synthetic.db'))
+    parser.add_argument('--sessions', type=int, default=1)
+    parser.add_argument('--frameworks', type=int, default=1)
+    parser.add_argument('--families', type=int, default=14)
+    parser.add_argument('--controls', type=int, default=1000, help='controls per framework')
+    parser.add_argument('--objectives', type=int, default=3, help='objectives per control')
+    parser.add_argument('--evidence', type=int, default=2, help='evidence items per control')
+    parser.add_argument('--poam-ratio', type=float, default=0.15)
+    parser.add_argument('--assets', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    from app import create_app
+    from app.extensions import db
+
+    app = create_app('testing', SQLALCHEMY_DATABASE_URI=args.database)
+    with app.app_context():
+        db.create_all()
+        start = time.perf_counter()
+        counts = generate(
+            sessions=args.sessions, frameworks=args.frameworks, families=args.families,
+            controls=args.controls, objectives_per_control=args.objectives,
+            evidence_per_control=args.evidence, poam_ratio=args.poam_ratio,
+            assets=args.assets, seed=args.seed,
+        )
+        elapsed = time.perf_counter() - start
+    print(json.dumps({'rows': counts, 'seconds': round(elapsed, 2)}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
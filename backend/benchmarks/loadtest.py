@@ -0,0 +1,319 @@
+"""
+Load generator that replays assessor workflows against a running instance.
+
+Each virtual user logs in, then loops: dashboard -> families -> browse a few
+controls and open them -> update one control's status -> attach evidence,
+pausing for a random think time between steps. Latency percentiles
+(p50/p95/p99), throughput and error rate are reported per endpoint and overall.
+
+The HTTP client is a small keep-alive HTTP/1.1 implementation on asyncio
+streams, so no third-party packages are needed. Status updates and evidence
+uploads modify data; point ``--session-id`` at a throwaway session
+(``flask seed --session-id loadtest``) or pass ``--read-only``.
+
+    python -m benchmarks.loadtest --url http://127.0.0.1:5000 \\
+        --users 20 --duration 60 --session-id loadtest --output load.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import statistics
+import time
+from urllib.parse import urlencode, urlsplit
+
+CONTROL_STATUSES = (
+    'implemented', 'partially_implemented', 'planned', 'not_implemented',
+)
+
+
+class HTTPError(Exception):
+    pass
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection (reopened transparently if closed)."""
+
+    def __init__(self, base_url, timeout=30.0):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self.reader = self.writer = None
+
+    async def _connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.reader = self.writer = None
+
+    async def request(self, method, path, json_body=None, headers=None):
+        for attempt in (1, 2):
+            try:
+                return await asyncio.wait_for(
+                    self._request(method, path, json_body, headers or {}), self.timeout
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # The server may drop idle keep-alive connections; retry once.
+                await self.close()
+                if attempt == 2:
+                    raise
+            except BaseException:
+                # Timed out or failed mid-request: a late response may still
+                # arrive on this connection, so it must not be reused.
+                await self.close()
+                raise
+
+    async def _request(self, method, path, json_body, headers):
+        if self.writer is None:
+            await self._connect()
+        body = json.dumps(json_body).encode() if json_body is not None else b''
+        lines = [
+            f'{method} {self.prefix}{path} HTTP/1.1',
+            f'Host: {self.host}:{self.port}',
+            'Connection: keep-alive',
+            'Accept: application/json',
+            f'Content-Length: {len(body)}',
+        ]
+        if json_body is not None:
+            lines.append('Content-Type: application/json')
+        lines += [f'{k}: {v}' for k, v in headers.items()]
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode() + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError('connection closed by server')
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            payload = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            payload = await self.reader.readexactly(int(response_headers['content-length']))
+        elif status in (204, 304) or method == 'HEAD':
+            payload = b''
+        else:
+            payload = await self.reader.read()
+            await self.close()
+
+        if response_headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, response_headers, payload
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, name, elapsed, ok):
+        self.latencies.setdefault(name, []).append(elapsed)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    @staticmethod
+    def percentile(ordered, pct):
+        """Nearest-rank percentile of an already sorted list."""
+        if not ordered:
+            return 0.0
+        rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    def summarize(self, wall_seconds):
+        def row(samples, errors):
+            ordered = sorted(samples)
+            return {
+                'requests': len(ordered),
+                'errors': errors,
+                'error_rate': round(errors / len(ordered), 4) if ordered else 0.0,
+                'throughput_rps': round(len(ordered) / wall_seconds, 2),
+                'mean_ms': round(statistics.mean(ordered) * 1000, 2) if ordered else 0.0,
+                'p50_ms': round(self.percentile(ordered, 50) * 1000, 2),
+                'p95_ms': round(self.percentile(ordered, 95) * 1000, 2),
+                'p99_ms': round(self.percentile(ordered, 99) * 1000, 2),
+                'max_ms': round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            }
+
+        endpoints = {
+            name: row(samples, self.errors.get(name, 0))
+            for name, samples in sorted(self.latencies.items())
+        }
+        everything = [s for samples in self.latencies.values() for s in samples]
+        return {
+            'duration_seconds': round(wall_seconds, 2),
+            'overall': row(everything, sum(self.errors.values())),
+            'endpoints': endpoints,
+        }
+
+
+class AssessorUser:
+    """One simulated assessor working through controls."""
+
+    def __init__(self, args, stats, rng):
+        self.args = args
+        self.stats = stats
+        self.rng = rng
+        self.conn = Connection(args.url, timeout=args.timeout)
+        self.headers = {}
+
+    def _path(self, path, **params):
+        params['session_id'] = self.args.session_id
+        return f'{path}?{urlencode(params)}'
+
+    async def call(self, name, method, path, json_body=None):
+        start = time.perf_counter()
+        try:
+            status, _, payload = await self.conn.request(method, path, json_body, self.headers)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            self.stats.record(name, time.perf_counter() - start, ok=False)
+            return None
+        self.stats.record(name, time.perf_counter() - start, ok=status < 400)
+        if status >= 400 or not payload:
+            return None
+        try:
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    async def think(self):
+        await asyncio.sleep(self.rng.uniform(self.args.think_min, self.args.think_max) / 1000)
+
+    async def login(self):
+        data = await self.call('POST /api/auth/login', 'POST', '/api/auth/login', {
+            'username': self.args.username, 'password': self.args.password,
+        })
+        if data and data.get('token'):
+            self.headers['Authorization'] = f"Bearer {data['token']}"
+
+    async def workflow(self):
+        await self.call('GET /api/dashboard', 'GET', self._path('/api/dashboard'))
+        await self.think()
+
+        families = await self.call(
+            'GET /api/controls/families', 'GET', self._path('/api/controls/families')
+        ) or []
+        await self.think()
+
+        opened = []
+        for _ in range(self.args.browse):
+            params = {'per_page': 50}
+            if families:
+                params['family_id'] = self.rng.choice(families)['id']
+            listing = await self.call(
+                'GET /api/controls', 'GET', self._path('/api/controls', **params)
+            ) or {}
+            controls = listing.get('controls') or []
+            await self.think()
+            if not controls:
+                continue
+            control = self.rng.choice(controls)
+            await self.call(
+                'GET /api/controls/<id>', 'GET', self._path(f"/api/controls/{control['id']}")
+            )
+            opened.append(control)
+            await self.think()
+
+        if self.args.read_only or not opened:
+            return
+        control = self.rng.choice(opened)
+        await self.call(
+            'PUT /api/controls/<id>/status', 'PUT',
+            self._path(f"/api/controls/{control['id']}/status"),
+            {'implementation_status': self.rng.choice(CONTROL_STATUSES), 'assessed_by': 'loadtest'},
+        )
+        await self.think()
+        await self.call('POST /api/evidence', 'POST', self._path('/api/evidence'), {
+            'control_id': control['id'],
+            'title': f'Load test evidence {self.rng.randrange(1 << 30)}',
+            'evidence_type': 'document',
+            'uploaded_by': 'loadtest',
+        })
+        await self.think()
+
+    async def run(self, deadline):
+        try:
+            await self.login()
+            while time.perf_counter() < deadline:
+                await self.workflow()
+        finally:
+            await self.conn.close()
+
+
+async def run(args):
+    stats = Stats()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    users = []
+    for i in range(args.users):
+        user = AssessorUser(args, stats, random.Random(f'{args.seed}/{i}'))
+        users.append(asyncio.create_task(user.run(deadline)))
+        if args.ramp_up:
+            await asyncio.sleep(args.ramp_up / args.users)
+    await asyncio.gather(*users)
+    return stats.summarize(time.perf_counter() - start)
+
+
+def format_report(report):
+    lines = [
+        f"{'endpoint':<34} {'reqs':>7} {'err%':>6} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}"
+    ]
+    rows = list(report['endpoints'].items()) + [('TOTAL', report['overall'])]
+    for name, r in rows:
+        lines.append(
+            f"{name:<34} {r['requests']:>7} {r['error_rate'] * 100:>6.2f} "
+            f"{r['throughput_rps']:>8.2f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='base URL of the instance')
+    parser.add_argument('--users', type=int, default=10, help='concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds to run')
+    parser.add_argument('--ramp-up', type=float, default=0.0, help='seconds to start all users')
+    parser.add_argument('--session-id', default='__default__')
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin123')
+    parser.add_argument('--browse', type=int, default=3, help='controls opened per iteration')
+    parser.add_argument('--think-min', type=float, default=100.0, help='min think time (ms)')
+    parser.add_argument('--think-max', type=float, default=500.0, help='max think time (ms)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='per-request timeout (s)')
+    parser.add_argument('--read-only', action='store_true', help='skip status updates and uploads')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the JSON report to this file')
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
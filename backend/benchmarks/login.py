@@ -0,0 +1,72 @@
+"""
+Login throughput benchmark.
+
+Reports app construction time (which should include no password hashing) and
+sequential/concurrent ``POST /api/auth/login`` throughput. Each login performs
+exactly one password hash check, so throughput is bounded by the KDF cost.
+
+    python -m benchmarks.login --logins 20 --threads 4
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('TEST_DATABASE_URL', 'sqlite://')
+
+CREDENTIALS = {'username': 'admin', 'password': 'admin123'}
+
+
+def _login(app):
+    client = app.test_client()
+    start = time.perf_counter()
+    response = client.post('/api/auth/login', json=CREDENTIALS)
+    elapsed = time.perf_counter() - start
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return elapsed
+
+
+def run(logins=20, threads=4):
+    from app import create_app
+
+    start = time.perf_counter()
+    app = create_app('testing')
+    create_ms = (time.perf_counter() - start) * 1000
+
+    _login(app)  # warm-up
+
+    start = time.perf_counter()
+    sequential = [_login(app) for _ in range(logins)]
+    sequential_wall = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        concurrent = list(pool.map(lambda _: _login(app), range(logins)))
+    concurrent_wall = time.perf_counter() - start
+
+    return {
+        'create_app_ms': round(create_ms, 2),
+        'sequential': {
+            'logins': logins,
+            'logins_per_sec': round(logins / sequential_wall, 2),
+            'median_ms': round(statistics.median(sequential) * 1000, 2),
+        },
+        'concurrent': {
+            'threads': threads,
+            'logins': logins,
+            'logins_per_sec': round(logins / concurrent_wall, 2),
+            'median_ms': round(statistics.median(concurrent) * 1000, 2),
+        },
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--logins', type=int, default=20)
+    parser.add_argument('--threads', type=int, default=4)
+    args = parser.parse_args()
+    print(json.dumps(run(args.logins, args.threads), indent=2))
@@ -0,0 +1,93 @@
+"""
+OSCAL export benchmark.
+
+Generates one synthetic session with ``benchmarks.datagen`` (``--controls``
+controls with objectives, evidence, POA&M items and boundary assets) into a
+scratch SQLite database, streams each OSCAL model to a file with
+``export_oscal`` and reports the wall time, the document size and the peak
+Python heap of the export, next to the peak heap of building the same
+document in memory and serializing it with ``json.dumps``.
+
+    python -m benchmarks.oscal_export --controls 5000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _materialize(value):
+    """The document with every streamed array read into a list (and empty ones dropped)."""
+    if isinstance(value, Iterator):
+        return [_materialize(item) for item in value]
+    if isinstance(value, dict):
+        members = {key: _materialize(member) for key, member in value.items()}
+        return {key: member for key, member in members.items() if member != []}
+    return value
+
+
+def _peak(fn):
+    """Peak traced Python heap while running ``fn``."""
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run(controls=5000, evidence=2, objectives=3):
+    from app import create_app
+    from app.extensions import db
+    from app.oscal_export import MODELS, document, export_oscal, session_framework
+    from benchmarks import datagen
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(
+            'testing', SQLALCHEMY_DATABASE_URI=f'sqlite:///{tmp}/export.db', SLOW_QUERY_THRESHOLD_MS=None,
+        )
+        results = {}
+        with app.app_context():
+            db.create_all()
+            datagen.generate(
+                sessions=1, controls=controls, objectives_per_control=objectives,
+                evidence_per_control=evidence,
+            )
+            session_id = datagen.session_ids(1)[0]
+            framework = session_framework(session_id)
+
+            for model in MODELS:
+                path = os.path.join(tmp, f'{model}.json')
+
+                def stream():
+                    with open(path, 'wb') as f:
+                        return export_oscal(f, model, session_id)
+
+                def in_memory():
+                    return json.dumps(_materialize(document(model, session_id, framework)))
+
+                start = time.perf_counter()
+                size = stream()
+                elapsed = time.perf_counter() - start
+                results[model] = {
+                    'bytes': size,
+                    'seconds': round(elapsed, 2),
+                    'stream_peak_bytes': _peak(stream),
+                    'in_memory_peak_bytes': _peak(in_memory),
+                }
+            db.engine.dispose()
+        return {'controls': controls, **results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--controls', type=int, default=5000)
+    parser.add_argument('--evidence', type=int, default=2, help='evidence items per control')
+    parser.add_argument('--objectives', type=int, default=3, help='objectives per control')
+    args = parser.parse_args()
+    print(json.dumps(run(args.controls, args.evidence, args.objectives), indent=2))
@@ -0,0 +1,195 @@
+"""
+OSCAL catalog import benchmark.
+
+Writes a synthetic catalog shaped like NIST SP 800-53 Rev 5 (20 families,
+base controls with enhancements, parameters, statement items, guidance,
+nested assessment objectives and some withdrawn controls), imports it into a
+scratch SQLite database with ``import_catalog`` and reports the wall time and
+the peak Python heap of the import, next to the peak heap of a plain
+``json.load`` of the same file.
+
+    python -m benchmarks.oscal_import --controls 1200
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FAMILIES = (
+    ('ac', 'Access Control'), ('at', 'Awareness and Training'), ('au', 'Audit and Accountability'),
+    ('ca', 'Assessment, Authorization, and Monitoring'), ('cm', 'Configuration Management'),
+    ('cp', 'Contingency Planning'), ('ia', 'Identification and Authentication'), ('ir', 'Incident Response'),
+    ('ma', 'Maintenance'), ('mp', 'Media Protection'), ('pe', 'Physical and Environmental Protection'),
+    ('pl', 'Planning'), ('pm', 'Program Management'), ('ps', 'Personnel Security'),
+    ('pt', 'PII Processing and Transparency'), ('ra', 'Risk Assessment'),
+    ('sa', 'System and Services Acquisition'), ('sc', 'System and Communications Protection'),
+    ('si', 'System and Information Integrity'), ('sr', 'Supply Chain Risk Management'),
+)
+WORDS = (
+    'organization system information access security control policy procedures personnel '
+    'defined review update monitor authorized account audit records frequency events '
+    'protect configuration baseline privileged functions users devices processes'
+).split()
+
+
+def _sentence(rng, n):
+    return ' '.join(rng.choice(WORDS) for _ in range(n)).capitalize() + '.'
+
+
+def _control(rng, control_id, label, enhancement=False):
+    params = [
+        {'id': f'{control_id}_odp.01', 'label': 'organization-defined personnel or roles'},
+        {'id': f'{control_id}_odp.02', 'select': {'how-many': 'one-or-more', 'choice': ['organization-level', 'system-level']}},
+    ]
+    items = [
+        {
+            'id': f'{control_id}_smt.{letter}',
+            'name': 'item',
+            'props': [{'name': 'label', 'value': f'{letter}.'}],
+            'prose': f'{_sentence(rng, 12)} {{{{ insert: param, {control_id}_odp.01 }}}}',
+            'parts': [
+                {
+                    'id': f'{control_id}_smt.{letter}.{i}',
+                    'name': 'item',
+                    'props': [{'name': 'label', 'value': f'{i}.'}],
+                    'prose': f'{_sentence(rng, 10)} {{{{ insert: param, {control_id}_odp.02 }}}}',
+                }
+                for i in range(1, 3)
+            ],
+        }
+        for letter in 'abc'
+    ]
+    objectives = [
+        {
+            'id': f'{control_id}_obj.{letter}-{i}',
+            'name': 'assessment-objective',
+            'props': [{'name': 'label', 'value': f'{label}{letter}.[0{i}]'}],
+            'prose': _sentence(rng, 14),
+        }
+        for letter in 'abc' for i in range(1, 3)
+    ]
+    return {
+        'id': control_id,
+        'class': 'SP800-53-enhancement' if enhancement else 'SP800-53',
+        'title': _sentence(rng, 4).rstrip('.'),
+        'params': params,
+        'props': [{'name': 'label', 'value': label}, {'name': 'sort-id', 'value': control_id}],
+        'links': [{'href': '#ref-1', 'rel': 'reference'}],
+        'parts': [
+            {'id': f'{control_id}_smt', 'name': 'statement', 'parts': items},
+            {'id': f'{control_id}_gdn', 'name': 'guidance', 'prose': ' '.join(_sentence(rng, 15) for _ in range(6))},
+            {
+                'id': f'{control_id}_obj',
+                'name': 'assessment-objective',
+                'props': [{'name': 'label', 'value': label}],
+                'parts': objectives,
+            },
+        ],
+    }
+
+
+def build_catalog(controls=1200, seed=0):
+    """A synthetic 800-53-shaped OSCAL catalog with roughly ``controls`` controls."""
+    rng = random.Random(seed)
+    per_family = max(1, controls // len(FAMILIES))
+    groups = []
+    for code, title in FAMILIES:
+        group_controls = []
+        count = 0
+        number = 0
+        while count < per_family:
+            number += 1
+            base_id = f'{code}-{number}'
+            control = _control(rng, base_id, f'{code.upper()}-{number}')
+            count += 1
+            enhancements = []
+            for e in range(1, min(rng.randint(0, 6), per_family - count) + 1):
+                enhancement = _control(rng, f'{base_id}.{e}', f'{code.upper()}-{number}({e})', enhancement=True)
+                if rng.random() < 0.15:
+                    enhancement['props'].append({'name': 'status', 'value': 'withdrawn'})
+                    enhancement['parts'] = []
+                enhancements.append(enhancement)
+                count += 1
+            if enhancements:
+                control['controls'] = enhancements
+            group_controls.append(control)
+        groups.append({'id': code, 'class': 'family', 'title': title, 'controls': group_controls})
+    return {
+        'catalog': {
+            'uuid': '00000000-0000-4000-8000-000000000053',
+            'metadata': {
+                'title': 'Synthetic SP 800-53',
+                'version': '5.1.1',
+                'oscal-version': '1.1.2',
+                'last-modified': '2024-01-01T00:00:00Z',
+            },
+            'groups': groups,
+            'back-matter': {'resources': [{'uuid': '00000000-0000-4000-8000-000000000001', 'title': 'ref-1'}]},
+        }
+    }
+
+
+def _peak(fn):
+    """Peak traced Python heap while running ``fn``."""
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run(controls=1200, sessions=1):
+    from app import create_app
+    from app.extensions import db
+    from app.oscal_import import import_catalog
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'catalog.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(build_catalog(controls), f)
+
+        def load():
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+
+        json_load_peak = _peak(load)
+        session_ids = ['__default__'] + [f'import-{i:04d}' for i in range(1, sessions)]
+
+        def import_into(name):
+            app = create_app(
+                'testing', SQLALCHEMY_DATABASE_URI=f'sqlite:///{tmp}/{name}.db', SLOW_QUERY_THRESHOLD_MS=None,
+            )
+            with app.app_context():
+                db.create_all()
+                try:
+                    return import_catalog(path, session_ids)
+                finally:
+                    db.engine.dispose()
+
+        start = time.perf_counter()
+        result = import_into('timed')
+        elapsed = time.perf_counter() - start
+        import_peak = _peak(lambda: import_into('traced'))
+
+        return {
+            **result,
+            'sessions': sessions,
+            'file_bytes': os.path.getsize(path),
+            'seconds': round(elapsed, 2),
+            'import_peak_bytes': import_peak,
+            'json_load_peak_bytes': json_load_peak,
+        }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--controls', type=int, default=1200)
+    parser.add_argument('--sessions', type=int, default=1)
+    args = parser.parse_args()
+    print(json.dumps(run(args.controls, args.sessions), indent=2))
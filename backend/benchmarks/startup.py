@@ -0,0 +1,79 @@
+"""
+Cold-start benchmark: time to import and build the app, and the latency of the
+first ``/apispec.json`` request, with and without a precomputed spec file.
+
+Each sample runs in a fresh interpreter so import costs are included.
+
+    python -m benchmarks.startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from app import create_app
+app = create_app('testing')
+t1 = time.perf_counter()
+flasgger_loaded = 'flasgger' in sys.modules
+client = app.test_client()
+t2 = time.perf_counter()
+client.get('/apispec.json', headers={'Accept-Encoding': 'gzip'})
+t3 = time.perf_counter()
+print(json.dumps({
+    'create_app_ms': (t1 - t0) * 1000,
+    'first_spec_ms': (t3 - t2) * 1000,
+    'flasgger_imported_at_startup': flasgger_loaded,
+}))
+"""
+
+
+def _sample(env):
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=BACKEND_DIR, env=env,
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _summarize(samples):
+    summary = {
+        key: {
+            'median': round(statistics.median(s[key] for s in samples), 2),
+            'min': round(min(s[key] for s in samples), 2),
+            'max': round(max(s[key] for s in samples), 2),
+        }
+        for key in ('create_app_ms', 'first_spec_ms')
+    }
+    summary['flasgger_imported_at_startup'] = any(s['flasgger_imported_at_startup'] for s in samples)
+    return summary
+
+
+def run(runs=5):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        spec_path = os.path.join(tmp, 'apispec.json')
+        base_env = dict(os.environ, TEST_DATABASE_URL='sqlite://', OPENAPI_SPEC_PATH=spec_path)
+
+        results['generated_on_first_request'] = _summarize([_sample(base_env) for _ in range(runs)])
+
+        subprocess.run(
+            [sys.executable, '-m', 'flask', '--app', 'wsgi', 'build-openapi'],
+            cwd=BACKEND_DIR, env=base_env, check=True, capture_output=True,
+        )
+        results['precomputed'] = _summarize([_sample(base_env) for _ in range(runs)])
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.runs), indent=2))
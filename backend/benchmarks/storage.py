@@ -0,0 +1,143 @@
+"""
+Storage benchmark for the shared control catalog.
+
+Loads ``--sessions`` copies of the seed framework's families and controls
+into a scratch SQLite database in the current layout (text once in
+``family_definitions`` / ``control_definitions``, slim per-session
+``control_families`` / ``control_assessments`` rows), then copies the same
+rows into tables with the pre-catalog schema, where every session row carries
+the text. Reports the on-disk size of each layout's tables and indexes (from
+``dbstat``) in total and per session.
+
+    python -m benchmarks.storage --sessions 10000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LEGACY_DDL = (
+    """
+    CREATE TABLE legacy_control_families (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        framework_id VARCHAR(36) NOT NULL,
+        family_code VARCHAR(10) NOT NULL,
+        name VARCHAR(200) NOT NULL,
+        description TEXT,
+        control_count INTEGER,
+        sort_order INTEGER,
+        session_id VARCHAR(100)
+    )
+    """,
+    """
+    CREATE TABLE legacy_controls (
+        id VARCHAR(36) NOT NULL PRIMARY KEY,
+        family_id VARCHAR(36) NOT NULL REFERENCES legacy_control_families (id),
+        control_number VARCHAR(20) NOT NULL,
+        title VARCHAR(300) NOT NULL,
+        requirement_text TEXT,
+        plain_english TEXT,
+        guidance_text TEXT,
+        control_type VARCHAR(20),
+        implementation_status VARCHAR(30),
+        weight INTEGER,
+        sprs_points_if_not_met INTEGER,
+        implementation_notes TEXT,
+        assessor_notes TEXT,
+        last_assessed_date VARCHAR(30),
+        assessed_by VARCHAR(100),
+        sort_order INTEGER,
+        session_id VARCHAR(100)
+    )
+    """,
+    """
+    INSERT INTO legacy_control_families
+    SELECT cf.id, cf.framework_id, cf.family_code, cf.name, d.description,
+           cf.control_count, cf.sort_order, cf.session_id
+    FROM control_families cf JOIN family_definitions d ON d.id = cf.definition_id
+    """,
+    """
+    INSERT INTO legacy_controls
+    SELECT c.id, c.family_id, c.control_number, d.title, d.requirement_text,
+           coalesce(c.plain_english, d.plain_english), coalesce(c.guidance_text, d.guidance_text),
+           d.control_type, c.implementation_status, d.weight, d.sprs_points_if_not_met,
+           c.implementation_notes, c.assessor_notes, c.last_assessed_date, c.assessed_by,
+           c.sort_order, c.session_id
+    FROM control_assessments c JOIN control_definitions d ON d.id = c.definition_id
+    """,
+)
+
+LAYOUTS = {
+    'catalog': ('family_definitions', 'control_definitions', 'control_families', 'control_assessments'),
+    'per_session_text': ('legacy_control_families', 'legacy_controls'),
+}
+
+
+def load(sessions):
+    """Insert the seed framework's families and controls for ``sessions`` sessions."""
+    from app.extensions import db
+    from app.models import FamilyDefinition, ControlDefinition, ControlFamily, Control
+    from app.seed import build_rows, load_seed_data
+
+    data = load_seed_data()
+    for i in range(sessions):
+        rows = build_rows(data, session_id='__default__' if i == 0 else f'storage-{i:05d}')
+        models = (ControlFamily, Control) if i else (FamilyDefinition, ControlDefinition, ControlFamily, Control)
+        for model in models:
+            db.session.execute(model.__table__.insert(), rows[model])
+        if i % 500 == 0:
+            db.session.commit()
+    db.session.commit()
+
+
+def table_sizes(conn):
+    """Bytes on disk per table, counting each table's indexes with it."""
+    return dict(conn.exec_driver_sql(
+        'SELECT m.tbl_name, sum(s.pgsize) FROM dbstat s '
+        'JOIN sqlite_master m ON m.name = s.name GROUP BY m.tbl_name'
+    ).all())
+
+
+def run(sessions):
+    from app import create_app
+    from app.extensions import db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(
+            'testing', SQLALCHEMY_DATABASE_URI=f'sqlite:///{tmp}/storage.db', SLOW_QUERY_THRESHOLD_MS=None,
+        )
+        with app.app_context():
+            db.create_all()
+            start = time.perf_counter()
+            load(sessions)
+            with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+                for statement in LEGACY_DDL:
+                    conn.exec_driver_sql(statement)
+                conn.exec_driver_sql('VACUUM')
+                sizes = table_sizes(conn)
+            elapsed = time.perf_counter() - start
+            db.engine.dispose()
+
+    results = {'sessions': sessions, 'seconds': round(elapsed, 2)}
+    for layout, tables in LAYOUTS.items():
+        total = sum(sizes.get(table, 0) for table in tables)
+        results[layout] = {
+            'tables': {table: sizes.get(table, 0) for table in tables},
+            'total_bytes': total,
+            'bytes_per_session': round(total / sessions),
+        }
+    results['reduction'] = round(
+        1 - results['catalog']['total_bytes'] / results['per_session_text']['total_bytes'], 3
+    )
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=10000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.sessions), indent=2))
@@ -0,0 +1,9 @@
+"""
+Fixtures for the regression tests.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,138 @@
+import json
+import sqlite3
+import pytest
+from sqlalchemy import inspect
+from app import create_app
+from app.catalog_migration import migrate_catalog
+from app.extensions import db
+
+# Schema of a database created before the shared control catalog.
+BASELINE_SCHEMA = '''
+CREATE TABLE frameworks (
+    id VARCHAR(36) NOT NULL, name VARCHAR(200) NOT NULL, version VARCHAR(50), description TEXT,
+    total_controls INTEGER, total_objectives INTEGER, session_id VARCHAR(100),
+    PRIMARY KEY (id)
+);
+CREATE TABLE boundary_assets (
+    id VARCHAR(36) NOT NULL, boundary_name VARCHAR(200), asset_tracker_id VARCHAR(100),
+    asset_name VARCHAR(200), asset_type VARCHAR(50), data_classification VARCHAR(20),
+    in_scope INTEGER, notes TEXT, session_id VARCHAR(100),
+    PRIMARY KEY (id)
+);
+CREATE TABLE control_families (
+    id VARCHAR(36) NOT NULL, framework_id VARCHAR(36) NOT NULL, family_code VARCHAR(10) NOT NULL,
+    name VARCHAR(200) NOT NULL, description TEXT, control_count INTEGER, sort_order INTEGER,
+    session_id VARCHAR(100),
+    PRIMARY KEY (id), FOREIGN KEY(framework_id) REFERENCES frameworks (id)
+);
+CREATE TABLE controls (
+    id VARCHAR(36) NOT NULL, family_id VARCHAR(36) NOT NULL, control_number VARCHAR(20) NOT NULL,
+    title VARCHAR(300) NOT NULL, requirement_text TEXT, plain_english TEXT, guidance_text TEXT,
+    control_type VARCHAR(20), implementation_status VARCHAR(30), weight INTEGER,
+    sprs_points_if_not_met INTEGER, implementation_notes TEXT, assessor_notes TEXT,
+    last_assessed_date VARCHAR(30), assessed_by VARCHAR(100), sort_order INTEGER,
+    session_id VARCHAR(100),
+    PRIMARY KEY (id), FOREIGN KEY(family_id) REFERENCES control_families (id)
+);
+CREATE TABLE assessment_objectives (
+    id VARCHAR(36) NOT NULL, control_id VARCHAR(36) NOT NULL, objective_number VARCHAR(30) NOT NULL,
+    objective_text TEXT NOT NULL, status VARCHAR(30), notes TEXT, session_id VARCHAR(100),
+    PRIMARY KEY (id), FOREIGN KEY(control_id) REFERENCES controls (id)
+);
+CREATE TABLE evidence (
+    id VARCHAR(36) NOT NULL, control_id VARCHAR(36) NOT NULL, evidence_type VARCHAR(30),
+    title VARCHAR(300) NOT NULL, description TEXT, file_path VARCHAR(500), external_url VARCHAR(500),
+    uploaded_at VARCHAR(30), uploaded_by VARCHAR(100), session_id VARCHAR(100),
+    PRIMARY KEY (id), FOREIGN KEY(control_id) REFERENCES controls (id)
+);
+CREATE TABLE poam_items (
+    id VARCHAR(36) NOT NULL, control_id VARCHAR(36) NOT NULL, weakness_description TEXT,
+    remediation_plan TEXT, risk_level VARCHAR(20), responsible_person VARCHAR(200),
+    responsible_team VARCHAR(200), planned_start_date VARCHAR(30), planned_completion_date VARCHAR(30),
+    actual_completion_date VARCHAR(30), estimated_cost FLOAT, cost_notes TEXT, status VARCHAR(30),
+    milestones TEXT, created_at VARCHAR(30), updated_at VARCHAR(30), session_id VARCHAR(100),
+    PRIMARY KEY (id), FOREIGN KEY(control_id) REFERENCES controls (id)
+);
+'''
+
+MILESTONES = [
+    {'description': 'Select MFA vendor', 'status': 'completed', 'completed_date': '2026-01-15'},
+    {'description': 'Roll out to admins', 'status': 'planned', 'due_date': '2026-03-01'},
+]
+
+
+def _baseline_database(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.execute(
+        "INSERT INTO frameworks VALUES ('fw', 'NIST SP 800-171', 'Rev 2', 'CUI', 2, 2, '__default__')"
+    )
+    conn.execute(
+        "INSERT INTO control_families VALUES ('ia', 'fw', 'IA', 'Identification and Authentication', "
+        "'Identify users.', 2, 1, '__default__')"
+    )
+    conn.executemany('INSERT INTO controls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', [
+        ('c1', 'ia', '3.5.1', 'Identification', 'Identify system users.', 'Know who is on the system.',
+         None, 'basic', 'implemented', 5, -5, None, None, None, None, 1, '__default__'),
+        ('c2', 'ia', '3.5.3', 'Multifactor Authentication', 'Use MFA.', 'Use a second factor.',
+         None, 'derived', 'not_implemented', 5, -5, None, None, None, None, 2, '__default__'),
+    ])
+    conn.executemany('INSERT INTO assessment_objectives VALUES (?, ?, ?, ?, ?, ?, ?)', [
+        ('o1', 'c1', '3.5.1[a]', 'Users are identified.', 'met', None, '__default__'),
+        ('o2', 'c2', '3.5.3[a]', 'MFA is used.', 'not_met', None, '__default__'),
+    ])
+    conn.execute(
+        "INSERT INTO evidence VALUES ('e1', 'c1', 'document', 'Account policy', NULL, NULL, NULL, "
+        "'2026-01-02T00:00:00', 'assessor', '__default__')"
+    )
+    conn.execute(
+        'INSERT INTO poam_items (id, control_id, weakness_description, status, milestones, '
+        'planned_completion_date, updated_at, session_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        ('p1', 'c2', 'No MFA', 'open', json.dumps(MILESTONES), '2026-06-30', '2026-01-15T00:00:00',
+         '__default__'),
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture(params=[False, True], ids=['baseline', 'after-init-db'])
+def app(request, tmp_path):
+    path = tmp_path / 'baseline.db'
+    _baseline_database(path)
+    app = create_app('testing', SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}')
+    with app.app_context():
+        if request.param:
+            # ``init-db`` on an old database adds an empty control_assessments table.
+            db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_migrated_baseline_database_serves_the_dashboard(app):
+    assert migrate_catalog() == (1, 2)
+    assert migrate_catalog() is None
+
+    inspector = inspect(db.engine)
+    for table in db.metadata.tables:
+        assert inspector.has_table(table)
+    for table in ('control_assessments', 'control_families'):
+        columns = {column['name']: column for column in inspector.get_columns(table)}
+        assert columns['definition_id']['nullable'] is False
+
+    client = app.test_client()
+    response = client.get('/api/dashboard')
+    assert response.status_code == 200
+    assert response.get_json()['total_controls'] == 2
+
+    control = client.get('/api/controls/c2').get_json()
+    assert control['title'] == 'Multifactor Authentication'
+    assert control['plain_english'] == 'Use a second factor.'
+
+    milestones = db.session.execute(db.text(
+        'SELECT description, status, completed_at FROM poam_milestones ORDER BY position'
+    )).all()
+    assert [tuple(row) for row in milestones] == [
+        ('Select MFA vendor', 'completed', '2026-01-15'),
+        ('Roll out to admins', 'planned', None),
+    ]
@@ -0,0 +1,27 @@
+import pytest
+from app import create_app
+from app.extensions import db
+from app.seed import seed
+
+
+@pytest.fixture
+def client():
+    app = create_app('testing', SQLALCHEMY_DATABASE_URI='sqlite://')
+    with app.app_context():
+        db.create_all()
+        seed()
+        yield app.test_client()
+        db.session.remove()
+
+
+def test_projection_without_version_uses_the_only_catalog_version(client):
+    versioned = client.get('/api/crosswalk/projection?framework=CMMC+Level+2&version=2.0')
+    unversioned = client.get('/api/crosswalk/projection?framework=CMMC+Level+2')
+    assert versioned.status_code == unversioned.status_code == 200
+    assert unversioned.get_json() == versioned.get_json()
+    assert unversioned.get_json()['framework'] == {'name': 'CMMC Level 2', 'version': '2.0'}
+    assert unversioned.get_json()['mapped_controls'] > 0
+
+
+def test_projection_of_unknown_framework_is_404(client):
+    assert client.get('/api/crosswalk/projection?framework=Nope').status_code == 404
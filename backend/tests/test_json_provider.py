@@ -0,0 +1,26 @@
+import json
+import pytest
+from app import create_app
+from app.json_provider import orjson
+
+pytestmark = pytest.mark.skipif(orjson is None, reason='orjson is not installed')
+
+PAYLOAD = {
+    'title': 'Contrôle d’accès – Zugriffsprüfung ✓',
+    'notes': ['naïve café', '日本語', 'emoji 🔒'],
+    'count': 3,
+}
+
+
+def _render(provider):
+    app = create_app('testing', SQLALCHEMY_DATABASE_URI='sqlite://', JSON_PROVIDER=provider)
+    with app.app_context():
+        return app.json.response(PAYLOAD).get_data()
+
+
+def test_orjson_output_is_equivalent_for_non_ascii_text():
+    stdlib, fast = _render('stdlib'), _render('orjson')
+    assert json.loads(fast) == json.loads(stdlib) == PAYLOAD
+    # Equivalent, not identical: the stdlib escapes non-ASCII, orjson writes UTF-8.
+    assert b'\\u00f4' in stdlib
+    assert 'Contrôle'.encode() in fast
@@ -2,8 +2,10 @@ import client from './client';
 import type { Control, ControlFamily, AssessmentObjective } from '@/types';
 
 export const controlsApi = {
-  getFamilies: async (): Promise<ControlFamily[]> => {
-    const { data } = await client.get('/controls/families');
+  getFamilies: async (params?: {
+    include?: 'controls';
+  }): Promise<ControlFamily[]> => {
+    const { data } = await client.get('/controls/families', { params });
     return data;
   },
 
@@ -11,6 +13,7 @@ export const controlsApi = {
     family_id?: string;
     status?: string;
     search?: string;
+    fields?: string;
   }): Promise<Control[]> => {
     const { data } = await client.get('/controls', { params });
     return Array.isArray(data) ? data : data.controls || [];
@@ -36,4 +39,19 @@ export const controlsApi = {
     const { data } = await client.put(`/controls/objectives/${id}`, updates);
     return data;
   },
+
+  updateObjectives: async (
+    updates: Array<Pick<AssessmentObjective, 'id'> & Partial<AssessmentObjective>>,
+    assessedBy?: string
+  ): Promise<{
+    updated: number;
+    objectives: AssessmentObjective[];
+    controls: Array<Pick<Control, 'id' | 'control_number' | 'implementation_status'>>;
+  }> => {
+    const { data } = await client.put('/controls/objectives', {
+      objectives: updates,
+      assessed_by: assessedBy,
+    });
+    return data;
+  },
 };
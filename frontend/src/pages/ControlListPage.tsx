@@ -42,7 +42,13 @@ export default function ControlListPage() {
   const [search, setSearch] = useState('');
 
   useEffect(() => {
-    Promise.all([controlsApi.getControls(), controlsApi.getFamilies()])
+    Promise.all([
+      controlsApi.getControls({
+        fields:
+          'control_number,title,implementation_status,control_type,weight,family_id,family_code',
+      }),
+      controlsApi.getFamilies(),
+    ])
       .then(([c, f]) => {
         setControls(c);
         setFamilies(f);
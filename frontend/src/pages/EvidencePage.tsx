@@ -42,7 +42,7 @@ export default function EvidencePage() {
     try {
       const [e, c] = await Promise.all([
         evidenceApi.getAll(),
-        controlsApi.getControls(),
+        controlsApi.getControls({ fields: 'control_number,title' }),
       ]);
       setEvidence(e);
       setControls(c);
@@ -55,7 +55,7 @@ export default function POAMPage() {
     try {
       const [p, c] = await Promise.all([
         poamApi.getAll(),
-        controlsApi.getControls(),
+        controlsApi.getControls({ fields: 'control_number,title' }),
       ]);
       setItems(p);
       setControls(c);
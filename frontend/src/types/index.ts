@@ -30,6 +30,9 @@ export interface ControlFamily {
   description: string;
   control_count: number;
   sort_order: number;
+  actual_control_count?: number;
+  status_breakdown?: Record<string, number>;
+  controls?: Control[];
 }
 
 export interface Control {